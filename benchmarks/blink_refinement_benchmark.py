@@ -0,0 +1,160 @@
+"""
+Offline benchmark for Face Mesh landmark refinement in the blink detectors.
+
+refine_landmarks runs Face Mesh's attention model, which refines the eye and lip
+contours and adds the iris landmarks; the eye aspect ratio only reads six eyelid and
+corner points per eye. This runs both blink detectors over recorded clips with and
+without refinement and reports the Face Mesh cost per frame and blink precision/recall
+against labelled blinks.
+
+Each clip needs a label file next to it, <clip>.blinks, listing the frame numbers blinks
+start on (one or more per line, # starts a comment). Without clips the synthetic blinking
+face is used; --write-synthetic records it as a clip with labels to reuse. Frames are fed
+at the clip's frame rate, as a camera would deliver them, because the detectors' blink
+cooldown runs on the wall clock.
+
+Usage: python benchmarks/blink_refinement_benchmark.py [CLIP ...] [--frames N] [--write-synthetic PATH]
+"""
+
+# Standard library imports
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+# Third-party imports
+import cv2  # noqa: E402
+import numpy as np  # noqa: E402
+
+# Local application imports
+from game.cv.blink_detection import BlinkDetector, EnhancedBlinkDetector  # noqa: E402
+from utils.frame_sources import SPEED_MAX, SyntheticFaceSource, VideoFileSource  # noqa: E402
+
+DETECTORS = {"BlinkDetector": BlinkDetector, "EnhancedBlinkDetector": EnhancedBlinkDetector}
+MATCH_WINDOW = (-1, 8)  # Frames around a labelled blink start a detection may fall on to count
+WARMUP_FRAMES = 30  # Frames left out of the timings (graph start-up and face detection)
+
+
+def load_labels(path: str) -> list:
+    """Blink start frames from a label file"""
+    frames = []
+    with open(path) as label_file:
+        for line in label_file:
+            frames.extend(int(value) for value in line.split("#", 1)[0].split())
+    return sorted(frames)
+
+
+def load_clip(path: str, max_frames: int) -> tuple:
+    """Up to max_frames frames of a clip as mirrored RGB (as the blink worker sees them) and its frame rate"""
+    source = VideoFileSource(path, speed=SPEED_MAX, loop=False)
+    frames = []
+    while len(frames) < max_frames:
+        ok, frame = source.read()
+        if not ok:
+            break
+        frames.append(cv2.cvtColor(cv2.flip(frame, 1), cv2.COLOR_BGR2RGB))
+    source.release()
+    return frames, source.fps
+
+
+def synthetic_clip(frame_count: int) -> tuple:
+    """Frames, frame rate and blink labels of the synthetic blinking face"""
+    source = SyntheticFaceSource(speed=SPEED_MAX)
+    frames = [cv2.cvtColor(cv2.flip(source.render_frame(i), 1), cv2.COLOR_BGR2RGB) for i in range(frame_count)]
+    return frames, source.fps, source.blink_start_frames(frame_count)
+
+
+def write_synthetic_clip(path: str, frame_count: int) -> None:
+    """Record the synthetic blinking face as a clip with its label file"""
+    source = SyntheticFaceSource(speed=SPEED_MAX)
+    writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*"mp4v"), source.fps, (source.width, source.height))
+    for index in range(frame_count):
+        writer.write(source.render_frame(index))
+    writer.release()
+    with open(path + ".blinks", "w") as label_file:
+        label_file.write("# Blink start frames of the synthetic face\n")
+        label_file.write("\n".join(str(frame) for frame in source.blink_start_frames(frame_count)) + "\n")
+    print(f"Wrote {frame_count} frames to {path} and labels to {path}.blinks")
+
+
+def match_blinks(detected: list, labels: list) -> int:
+    """Count detections that land on a labelled blink, each label matched at most once"""
+    unmatched = list(labels)
+    hits = 0
+    for frame in detected:
+        for label in unmatched:
+            if label + MATCH_WINDOW[0] <= frame <= label + MATCH_WINDOW[1]:
+                unmatched.remove(label)
+                hits += 1
+                break
+    return hits
+
+
+def run_detector(detector_class, frames: list, fps: float, labels: list, refine_landmarks: bool) -> dict:
+    """Run a fresh detector over a clip at its frame rate, timing every frame and scoring its blinks"""
+    detector = detector_class(refine_landmarks=refine_landmarks)
+    timings, detected = [], []
+    calibrated_from = None
+    clip_start = time.perf_counter()
+    for index, frame in enumerate(frames):
+        due = clip_start + index / fps
+        if due > time.perf_counter():
+            time.sleep(due - time.perf_counter())
+        start = time.perf_counter()
+        blink_detected, _ = detector.process_frame(frame, index, rgb=True)
+        timings.append((time.perf_counter() - start) * 1000)
+        if blink_detected:
+            detected.append(index)
+        if calibrated_from is None and detector.is_calibrated:
+            calibrated_from = index
+
+    # Blinks during calibration cannot be detected: score only the ones after it
+    scored = [label for label in labels if calibrated_from is not None and label > calibrated_from]
+    hits = match_blinks(detected, scored)
+    return {
+        "timings": np.array(timings[WARMUP_FRAMES:]),
+        "detected": len(detected),
+        "labelled": len(scored),
+        "hits": hits,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark Face Mesh landmark refinement for blink detection")
+    parser.add_argument("clips", nargs="*", help="recorded clips, each with a <clip>.blinks label file")
+    parser.add_argument("--frames", type=int, default=900, help="frames to use per clip")
+    parser.add_argument("--write-synthetic", metavar="PATH", help="record the synthetic face to PATH and exit")
+    args = parser.parse_args()
+
+    if args.write_synthetic:
+        write_synthetic_clip(args.write_synthetic, args.frames)
+        return
+
+    clips = []
+    for path in args.clips:
+        if not os.path.exists(path + ".blinks"):
+            print(f"Skipping {path}: no {path}.blinks label file")
+            continue
+        clips.append((os.path.basename(path), *load_clip(path, args.frames), load_labels(path + ".blinks")))
+    if not args.clips:
+        clips.append(("synthetic face", *synthetic_clip(args.frames)))
+
+    for name, frames, fps, labels in clips:
+        print(f"{name}: {len(frames)} frames at {fps:.0f} FPS, {len(labels)} labelled blinks")
+        for detector_name, detector_class in DETECTORS.items():
+            for refine_landmarks in (True, False):
+                run = run_detector(detector_class, frames, fps, labels, refine_landmarks)
+                precision = run["hits"] / run["detected"] if run["detected"] else 0.0
+                recall = run["hits"] / run["labelled"] if run["labelled"] else 0.0
+                print(
+                    f"  {detector_name:<22} refine {'on ' if refine_landmarks else 'off'}  "
+                    f"{run['timings'].mean():6.2f} ms/frame (p90 {np.percentile(run['timings'], 90):6.2f})   "
+                    f"precision {precision:5.1%} ({run['hits']}/{run['detected']})   "
+                    f"recall {recall:5.1%} ({run['hits']}/{run['labelled']})"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,172 @@
+"""
+Benchmark for running Face Mesh on an eye-region crop instead of the full camera frame.
+
+The blink detectors only read twelve eye landmarks, so this checks whether Face Mesh gets
+cheaper when it is handed a padded crop around the eyes once the face has been found.
+Runs Face Mesh over the same frames twice: once on every full frame, and once on the
+crop, going back to the full frame only when the eyes near the crop's edge or the face is
+lost in it. Reports the time per frame, how often the full frame was processed and how
+far the eye aspect ratios moved.
+
+Face Mesh already runs its fixed-size landmark model on the tracked face region in video
+mode, so the crop mostly saves handing the full frame to MediaPipe. On the synthetic face
+it was slower at 640x480 and 1280x720 and only faster at 1920x1080, which is why the
+detectors do not crop.
+
+Usage: python benchmarks/blink_roi_benchmark.py [--frames N] [--resolution WxH] [--source synthetic_face|VIDEO]
+"""
+
+# Standard library imports
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+# Third-party imports
+import cv2  # noqa: E402
+import mediapipe as mp  # noqa: E402
+import numpy as np  # noqa: E402
+
+# Local application imports
+from game.cv.blink_detection.eye_metrics import eye_aspect_ratios, gather_eye_points  # noqa: E402
+from utils.frame_sources import SPEED_MAX, SyntheticFaceSource, create_frame_source  # noqa: E402
+
+# Padding around the bounding box of both eyes, in eye box widths (horizontal, vertical).
+# Face Mesh needs about (0.5, 0.7) to keep finding the face; the rest is room to move
+EYE_ROI_PADDING = (0.75, 1.0)
+# Eyes closer than this to the crop's edge (in eye box widths) send the next frame to the full frame
+EYE_ROI_MARGIN = (0.5, 0.7)
+WARMUP_FRAMES = 30  # Frames left out of the timings (graph start-up and face detection)
+
+
+def create_face_mesh():
+    """Face Mesh as the blink detectors configure it"""
+    return mp.solutions.face_mesh.FaceMesh(
+        max_num_faces=1, refine_landmarks=False, min_detection_confidence=0.7, min_tracking_confidence=0.5
+    )
+
+
+def load_frames(source, count: int) -> list:
+    """Read up to count frames as RGB"""
+    frames = []
+    while len(frames) < count:
+        ok, frame = source.read()
+        if not ok:
+            break
+        frames.append(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
+    return frames
+
+
+def eye_points_of(results, offset=(0.0, 0.0), scale=(1.0, 1.0)):
+    """(12, 2) eye landmarks in normalized full-frame coordinates, or None without a face"""
+    if not results.multi_face_landmarks:
+        return None
+    return gather_eye_points(results.multi_face_landmarks[0]) * scale + offset
+
+
+def cut_region(eye_points: np.ndarray, width: int, height: int) -> tuple:
+    """Padded (x0, y0, x1, y1) pixel region around the eyes"""
+    (x_min, y_min), (x_max, y_max) = eye_points.min(axis=0) * (width, height), eye_points.max(axis=0) * (width, height)
+    eye_width = max(x_max - x_min, 1.0)
+    pad_x, pad_y = EYE_ROI_PADDING[0] * eye_width, EYE_ROI_PADDING[1] * eye_width
+    return (
+        max(int(x_min - pad_x), 0),
+        max(int(y_min - pad_y), 0),
+        min(int(x_max + pad_x) + 1, width),
+        min(int(y_max + pad_y) + 1, height),
+    )
+
+
+def inside_region(eye_points: np.ndarray, roi: tuple, width: int, height: int) -> bool:
+    """The eyes are at least EYE_ROI_MARGIN away from the region's edges"""
+    (x_min, y_min), (x_max, y_max) = eye_points.min(axis=0) * (width, height), eye_points.max(axis=0) * (width, height)
+    eye_width = max(x_max - x_min, 1.0)
+    margin_x, margin_y = EYE_ROI_MARGIN[0] * eye_width, EYE_ROI_MARGIN[1] * eye_width
+    x0, y0, x1, y1 = roi
+    return x_min - margin_x >= x0 and x_max + margin_x <= x1 and y_min - margin_y >= y0 and y_max + margin_y <= y1
+
+
+def run_full_frame(frames: list) -> dict:
+    """Face Mesh on every full frame"""
+    face_mesh = create_face_mesh()
+    timings, ears = [], []
+    for frame in frames:
+        start = time.perf_counter()
+        eye_points = eye_points_of(face_mesh.process(frame))
+        timings.append((time.perf_counter() - start) * 1000)
+        ears.append(eye_aspect_ratios(eye_points) if eye_points is not None else (np.nan, np.nan))
+    face_mesh.close()
+    return {"timings": np.array(timings[WARMUP_FRAMES:]), "ears": np.array(ears), "full_frame_runs": len(frames)}
+
+
+def run_eye_region(frames: list) -> dict:
+    """Face Mesh on a crop around the eyes once the face is found on the full frame"""
+    full_face_mesh, crop_face_mesh = create_face_mesh(), create_face_mesh()
+    timings, ears = [], []
+    roi, full_frame_runs = None, 0
+    for frame in frames:
+        height, width = frame.shape[:2]
+        start = time.perf_counter()
+        eye_points = None
+        if roi is not None:
+            x0, y0, x1, y1 = roi
+            results = crop_face_mesh.process(np.ascontiguousarray(frame[y0:y1, x0:x1]))
+            eye_points = eye_points_of(results, (x0 / width, y0 / height), ((x1 - x0) / width, (y1 - y0) / height))
+        if eye_points is None:
+            full_frame_runs += 1
+            eye_points = eye_points_of(full_face_mesh.process(frame))
+            roi = cut_region(eye_points, width, height) if eye_points is not None else None
+        elif not inside_region(eye_points, roi, width, height):
+            roi = None
+        timings.append((time.perf_counter() - start) * 1000)
+        ears.append(eye_aspect_ratios(eye_points) if eye_points is not None else (np.nan, np.nan))
+    full_face_mesh.close()
+    crop_face_mesh.close()
+    return {"timings": np.array(timings[WARMUP_FRAMES:]), "ears": np.array(ears), "full_frame_runs": full_frame_runs}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark Face Mesh on an eye-region crop")
+    parser.add_argument("--frames", type=int, default=600, help="frames to run per mode")
+    parser.add_argument("--resolution", default="640x480", help="frame size for the synthetic face, WxH")
+    parser.add_argument("--source", default="synthetic_face", help="'synthetic_face' or a video file path")
+    parser.add_argument("--repeats", type=int, default=3, help="runs per mode (the fastest is reported)")
+    args = parser.parse_args()
+
+    source = create_frame_source(source=args.source, speed=SPEED_MAX)
+    if isinstance(source, SyntheticFaceSource):
+        width, height = (int(value) for value in args.resolution.lower().split("x"))
+        source.set(cv2.CAP_PROP_FRAME_WIDTH, width)
+        source.set(cv2.CAP_PROP_FRAME_HEIGHT, height)
+    frames = load_frames(source, args.frames)
+    source.release()
+    if not frames:
+        print(f"No frames from {args.source}")
+        return
+    height, width = frames[0].shape[:2]
+    print(f"{source.describe()}: {len(frames)} frames of {width}x{height}")
+
+    results = {}
+    for _ in range(args.repeats):
+        for name, run_mode in (("full frame", run_full_frame), ("eye region", run_eye_region)):
+            run = run_mode(frames)
+            if name not in results or run["timings"].mean() < results[name]["timings"].mean():
+                results[name] = run
+
+    for name, run in results.items():
+        timings = run["timings"]
+        print(
+            f"  {name:<11} {timings.mean():6.2f} ms/frame (p90 {np.percentile(timings, 90):6.2f})   "
+            f"full-frame passes {run['full_frame_runs']:4d}"
+        )
+
+    full, roi = results["full frame"], results["eye region"]
+    print(f"  saved {full['timings'].mean() - roi['timings'].mean():6.2f} ms/frame")
+    ear_difference = np.abs(roi["ears"] - full["ears"])
+    print(f"  EAR difference: mean {np.nanmean(ear_difference):.4f}, max {np.nanmax(ear_difference):.4f}")
+
+
+if __name__ == "__main__":
+    main()
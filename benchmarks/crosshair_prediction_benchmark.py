@@ -0,0 +1,107 @@
+"""
+Simulation of latency-compensated crosshair prediction.
+
+A fingertip sweeps across the screen, pausing now and then, and is sampled by a 30 FPS
+camera. Each sample is smoothed by the landmark Kalman filter and becomes available to
+the game after the pipeline latency; the game renders at 60 FPS. The displayed crosshair
+is compared with where the fingertip really is at each display flip, for the previous
+behaviour (the newest sample, stepping at camera rate) and for CrosshairPredictor fed
+with the filter's velocity state.
+Reports aim error overall and while the hand is paused (overshoot), plus jerkiness as
+the RMS second difference of the crosshair between render frames.
+
+Usage: python benchmarks/crosshair_prediction_benchmark.py [--latency-ms MS] [--seconds S]
+"""
+
+# Standard library imports
+import argparse
+import math
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+# Third-party imports
+import numpy as np  # noqa: E402
+
+# Local application imports
+from game.cv.finger_gun_detection import BatchedLandmarkKalmanFilter  # noqa: E402
+from utils.constants import CROSSHAIR_LOOKAHEAD_MS, FPS, SCREEN_HEIGHT, SCREEN_WIDTH  # noqa: E402
+from utils.crosshair_predictor import CrosshairPredictor  # noqa: E402
+
+CAMERA_FPS = 30
+NOISE_PX = 1.5  # Landmark jitter in screen pixels
+
+
+def fingertip(t: float):
+    """True fingertip screen position: sweeps that pause for 0.5 s every 2 s"""
+    phase = t % 2.0
+    sweep_time = (t // 2.0) * 1.5 + min(phase, 1.5)
+    x = SCREEN_WIDTH * (0.5 + 0.35 * math.sin(1.3 * sweep_time))
+    y = SCREEN_HEIGHT * (0.5 + 0.3 * math.sin(0.9 * sweep_time + 1.0))
+    return x, y, phase >= 1.5
+
+
+def summarize(name: str, errors, paused, positions) -> None:
+    errors = np.asarray(errors)
+    paused = np.asarray(paused)
+    jerk = np.linalg.norm(np.diff(np.asarray(positions), n=2, axis=0), axis=1)
+    print(
+        f"  {name:<10} error rms {np.sqrt(np.mean(errors**2)):6.1f}px  p95 {np.percentile(errors, 95):6.1f}px   "
+        f"paused p95 {np.percentile(errors[paused], 95):5.1f}px   jerk rms {np.sqrt(np.mean(jerk**2)):5.1f}px"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulate latency-compensated crosshair prediction")
+    parser.add_argument("--latency-ms", type=float, default=60.0, help="capture to landmarks-available latency")
+    parser.add_argument("--seconds", type=float, default=60.0, help="simulated play time")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    latency = args.latency_ms / 1000.0
+    lookahead = CROSSHAIR_LOOKAHEAD_MS / 1000.0
+
+    # Camera samples, smoothed as in the game (normalized coordinates, capture timestamps)
+    kalman = BatchedLandmarkKalmanFilter(1)
+    samples = []  # (available_at, capture_time, position, velocity), screen pixels
+    scale = np.array([SCREEN_WIDTH, SCREEN_HEIGHT])
+    for frame in range(int(args.seconds * CAMERA_FPS)):
+        capture_time = frame / CAMERA_FPS
+        x, y, _ = fingertip(capture_time)
+        measurement = (np.array([[x, y]]) + rng.normal(0, NOISE_PX, (1, 2))) / scale
+        smoothed = kalman.update(np.hstack([measurement, [[0.0]]]), 0.8, capture_time)
+        samples.append((capture_time + latency, capture_time, smoothed[0, :2] * scale, kalman.velocity[0, :2] * scale))
+
+    predictor = CrosshairPredictor()
+    results = {"newest": ([], [], []), "predicted": ([], [], [])}
+    next_sample = 0
+    newest = None
+    for render_frame in range(int(args.seconds * FPS)):
+        now = render_frame / FPS
+        while next_sample < len(samples) and samples[next_sample][0] <= now:
+            _, capture_time, position, velocity = samples[next_sample]
+            newest = position
+            predictor.add_sample(tuple(position), capture_time, tuple(velocity))
+            next_sample += 1
+        if newest is None:
+            continue
+
+        true_x, true_y, paused = fingertip(now + lookahead)
+        for name, position in (("newest", newest), ("predicted", predictor.predict(now=now))):
+            errors, paused_flags, positions = results[name]
+            errors.append(math.hypot(position[0] - true_x, position[1] - true_y))
+            paused_flags.append(paused)
+            positions.append(position)
+
+    print(
+        f"{args.seconds:.0f}s at {FPS} FPS render, {CAMERA_FPS} FPS camera, {args.latency_ms:.0f}ms pipeline latency, "
+        f"{CROSSHAIR_LOOKAHEAD_MS:.0f}ms lookahead"
+    )
+    for name, (errors, paused, positions) in results.items():
+        summarize(name, errors, paused, positions)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
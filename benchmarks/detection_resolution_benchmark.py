@@ -0,0 +1,118 @@
+"""
+Benchmark hand detection at reduced resolutions.
+
+Runs the same frames through EnhancedHandTracker at several detection widths and reports
+preprocessing, detection and total time, the preprocessing tier the time budget allowed,
+how often a hand was found, and crosshair jitter. Landmarks are normalized, so the index
+fingertip is always mapped back to camera pixels the way the game does; jitter is the RMS
+of its second difference (frame-to-frame change in velocity) over consecutive frames with
+a hand. The synthetic source is not a realistic hand for MediaPipe, so meaningful jitter
+numbers need a video with a real hand in it.
+
+Usage: python benchmarks/detection_resolution_benchmark.py [--source synthetic|<video>] [--frames N]
+"""
+
+# Standard library imports
+import argparse
+import collections
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+# Third-party imports
+import numpy as np  # noqa: E402
+
+# Local application imports
+from game.cv.finger_gun_detection import EnhancedHandTracker  # noqa: E402
+from utils.camera_manager import CameraManager  # noqa: E402
+from utils.frame_sources import SPEED_MAX  # noqa: E402
+
+DETECTION_WIDTHS = (None, 480, 320)  # None: camera resolution
+INDEX_TIP = 8
+
+
+def percentile_summary(values) -> str:
+    """Format mean and p50/p95 of a list of milliseconds"""
+    values = np.asarray(values)
+    p50, p95 = np.percentile(values, [50, 95])
+    return f"mean {values.mean():6.2f}  p50 {p50:6.2f}  p95 {p95:6.2f} ms"
+
+
+def crosshair_jitter(track) -> float:
+    """RMS second difference in pixels of a fingertip track (None entries break the track)"""
+    squared = []
+    for i in range(2, len(track)):
+        if track[i] is None or track[i - 1] is None or track[i - 2] is None:
+            continue
+        acceleration = np.subtract(track[i], 2 * np.asarray(track[i - 1])) + track[i - 2]
+        squared.append(float(np.dot(acceleration, acceleration)))
+    return float(np.sqrt(np.mean(squared))) if squared else float("nan")
+
+
+def run(source: str, frame_count: int, detection_width):
+    """Process frame_count frames at one detection width; returns None if the source fails"""
+    camera_manager = CameraManager(threaded_capture=False, source=source, source_speed=SPEED_MAX)
+    if not camera_manager.initialize_camera(0):
+        return None
+    width, height = camera_manager.frame_width, camera_manager.frame_height
+    tracker = EnhancedHandTracker(detection_width=detection_width, skip_frames=False, model_complexity=1)
+
+    for _ in range(5):  # Warm up the MediaPipe graph
+        ret, frame = camera_manager.read_rgb_frame()
+        tracker.process_frame(frame)
+
+    totals, preprocessing, detection, track = [], [], [], []
+    tiers = collections.Counter()
+    for _ in range(frame_count):
+        ret, frame = camera_manager.read_rgb_frame()
+        if not ret:
+            break
+        _, results, stats = tracker.process_frame(frame)
+        totals.append(stats["total_ms"])
+        preprocessing.append(stats["preprocessing_ms"])
+        detection.append(stats["detection_ms"])
+        tiers[stats["preprocess_tier"]] += 1
+        if results.multi_hand_landmarks:
+            tip = results.multi_hand_landmarks[0].landmark[INDEX_TIP]
+            track.append((tip.x * width, tip.y * height))
+        else:
+            track.append(None)
+
+    tracker.hands.close()
+    camera_manager.release()
+    return {
+        "camera": (width, height),
+        "preprocessing": preprocessing,
+        "detection": detection,
+        "total": totals,
+        "tier": tiers.most_common(1)[0][0] if tiers else "none",
+        "hands": sum(point is not None for point in track),
+        "jitter": crosshair_jitter(track),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark hand detection at reduced resolutions")
+    parser.add_argument("--source", default="synthetic", help="'synthetic' or a video file path")
+    parser.add_argument("--frames", type=int, default=300, help="frames to process per width")
+    args = parser.parse_args()
+
+    for detection_width in DETECTION_WIDTHS:
+        stats = run(args.source, args.frames, detection_width)
+        if stats is None:
+            print(f"Could not open frame source '{args.source}'")
+            return 1
+        camera_width, camera_height = stats["camera"]
+        width = detection_width or camera_width
+        print(f"Detection at {width}x{round(camera_height * width / camera_width)} ({camera_width}x{camera_height} camera)")
+        print(f"  preprocessing  {percentile_summary(stats['preprocessing'])}   (mostly {stats['tier']} tier)")
+        print(f"  detection      {percentile_summary(stats['detection'])}")
+        print(f"  total          {percentile_summary(stats['total'])}")
+        print(f"  hand found in {stats['hands']}/{len(stats['total'])} frames, crosshair jitter {stats['jitter']:.2f} px RMS")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
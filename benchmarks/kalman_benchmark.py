@@ -0,0 +1,130 @@
+"""
+Micro-benchmark for landmark Kalman filtering.
+
+Compares the per-frame cost of one cv2.KalmanFilter per landmark (the 14 key landmarks
+the tracker used to filter, and all 21) against BatchedLandmarkKalmanFilter, which
+predicts and corrects every landmark at once, and checks that both give the same
+positions. A second run times HandKalmanTracker.adaptive_update end to end, including the
+conversion to and from MediaPipe landmark lists. Finally, a hand moving at constant speed
+is sampled at several frame rates, and with frames dropped at random, to compare the
+dropout prediction error of a fixed 30 FPS time step against capture timestamps.
+
+Usage: python benchmarks/kalman_benchmark.py [--frames N]
+"""
+
+# Standard library imports
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+# Third-party imports
+import numpy as np  # noqa: E402
+
+# Local application imports
+from game.cv.finger_gun_detection import (  # noqa: E402
+    BatchedLandmarkKalmanFilter,
+    HandKalmanTracker,
+    LandmarkKalmanFilter,
+    array_to_landmarks,
+)
+from game.cv.finger_gun_detection.landmark_arrays import NUM_HAND_LANDMARKS  # noqa: E402
+
+LOST_EVERY = 20  # Every LOST_EVERY frames the hand drops out for two frames
+HAND_SPEED = 0.5  # Normalized units per second for the motion model comparison
+
+
+def landmark_track(frame_count: int) -> np.ndarray:
+    """(frames, 21, 3) random-walk landmark positions"""
+    rng = np.random.default_rng(0)
+    start = rng.uniform(0.2, 0.8, (1, NUM_HAND_LANDMARKS, 3))
+    return start + np.cumsum(rng.normal(0, 0.005, (frame_count, NUM_HAND_LANDMARKS, 3)), axis=0)
+
+
+def hand_lost(frame: int) -> bool:
+    return frame % LOST_EVERY in (LOST_EVERY - 3, LOST_EVERY - 2)
+
+
+def run_per_landmark(track: np.ndarray, count: int):
+    """Filter the first count landmarks with one LandmarkKalmanFilter each"""
+    filters = [LandmarkKalmanFilter() for _ in range(count)]
+    outputs = np.zeros((len(track), count, 3))
+    start = time.perf_counter()
+    for frame, measurements in enumerate(track):
+        for i, landmark_filter in enumerate(filters):
+            if hand_lost(frame):
+                outputs[frame, i] = landmark_filter.predict_only()
+            else:
+                outputs[frame, i] = landmark_filter.update(measurements[i], 0.8)
+    return (time.perf_counter() - start) * 1000 / len(track), outputs
+
+
+def run_batched(track: np.ndarray, count: int):
+    """Filter the first count landmarks with a single BatchedLandmarkKalmanFilter"""
+    batched_filter = BatchedLandmarkKalmanFilter(count)
+    outputs = np.zeros((len(track), count, 3))
+    start = time.perf_counter()
+    for frame, measurements in enumerate(track):
+        if hand_lost(frame):
+            outputs[frame] = batched_filter.predict_only()
+        else:
+            outputs[frame] = batched_filter.update(measurements[:count], 0.8)
+    return (time.perf_counter() - start) * 1000 / len(track), outputs
+
+
+def dropout_error(timestamps: np.ndarray, use_timestamps: bool) -> float:
+    """Mean position error of predictions while the hand is lost, after the filter settles"""
+    rng = np.random.default_rng(1)
+    batched_filter = BatchedLandmarkKalmanFilter(1)
+    errors = []
+    for frame, timestamp in enumerate(timestamps.tolist()):
+        filter_timestamp = timestamp if use_timestamps else None
+        if hand_lost(frame):
+            predicted = batched_filter.predict_only(filter_timestamp)
+            if frame > len(timestamps) // 2:
+                errors.append(abs(predicted[0, 0] - HAND_SPEED * timestamp))
+        else:
+            measurement = np.array([[HAND_SPEED * timestamp, 0.5, 0.0]]) + rng.normal(0, 0.002, (1, 3))
+            batched_filter.update(measurement, 1.0, filter_timestamp)
+    return float(np.mean(errors))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark per-landmark vs batched Kalman filtering")
+    parser.add_argument("--frames", type=int, default=3000, help="frames to filter per variant")
+    args = parser.parse_args()
+
+    track = landmark_track(args.frames)
+    batched_ms, batched_outputs = run_batched(track, NUM_HAND_LANDMARKS)
+    print(f"{args.frames} frames, hand lost 2 of every {LOST_EVERY}")
+    for count in (14, NUM_HAND_LANDMARKS):
+        per_landmark_ms, outputs = run_per_landmark(track, count)
+        difference = np.abs(outputs - batched_outputs[:, :count]).max()
+        print(f"  per-landmark cv2, {count} landmarks  {per_landmark_ms:7.4f} ms/frame   (max difference {difference:.1e})")
+    print(f"  batched numpy, {NUM_HAND_LANDMARKS} landmarks     {batched_ms:7.4f} ms/frame")
+
+    tracker = HandKalmanTracker()
+    hands = [array_to_landmarks(measurements) for measurements in track]
+    start = time.perf_counter()
+    for frame, hand_landmarks in enumerate(hands):
+        tracker.adaptive_update(None if hand_lost(frame) else hand_landmarks, 0.8)
+    tracker_ms = (time.perf_counter() - start) * 1000 / len(hands)
+    print(f"  HandKalmanTracker.adaptive_update {tracker_ms:7.4f} ms/frame   (including landmark list conversion)")
+
+    print("Dropout prediction error (normalized units), fixed 30 FPS step vs capture timestamps:")
+    rng = np.random.default_rng(2)
+    kept_frames = np.sort(rng.choice(np.arange(1200), 600, replace=False))
+    for name, timestamps in (
+        ("15 FPS", np.arange(600) / 15),
+        ("30 FPS", np.arange(600) / 30),
+        ("60 FPS", np.arange(600) / 60),
+        ("30 FPS, half dropped", kept_frames / 30),
+    ):
+        print(f"  {name:<21} fixed {dropout_error(timestamps, False):.4f}   timestamps {dropout_error(timestamps, True):.4f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
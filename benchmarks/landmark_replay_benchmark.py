@@ -0,0 +1,108 @@
+"""
+Benchmark landmark recording and replay.
+
+Replays a landmark recording (made with F10 in debug mode, or ARCVDE_RECORD_LANDMARKS)
+through the finger gun and shooting gesture logic without MediaPipe, and compares the
+replayed shots with the recorded ones. Without a recording, a synthetic hand track is
+recorded first so the encoder round trip and the replay speed can still be measured.
+
+Usage: python benchmarks/landmark_replay_benchmark.py [recording.lmk] [--frames N]
+"""
+
+# Standard library imports
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+# Third-party imports
+import numpy as np  # noqa: E402
+
+# Local application imports
+from game.cv.finger_gun_detection import (  # noqa: E402
+    EnhancedHandTracker,
+    LandmarkRecorder,
+    LandmarkRecording,
+    array_to_landmarks,
+    replay_gestures,
+)
+
+
+def record_synthetic(path: str, frames: int) -> np.ndarray:
+    """Record a hand drifting across the frame with a flicking thumb; returns the landmarks
+
+    Shots are detected live on the unquantized landmarks, so the replay comparison shows
+    whether quantization changes any gesture decision.
+    """
+    tracker = EnhancedHandTracker(load_model=False)
+    rng = np.random.default_rng(0)
+    base = rng.uniform(0.3, 0.7, (21, 3)).astype(np.float32)
+    base[:, 2] = rng.uniform(-0.1, 0.0, 21)
+    track = np.empty((frames, 21, 3), dtype=np.float32)
+
+    recorder = LandmarkRecorder(path, 640, 480)
+    for i in range(frames):
+        t = i / 30.0
+        landmarks = base + np.array([0.15 * np.sin(t), 0.1 * np.sin(1.3 * t), 0.0], dtype=np.float32)
+        landmarks[4, 1] += 0.05 * max(0.0, np.sin(4.0 * t))  # Thumb tip flick
+        landmarks += rng.normal(0, 0.002, landmarks.shape).astype(np.float32)
+        hand_visible = (i // 90) % 5 != 4  # Hand leaves the frame now and then
+        track[i] = landmarks if hand_visible else 0
+        if not hand_visible:
+            tracker.reset_tracking_state()
+            recorder.record(t, None, "none")
+            continue
+
+        hand_landmarks = array_to_landmarks(landmarks)
+        is_gun, index_coords, thumb_tip, _, thumb_middle_dist, _ = tracker.detect_finger_gun(hand_landmarks, 640, 480)
+        shot = bool(is_gun and index_coords) and tracker.detect_shooting_gesture(thumb_tip, thumb_middle_dist, now=t)
+        recorder.record(t, hand_landmarks, tracker.detection_mode, shot)
+    recorder.close()
+    return track
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark landmark recording replay")
+    parser.add_argument("recording", nargs="?", help="landmark recording to replay (default: synthetic)")
+    parser.add_argument("--frames", type=int, default=3000, help="frames to synthesize without a recording")
+    args = parser.parse_args()
+
+    expected = None
+    path = args.recording
+    if path is None:
+        path = os.path.join(tempfile.mkdtemp(), "synthetic.lmk")
+        start = time.perf_counter()
+        expected = record_synthetic(path, args.frames)
+        print(f"Recorded {args.frames} synthetic frames in {(time.perf_counter() - start) * 1000:.1f} ms")
+
+    recording = LandmarkRecording(path)
+    size = os.path.getsize(path)
+    print(f"Recording: {len(recording)} frames, {size / 1024:.1f} KiB ({size / max(len(recording), 1):.0f} bytes/frame)")
+
+    start = time.perf_counter()
+    landmarks = recording.decode_landmarks()
+    decode_ms = (time.perf_counter() - start) * 1000
+    print(f"Decode: {decode_ms:.2f} ms ({len(recording) / max(decode_ms, 1e-6):.0f} frames/ms)")
+    if expected is not None:
+        error = np.abs(landmarks - expected).max()
+        print(f"Round trip: max landmark error {error:.6f} (normalized units)")
+
+    tracker = EnhancedHandTracker(load_model=False)
+    start = time.perf_counter()
+    results = list(replay_gestures(recording, tracker))
+    replay_s = time.perf_counter() - start
+
+    replayed_shots = sum(result.shot for result in results)
+    recorded_shots = sum(result.recorded_shot for result in results)
+    mismatches = sum(result.shot != result.recorded_shot for result in results)
+    guns = sum(result.is_gun for result in results)
+    print(f"Replay: {len(results) / replay_s:.0f} frames/s, finger gun on {guns} frames")
+    print(f"Shots: {replayed_shots} replayed, {recorded_shots} recorded, {mismatches} frames differ")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,95 @@
+"""
+Micro-benchmark for the camera preview path.
+
+Compares the previous per-frame conversion (resize, cvtColor, swapaxes, make_surface)
+against PreviewRenderer, which writes into preallocated buffers and a persistent surface.
+Reports time per frame (including the blit to the display) and the peak memory allocated
+while rendering, as seen by tracemalloc (numpy buffer allocations are traced).
+
+Usage: python benchmarks/preview_benchmark.py [--frames N]
+"""
+
+# Standard library imports
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+# Third-party imports
+import cv2  # noqa: E402
+import numpy as np  # noqa: E402
+import pygame  # noqa: E402
+
+# Local application imports
+from utils.constants import CAMERA_HEIGHT, CAMERA_WIDTH  # noqa: E402
+from utils.preview_renderer import PreviewRenderer  # noqa: E402
+
+PREVIEW_SIZE = (CAMERA_WIDTH, CAMERA_HEIGHT)
+
+
+def legacy_frame_to_surface(frame: np.ndarray, size) -> pygame.Surface:
+    """The conversion CameraManager.frame_to_pygame_surface used to do every frame"""
+    resized_frame = cv2.resize(frame, size)
+    rgb_frame = cv2.cvtColor(resized_frame, cv2.COLOR_BGR2RGB)
+    return pygame.surfarray.make_surface(rgb_frame.swapaxes(0, 1))
+
+
+def measure(name: str, render, frames: list, iterations: int, screen: pygame.Surface) -> None:
+    """Time a render-and-blit function and measure what it allocates per frame"""
+
+    def draw(frame):
+        screen.blit(render(frame), (0, 0))
+
+    for frame in frames[:10]:  # Warm up caches and lazily created buffers
+        draw(frame)
+
+    start = time.perf_counter()
+    for i in range(iterations):
+        draw(frames[i % len(frames)])
+    elapsed_ms = (time.perf_counter() - start) * 1000 / iterations
+
+    allocation_frames = 200
+    tracemalloc.start()
+    for i in range(allocation_frames):
+        draw(frames[i % len(frames)])
+    snapshot = tracemalloc.take_snapshot()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    total_allocated = sum(stat.size for stat in snapshot.statistics("filename"))
+
+    print(
+        f"{name:<16} {elapsed_ms:7.3f} ms/frame   peak per-frame allocation {peak / 1024:7.1f} KiB   "
+        f"retained after {allocation_frames} frames {total_allocated / 1024:6.1f} KiB"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the camera preview conversion")
+    parser.add_argument("--frames", type=int, default=2000, help="frames to time per variant")
+    args = parser.parse_args()
+
+    pygame.init()
+    screen = pygame.display.set_mode((640, 480))
+
+    rng = np.random.default_rng(0)
+    frames = [rng.integers(0, 256, (480, 640, 3), dtype=np.uint8) for _ in range(8)]
+    renderer = PreviewRenderer(PREVIEW_SIZE)
+
+    # Both paths must produce identical pixels
+    expected = pygame.surfarray.array3d(legacy_frame_to_surface(frames[0], PREVIEW_SIZE))
+    actual = pygame.surfarray.array3d(renderer.render(frames[0]))
+    assert np.array_equal(expected, actual), "PreviewRenderer output differs from the legacy conversion"
+
+    print(f"640x480 -> {PREVIEW_SIZE[0]}x{PREVIEW_SIZE[1]} preview, {args.frames} frames")
+    measure("legacy", lambda frame: legacy_frame_to_surface(frame, PREVIEW_SIZE), frames, args.frames, screen)
+    measure("PreviewRenderer", renderer.render, frames, args.frames, screen)
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
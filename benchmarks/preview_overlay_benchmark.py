@@ -0,0 +1,119 @@
+"""
+Micro-benchmark for drawing hand tracking overlays on the camera preview.
+
+Compares the previous path against the current one, per camera frame with one tracked
+finger gun. The previous path mirrored a full-resolution copy of the frame, drew the
+MediaPipe landmarks, the fingertip marker and the SHOOT! label on it, then downscaled it
+into the preview. The current path downscales and mirrors into the preview buffer first
+and draws the overlays there from a landmark array. Also reports what each path costs on
+screens where the preview is hidden (the previous path drew the overlays regardless).
+
+Usage: python benchmarks/preview_overlay_benchmark.py [--frames N] [--resolution WxH]
+"""
+
+# Standard library imports
+import argparse
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+# Third-party imports
+import cv2  # noqa: E402
+import mediapipe as mp  # noqa: E402
+import numpy as np  # noqa: E402
+import pygame  # noqa: E402
+
+# Local application imports
+from game.cv.finger_gun_detection import array_to_landmarks  # noqa: E402
+from game.cv.finger_gun_detection.enhanced_hand_tracker import LANDMARK_DRAWING_SPEC  # noqa: E402
+from game.cv.preview_overlay import draw_hand, draw_shoot_label  # noqa: E402
+from utils.constants import CAMERA_HEIGHT, CAMERA_WIDTH  # noqa: E402
+from utils.preview_renderer import PreviewRenderer  # noqa: E402
+
+PREVIEW_SIZE = (CAMERA_WIDTH, CAMERA_HEIGHT)
+mp_drawing = mp.solutions.drawing_utils
+mp_hands = mp.solutions.hands
+
+
+def synthetic_hand(rng: np.random.Generator) -> np.ndarray:
+    """(21, 3) normalized landmarks spread over a hand-sized box"""
+    landmarks = np.empty((21, 3), dtype=np.float32)
+    landmarks[:, :2] = rng.uniform(0.35, 0.65, (21, 2))
+    landmarks[:, 2] = rng.uniform(-0.1, 0.0, 21)
+    return landmarks
+
+
+def legacy_overlay(frame: np.ndarray, hand_landmarks, index_coords) -> np.ndarray:
+    """Overlays as VisionService and BaseScreen used to draw them, on a full-resolution mirrored copy"""
+    image = cv2.flip(frame, 1)
+    mp_drawing.draw_landmarks(image, hand_landmarks, mp_hands.HAND_CONNECTIONS, landmark_drawing_spec=LANDMARK_DRAWING_SPEC)
+    cv2.circle(image, index_coords, 15, (0, 255, 0), -1)
+    cv2.putText(image, "SHOOT!", (10, 30), cv2.FONT_HERSHEY_SIMPLEX, 1, (255, 0, 0), 2)
+    return image
+
+
+def time_per_frame(draw, frames: list, iterations: int) -> float:
+    """Average ms per call of draw(frame)"""
+    for frame in frames[:10]:
+        draw(frame)
+    start = time.perf_counter()
+    for i in range(iterations):
+        draw(frames[i % len(frames)])
+    return (time.perf_counter() - start) * 1000 / iterations
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark drawing tracking overlays on the camera preview")
+    parser.add_argument("--frames", type=int, default=2000, help="frames to time per variant")
+    parser.add_argument("--resolution", default="640x480", help="camera frame size, WxH")
+    args = parser.parse_args()
+    frame_width, frame_height = (int(value) for value in args.resolution.lower().split("x"))
+
+    pygame.init()
+    screen = pygame.display.set_mode(PREVIEW_SIZE)
+
+    rng = np.random.default_rng(0)
+    frames = [rng.integers(0, 256, (frame_height, frame_width, 3), dtype=np.uint8) for _ in range(8)]
+    for frame in frames:
+        frame.flags.writeable = False  # Camera frames are shared and read-only
+    landmarks = synthetic_hand(rng)
+    hand_landmarks = array_to_landmarks(landmarks)
+    index_coords = (int(landmarks[8, 0] * frame_width), int(landmarks[8, 1] * frame_height))
+    scale = PREVIEW_SIZE[0] / frame_width
+    renderer = PreviewRenderer(PREVIEW_SIZE)
+
+    def overlay(image):
+        draw_hand(image, landmarks, True, scale)
+        draw_shoot_label(image, scale)
+
+    def legacy_shown(frame):
+        screen.blit(renderer.render(legacy_overlay(frame, hand_landmarks, index_coords), rgb=True), (0, 0))
+
+    def current_shown(frame):
+        screen.blit(renderer.render(frame, rgb=True, mirror=True, overlay=overlay), (0, 0))
+
+    def legacy_hidden(frame):
+        legacy_overlay(frame, hand_landmarks, index_coords)
+
+    print(f"{frame_width}x{frame_height} camera -> {PREVIEW_SIZE[0]}x{PREVIEW_SIZE[1]} preview, {args.frames} frames")
+    results = {
+        "preview shown": (
+            time_per_frame(legacy_shown, frames, args.frames),
+            time_per_frame(current_shown, frames, args.frames),
+        ),
+        "preview hidden": (time_per_frame(legacy_hidden, frames, args.frames), 0.0),
+    }
+    for name, (legacy_ms, current_ms) in results.items():
+        print(
+            f"  {name:<15} previous {legacy_ms:6.3f} ms/frame   current {current_ms:6.3f} ms/frame   "
+            f"saved {legacy_ms - current_ms:6.3f} ms/frame"
+        )
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
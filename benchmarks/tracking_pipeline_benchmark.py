@@ -0,0 +1,78 @@
+"""
+Benchmark the hand tracking pipeline on a recorded or synthetic frame source.
+
+Runs frames through CameraManager and EnhancedHandTracker exactly as the game does, but
+without a webcam: frames come from a video file or the synthetic source, read
+synchronously at maximum speed so every run processes the same frames.
+
+Usage: python benchmarks/tracking_pipeline_benchmark.py [--source synthetic|<video>] [--frames N]
+"""
+
+# Standard library imports
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+# Third-party imports
+import numpy as np  # noqa: E402
+
+# Local application imports
+from game.cv.finger_gun_detection import EnhancedHandTracker  # noqa: E402
+from utils.camera_manager import CameraManager  # noqa: E402
+from utils.frame_sources import SPEED_MAX  # noqa: E402
+
+
+def percentile_summary(values) -> str:
+    """Format mean and p50/p95/p99 of a list of milliseconds"""
+    values = np.asarray(values)
+    p50, p95, p99 = np.percentile(values, [50, 95, 99])
+    return f"mean {values.mean():6.2f}  p50 {p50:6.2f}  p95 {p95:6.2f}  p99 {p99:6.2f} ms"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark hand tracking on a non-camera frame source")
+    parser.add_argument("--source", default="synthetic", help="'synthetic' or a video file path")
+    parser.add_argument("--frames", type=int, default=300, help="frames to process")
+    args = parser.parse_args()
+
+    camera_manager = CameraManager(threaded_capture=False, source=args.source, source_speed=SPEED_MAX)
+    if not camera_manager.initialize_camera(0):
+        print(f"Could not open frame source '{args.source}'")
+        return 1
+    print(f"Source: {camera_manager.get_camera_info()['source']}, {camera_manager.frame_width}x{camera_manager.frame_height}")
+
+    tracker = EnhancedHandTracker(skip_frames=False)  # Time inference on every frame
+    totals, preprocessing, detection = [], [], []
+    hands_found = 0
+
+    for _ in range(5):  # Warm up the MediaPipe graph
+        ret, frame = camera_manager.read_rgb_frame()
+        tracker.process_frame(frame)
+
+    start = time.perf_counter()
+    for _ in range(args.frames):
+        ret, frame = camera_manager.read_rgb_frame()
+        if not ret:
+            break
+        _, results, stats = tracker.process_frame(frame)
+        totals.append(stats["total_ms"])
+        preprocessing.append(stats["preprocessing_ms"])
+        detection.append(stats["detection_ms"])
+        hands_found += bool(results.multi_hand_landmarks)
+    elapsed = time.perf_counter() - start
+
+    print(f"Processed {len(totals)} frames in {elapsed:.2f}s ({len(totals) / elapsed:.1f} fps), hand found in {hands_found}")
+    print(f"  preprocessing  {percentile_summary(preprocessing)}")
+    print(f"  detection      {percentile_summary(detection)}")
+    print(f"  total          {percentile_summary(totals)}")
+
+    tracker.hands.close()
+    camera_manager.release()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -5,10 +5,20 @@ Available detectors:
 - BlinkDetector: Basic blink detection with adaptive thresholds
 - EnhancedBlinkDetector: Advanced detection with relative detection and preprocessing
 - FramePreprocessor: Image preprocessing for challenging lighting conditions
+- BlinkDetectionWorker: Runs a detector on a background thread as camera frames arrive
+- DetectorSnapshot: Detector state the worker publishes after each frame, for the render thread
 """
 
 from .blink_detector import BlinkDetector
+from .blink_worker import BlinkDetectionWorker, BlinkEvent, DetectorSnapshot
 from .enhanced_blink_detector import EnhancedBlinkDetector
 from .frame_preprocessor import FramePreprocessor
 
-__all__ = ["BlinkDetector", "EnhancedBlinkDetector", "FramePreprocessor"]
+__all__ = [
+    "BlinkDetectionWorker",
+    "BlinkDetector",
+    "BlinkEvent",
+    "DetectorSnapshot",
+    "EnhancedBlinkDetector",
+    "FramePreprocessor",
+]
@@ -4,16 +4,27 @@ Optimized for gameplay with glasses support and personal calibration.
 """
 
 # Standard library imports
-import math
 import time
 from collections import deque
-from typing import List, Optional, Tuple
+from typing import Optional, Sequence, Tuple
 
 # Third-party imports
 import cv2
 import mediapipe as mp
 import numpy as np
 
+# Local imports
+from .eye_metrics import (
+    DEFAULT_OPEN_EAR,
+    EYE_KEY,
+    LEFT_EYE_KEY,
+    RIGHT_EYE_KEY,
+    both_eye_aspect_ratios,
+    cached_eyes,
+    eye_aspect_ratios,
+    gather_eye_points,
+)
+
 
 class BlinkDetector:
     """
@@ -27,23 +38,29 @@ class BlinkDetector:
     - Quick response for gaming
     """
 
-    def __init__(self, calibration_time: float = 2.0, sensitivity: float = 1.0):
+    def __init__(
+        self,
+        calibration_time: float = 2.0,
+        sensitivity: float = 1.0,
+        refine_landmarks: bool = False,
+    ):
         """
         Initialize blink detector.
 
         Args:
             calibration_time: Seconds to spend calibrating (default 2.0)
             sensitivity: Detection sensitivity multiplier (default 1.0, higher = more sensitive)
+            refine_landmarks: Run Face Mesh's attention model, which refines the eye and lip
+                contours and adds iris landmarks (default False: slower, and EAR does not need it)
         """
         # MediaPipe setup
         self.mp_face_mesh = mp.solutions.face_mesh
-        self.face_mesh = self.mp_face_mesh.FaceMesh(
-            max_num_faces=1, refine_landmarks=True, min_detection_confidence=0.7, min_tracking_confidence=0.5
-        )
+        self.refine_landmarks = refine_landmarks
+        self.face_mesh = self._create_face_mesh()
 
         # Eye landmark indices (MediaPipe Face Mesh)
-        self.LEFT_EYE_KEY = [33, 160, 158, 133, 153, 144]  # corners + top/bottom
-        self.RIGHT_EYE_KEY = [362, 385, 387, 263, 373, 380]  # corners + top/bottom
+        self.LEFT_EYE_KEY = LEFT_EYE_KEY  # corners + top/bottom
+        self.RIGHT_EYE_KEY = RIGHT_EYE_KEY  # corners + top/bottom
 
         # Detection parameters - tuned for deliberate blinks vs automatic blinks
         self.ear_threshold = 0.25  # Threshold for detecting closed eyes during blinks
@@ -78,7 +95,23 @@ class BlinkDetector:
         # Performance tracking
         self.last_detection_time = 0
 
-    def calculate_ear(self, eye_landmarks: List[Tuple[float, float]]) -> float:
+        # Newest Face Mesh pass, keyed by the camera frame sequence it ran on, so the preview
+        # overlay and debug text reuse it instead of running Face Mesh a second time
+        self.last_frame_sequence = None
+        self.last_results = None
+        # (frame_sequence, eye_landmarks, (left_ear, right_ear)) of the last frame with a face, set
+        # in one assignment so a reader on another thread never sees a half-updated entry.
+        # eye_landmarks is (12, 2) normalized x, y: LEFT_EYE_KEY rows, then RIGHT_EYE_KEY;
+        # the EARs are before smoothing
+        self.last_eyes = None
+
+    def _create_face_mesh(self):
+        """Build a Face Mesh instance for video (tracks the face across frames)"""
+        return self.mp_face_mesh.FaceMesh(
+            max_num_faces=1, refine_landmarks=self.refine_landmarks, min_detection_confidence=0.7, min_tracking_confidence=0.5
+        )
+
+    def calculate_ear(self, eye_landmarks: np.ndarray) -> float:
         """
         Calculate Eye Aspect Ratio (EAR) for given eye landmarks.
 
@@ -86,41 +119,19 @@ class BlinkDetector:
         Where p1,p4 are horizontal corners and p2,p3,p5,p6 are vertical points
 
         Args:
-            eye_landmarks: List of (x, y) coordinates for eye landmarks
+            eye_landmarks: (6, 2) array of (x, y) coordinates for eye landmarks
 
         Returns:
             Eye aspect ratio (higher = more open, lower = more closed)
         """
         if len(eye_landmarks) < 6:
-            return 0.3  # Default "open" value
-
-        # Calculate vertical distances
-        vertical_1 = math.sqrt(
-            (eye_landmarks[1][0] - eye_landmarks[5][0]) ** 2 + (eye_landmarks[1][1] - eye_landmarks[5][1]) ** 2
-        )
-        vertical_2 = math.sqrt(
-            (eye_landmarks[2][0] - eye_landmarks[4][0]) ** 2 + (eye_landmarks[2][1] - eye_landmarks[4][1]) ** 2
-        )
-
-        # Calculate horizontal distance
-        horizontal = math.sqrt(
-            (eye_landmarks[0][0] - eye_landmarks[3][0]) ** 2 + (eye_landmarks[0][1] - eye_landmarks[3][1]) ** 2
-        )
+            return DEFAULT_OPEN_EAR
 
-        # Calculate EAR
-        if horizontal == 0:
-            return 0.3
+        return float(eye_aspect_ratios(np.asarray(eye_landmarks, dtype=np.float64)[:6])[0])
 
-        ear = (vertical_1 + vertical_2) / (2.0 * horizontal)
-        return ear
-
-    def extract_eye_landmarks(self, face_landmarks, eye_indices: List[int]) -> List[Tuple[float, float]]:
-        """Extract eye landmark coordinates from face landmarks."""
-        eye_points = []
-        for idx in eye_indices:
-            landmark = face_landmarks.landmark[idx]
-            eye_points.append((landmark.x, landmark.y))
-        return eye_points
+    def extract_eye_landmarks(self, face_landmarks, eye_indices: Sequence[int] = EYE_KEY) -> np.ndarray:
+        """Extract eye landmark coordinates from face landmarks as an (N, 2) array (both eyes by default)."""
+        return gather_eye_points(face_landmarks, eye_indices)
 
     def calibrate_baseline(self, left_ear: float, right_ear: float) -> bool:
         """
@@ -180,13 +191,12 @@ class BlinkDetector:
         current_time = time.time()
         self.last_detection_time = current_time
 
-        # Extract eye landmarks
-        left_eye_points = self.extract_eye_landmarks(face_landmarks, self.LEFT_EYE_KEY)
-        right_eye_points = self.extract_eye_landmarks(face_landmarks, self.RIGHT_EYE_KEY)
+        # Extract eye landmarks: (12, 2), LEFT_EYE_KEY rows, then RIGHT_EYE_KEY
+        eye_points = self.extract_eye_landmarks(face_landmarks)
 
         # Calculate Eye Aspect Ratios
-        left_ear = self.calculate_ear(left_eye_points)
-        right_ear = self.calculate_ear(right_eye_points)
+        left_ear, right_ear = both_eye_aspect_ratios(eye_points)
+        self.last_eyes = (self.last_frame_sequence, eye_points, (left_ear, right_ear))
 
         # Calibrate if still in calibration phase
         if self.calibration_frames < self.max_calibration_frames:
@@ -237,22 +247,30 @@ class BlinkDetector:
 
         return False, "None"
 
-    def process_frame(self, frame: np.ndarray) -> Tuple[bool, str]:
+    def process_frame(self, frame: np.ndarray, frame_sequence: Optional[int] = None, rgb: bool = False) -> Tuple[bool, str]:
         """
         Process a frame for blink detection.
 
         Args:
-            frame: Input BGR frame from camera
+            frame: Input BGR frame from camera (RGB with rgb=True)
+            frame_sequence: Camera sequence number of the frame, stored with the cached result
+            rgb: The frame is already RGB; skips the colour conversion
 
         Returns:
             Tuple of (blink_detected: bool, blink_type: str)
         """
-        # Convert BGR to RGB for MediaPipe
-        rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        rgb_frame.flags.writeable = False
+        if rgb:
+            rgb_frame = frame
+        else:
+            # Convert BGR to RGB for MediaPipe
+            rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+            rgb_frame.flags.writeable = False
 
         # Process frame with MediaPipe Face Mesh
         results = self.face_mesh.process(rgb_frame)
+        self.last_frame_sequence = frame_sequence
+        self.last_results = results
+        self.last_eyes = None
 
         # Process face landmarks
         if results.multi_face_landmarks:
@@ -261,6 +279,20 @@ class BlinkDetector:
 
         return False, "None"
 
+    def get_cached_eyes(self, frame_sequence: int, max_age: int = 0) -> Optional[Tuple[np.ndarray, Tuple[float, float]]]:
+        """
+        Eye landmarks and EARs from the last processed frame, without running Face Mesh again.
+
+        Args:
+            frame_sequence: Camera sequence number of the frame being displayed
+            max_age: How many camera frames the result may be away from frame_sequence
+
+        Returns:
+            Tuple of ((12, 2) eye landmarks, (left_ear, right_ear)), or None if no face was
+            found on the last processed frame or it is more than max_age frames away
+        """
+        return cached_eyes(self.last_eyes, frame_sequence, max_age)
+
     def recalibrate(self):
         """Reset calibration to start over."""
         self.baseline_ear_left = None
@@ -312,4 +344,5 @@ class BlinkDetector:
             "baseline_ear_left": self.baseline_ear_left,
             "baseline_ear_right": self.baseline_ear_right,
             "last_detection_time": self.last_detection_time,
+            "refine_landmarks": self.refine_landmarks,
         }
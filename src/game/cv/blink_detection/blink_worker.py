@@ -0,0 +1,179 @@
+"""
+Background blink detection for Blinky Bird.
+
+Blink detection used to run in the screen's update() on the frame draw() had read the
+render frame before, so every blink was handled at least one render frame after its
+frame arrived, and Face Mesh ran inside the render loop. The worker thread runs the
+detector on every camera frame as soon as it is captured and queues timestamped blink
+events, which update() drains each render frame. The render thread never reads the
+detector itself: the worker publishes a DetectorSnapshot of its state after every frame.
+"""
+
+# Standard library imports
+import threading
+import time
+from collections import deque
+from types import MappingProxyType
+from typing import List, Optional, Tuple
+
+# Third-party imports
+import cv2
+import numpy as np
+
+# Local imports
+from .eye_metrics import cached_eyes
+
+EVENT_QUEUE_SIZE = 32  # Undrained blink events kept (update() drains every render frame)
+TIMING_QUEUE_SIZE = 90  # Undrained per-frame timings kept for latency stats
+FRAME_WAIT_TIMEOUT = 0.1  # Seconds to wait for a frame before checking for stop()
+
+
+class BlinkEvent:
+    """A blink detected by the worker"""
+
+    def __init__(self, blink_type: str, frame_sequence: int, capture_timestamp: float, detected_at: float):
+        self.blink_type = blink_type
+        self.frame_sequence = frame_sequence  # Camera sequence number of the frame the blink was seen on
+        self.capture_timestamp = capture_timestamp  # When that frame was captured (time.perf_counter)
+        self.detected_at = detected_at  # When detection on it finished (time.perf_counter)
+
+
+class DetectorSnapshot:
+    """Detector state published by the worker after a frame; never modified once built"""
+
+    __slots__ = ("status", "last_eyes")
+
+    def __init__(self, detector):
+        """Take a snapshot of detector (hold the worker's lock)"""
+        self.status = MappingProxyType(detector.get_status())
+        # (frame_sequence, eye_landmarks, (left_ear, right_ear)) or None; the detector builds
+        # a new tuple and array every frame and never changes a published one
+        self.last_eyes = detector.last_eyes
+
+    @property
+    def is_calibrated(self) -> bool:
+        return self.status["calibrated"]
+
+    def get_cached_eyes(self, frame_sequence: int, max_age: int = 0) -> Optional[Tuple[np.ndarray, Tuple[float, float]]]:
+        """Eye landmarks and EARs of the snapshot's frame, as the detector's get_cached_eyes"""
+        return cached_eyes(self.last_eyes, frame_sequence, max_age)
+
+
+class BlinkDetectionWorker:
+    """
+    Runs a blink detector on a background thread as camera frames arrive.
+
+    Needs threaded camera capture to wait on; without it, call process() from update()
+    with each new frame instead of start(). The detector is only touched while holding
+    lock; the game reads its state from snapshot, and resets or recalibrates it through
+    reset_detector() and recalibrate(), which publish a new snapshot.
+    """
+
+    def __init__(self, camera_manager, detector):
+        """
+        Args:
+            camera_manager: CameraManager to take frames from
+            detector: BlinkDetector or EnhancedBlinkDetector to run
+        """
+        self.camera_manager = camera_manager
+        self.detector = detector
+        self.lock = threading.Lock()
+
+        self.events = deque(maxlen=EVENT_QUEUE_SIZE)  # BlinkEvent, oldest first
+        # (capture_timestamp, detected_at, detection_ms) for every processed frame
+        self.timings = deque(maxlen=TIMING_QUEUE_SIZE)
+        self.frames_processed = 0
+        self.last_sequence = 0
+        self.snapshot = DetectorSnapshot(detector)  # Replaced (never modified) under lock
+
+        self._mirrored = None  # Reused buffer for the mirrored frame
+        self._thread = None
+        self._running = False
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None
+
+    def start(self) -> None:
+        """Start detecting on a background thread"""
+        if self._thread is not None:
+            return
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name="BlinkDetection", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the background thread and wait for the frame in progress"""
+        self._running = False
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+
+    def _run(self) -> None:
+        """Run the detector on every newly captured frame"""
+        while self._running:
+            newest = self.camera_manager.wait_for_frame(self.last_sequence, FRAME_WAIT_TIMEOUT)
+            if newest is None:
+                continue
+            sequence, capture_timestamp, frame = newest
+            self.process(frame, sequence, capture_timestamp)
+
+    def process(self, frame: np.ndarray, frame_sequence: int, capture_timestamp: float) -> Optional[BlinkEvent]:
+        """
+        Run the detector on one frame and queue a BlinkEvent if it blinked.
+
+        Args:
+            frame: Unmirrored RGB camera frame, as from CameraManager.read_rgb_frame
+            frame_sequence: Camera sequence number of the frame
+            capture_timestamp: When the frame was captured (time.perf_counter)
+
+        Returns:
+            The queued event, or None
+        """
+        self.last_sequence = frame_sequence
+
+        # The detectors (eye keys, calibration) see the same mirrored view as the player
+        if self._mirrored is None or self._mirrored.shape != frame.shape:
+            self._mirrored = np.empty_like(frame)
+        cv2.flip(frame, 1, dst=self._mirrored)
+
+        start = time.perf_counter()
+        with self.lock:
+            blink_detected, blink_type = self.detector.process_frame(self._mirrored, frame_sequence, rgb=True)
+            self.snapshot = DetectorSnapshot(self.detector)
+        detected_at = time.perf_counter()
+
+        self.frames_processed += 1
+        self.timings.append((capture_timestamp, detected_at, (detected_at - start) * 1000))
+        if not blink_detected:
+            return None
+        event = BlinkEvent(blink_type, frame_sequence, capture_timestamp, detected_at)
+        self.events.append(event)
+        return event
+
+    def recalibrate(self) -> None:
+        """Restart the detector's calibration"""
+        with self.lock:
+            self.detector.recalibrate()
+            self.snapshot = DetectorSnapshot(self.detector)
+
+    def reset_detector(self) -> None:
+        """Clear the detector's blink counters and tracking state (calibration is kept)"""
+        with self.lock:
+            self.detector.reset_counters()
+            self.detector.reset_tracking()
+            self.snapshot = DetectorSnapshot(self.detector)
+
+    def drain_events(self) -> List[BlinkEvent]:
+        """Take every queued blink event, oldest first"""
+        events = []
+        while self.events:
+            events.append(self.events.popleft())
+        return events
+
+    def drain_timings(self) -> List[tuple]:
+        """Take every queued (capture_timestamp, detected_at, detection_ms), oldest first"""
+        timings = []
+        while self.timings:
+            timings.append(self.timings.popleft())
+        return timings
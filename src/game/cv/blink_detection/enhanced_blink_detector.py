@@ -6,10 +6,9 @@ lighting conditions using preprocessing and relative detection algorithms.
 """
 
 # Standard library imports
-import math
 import time
 from collections import deque
-from typing import List, Optional, Tuple
+from typing import Optional, Sequence, Tuple
 
 # Third-party imports
 import cv2
@@ -17,6 +16,17 @@ import mediapipe as mp
 import numpy as np
 
 # Local imports
+from .eye_metrics import (
+    DEFAULT_OPEN_EAR,
+    EYE_KEY,
+    LEFT_EYE_KEY,
+    RIGHT_EYE_KEY,
+    SlidingBaseline,
+    both_eye_aspect_ratios,
+    cached_eyes,
+    eye_aspect_ratios,
+    gather_eye_points,
+)
 from .frame_preprocessor import FramePreprocessor
 
 
@@ -34,7 +44,13 @@ class EnhancedBlinkDetector:
     - Quick response optimized for gaming
     """
 
-    def __init__(self, calibration_time: float = 2.0, sensitivity: float = 1.0, enable_preprocessing: bool = False):
+    def __init__(
+        self,
+        calibration_time: float = 2.0,
+        sensitivity: float = 1.0,
+        enable_preprocessing: bool = False,
+        refine_landmarks: bool = False,
+    ):
         """
         Initialize enhanced blink detector.
 
@@ -42,6 +58,8 @@ class EnhancedBlinkDetector:
             calibration_time: Seconds to spend calibrating (default 2.0)
             sensitivity: Detection sensitivity multiplier (default 1.0, higher = more sensitive)
             enable_preprocessing: Enable frame preprocessing for better detection (default False)
+            refine_landmarks: Run Face Mesh's attention model, which refines the eye and lip
+                contours and adds iris landmarks (default False: slower, and EAR does not need it)
         """
         # Configuration
         self.enable_preprocessing = enable_preprocessing
@@ -52,13 +70,12 @@ class EnhancedBlinkDetector:
 
         # MediaPipe setup
         self.mp_face_mesh = mp.solutions.face_mesh
-        self.face_mesh = self.mp_face_mesh.FaceMesh(
-            max_num_faces=1, refine_landmarks=True, min_detection_confidence=0.7, min_tracking_confidence=0.5
-        )
+        self.refine_landmarks = refine_landmarks
+        self.face_mesh = self._create_face_mesh()
 
         # Eye landmark indices (MediaPipe Face Mesh)
-        self.LEFT_EYE_KEY = [33, 160, 158, 133, 153, 144]  # corners + top/bottom
-        self.RIGHT_EYE_KEY = [362, 385, 387, 263, 373, 380]  # corners + top/bottom
+        self.LEFT_EYE_KEY = LEFT_EYE_KEY  # corners + top/bottom
+        self.RIGHT_EYE_KEY = RIGHT_EYE_KEY  # corners + top/bottom
 
         # Detection parameters
         self.ear_threshold = 0.25  # Fallback threshold for absolute detection
@@ -89,9 +106,10 @@ class EnhancedBlinkDetector:
         self.left_ear_history = deque(maxlen=self.ear_history_size)
         self.right_ear_history = deque(maxlen=self.ear_history_size)
 
-        # Baseline tracking for relative detection
-        self.left_ear_baseline_history = deque(maxlen=self.baseline_window)
-        self.right_ear_baseline_history = deque(maxlen=self.baseline_window)
+        # Baseline tracking for relative detection (kept sorted as values arrive)
+        # Use top 60% of values for baseline (exclude potential blinks)
+        self.left_ear_baseline_history = SlidingBaseline(self.baseline_window, exclude_fraction=0.4)
+        self.right_ear_baseline_history = SlidingBaseline(self.baseline_window, exclude_fraction=0.4)
 
         self.both_closed_frames = 0
         self.both_open_frames = 0
@@ -101,6 +119,16 @@ class EnhancedBlinkDetector:
         # Performance tracking
         self.last_detection_time = 0
 
+        # Newest Face Mesh pass, keyed by the camera frame sequence it ran on, so the preview
+        # overlay and debug text reuse it instead of running Face Mesh a second time
+        self.last_frame_sequence = None
+        self.last_results = None
+        # (frame_sequence, eye_landmarks, (left_ear, right_ear)) of the last frame with a face, set
+        # in one assignment so a reader on another thread never sees a half-updated entry.
+        # eye_landmarks is (12, 2) normalized x, y: LEFT_EYE_KEY rows, then RIGHT_EYE_KEY;
+        # the EARs are before smoothing
+        self.last_eyes = None
+
         # Debug information for status
         self.debug_info = {
             "left_ear": 0,
@@ -114,7 +142,13 @@ class EnhancedBlinkDetector:
             "calibrating": True,
         }
 
-    def calculate_ear(self, eye_landmarks: List[Tuple[float, float]]) -> float:
+    def _create_face_mesh(self):
+        """Build a Face Mesh instance for video (tracks the face across frames)"""
+        return self.mp_face_mesh.FaceMesh(
+            max_num_faces=1, refine_landmarks=self.refine_landmarks, min_detection_confidence=0.7, min_tracking_confidence=0.5
+        )
+
+    def calculate_ear(self, eye_landmarks: np.ndarray) -> float:
         """
         Calculate Eye Aspect Ratio (EAR) for given eye landmarks.
 
@@ -122,42 +156,19 @@ class EnhancedBlinkDetector:
         Where p1,p4 are horizontal corners and p2,p3,p5,p6 are vertical points
 
         Args:
-            eye_landmarks: List of (x, y) coordinates for eye landmarks
+            eye_landmarks: (6, 2) array of (x, y) coordinates for eye landmarks
 
         Returns:
             Eye aspect ratio (higher = more open, lower = more closed)
         """
         if len(eye_landmarks) < 6:
-            return 0.3  # Default "open" value
-
-        # Calculate vertical distances
-        vertical_1 = math.sqrt(
-            (eye_landmarks[1][0] - eye_landmarks[5][0]) ** 2 + (eye_landmarks[1][1] - eye_landmarks[5][1]) ** 2
-        )
-        vertical_2 = math.sqrt(
-            (eye_landmarks[2][0] - eye_landmarks[4][0]) ** 2 + (eye_landmarks[2][1] - eye_landmarks[4][1]) ** 2
-        )
-
-        # Calculate horizontal distance
-        horizontal = math.sqrt(
-            (eye_landmarks[0][0] - eye_landmarks[3][0]) ** 2 + (eye_landmarks[0][1] - eye_landmarks[3][1]) ** 2
-        )
-
-        if horizontal == 0:
-            return 0.3
+            return DEFAULT_OPEN_EAR
 
-        # Calculate EAR
-        ear = (vertical_1 + vertical_2) / (2.0 * horizontal)
-        return ear
+        return float(eye_aspect_ratios(np.asarray(eye_landmarks, dtype=np.float64)[:6])[0])
 
-    def extract_eye_landmarks(self, face_landmarks, eye_indices: List[int]) -> List[Tuple[float, float]]:
-        """Extract eye landmark coordinates from face landmarks."""
-        eye_points = []
-        for idx in eye_indices:
-            if idx < len(face_landmarks.landmark):
-                landmark = face_landmarks.landmark[idx]
-                eye_points.append((landmark.x, landmark.y))
-        return eye_points
+    def extract_eye_landmarks(self, face_landmarks, eye_indices: Sequence[int] = EYE_KEY) -> np.ndarray:
+        """Extract eye landmark coordinates from face landmarks as an (N, 2) array (both eyes by default)."""
+        return gather_eye_points(face_landmarks, eye_indices)
 
     def calibrate_baseline(self, left_ear: float, right_ear: float) -> bool:
         """
@@ -218,15 +229,9 @@ class EnhancedBlinkDetector:
         if len(self.right_ear_baseline_history) < self.min_baseline_frames:
             return False
 
-        # Calculate current baseline (average of recent open-eye values)
-        # Exclude the lowest values to avoid including blinks in baseline
-        left_baseline_values = sorted(list(self.left_ear_baseline_history))
-        right_baseline_values = sorted(list(self.right_ear_baseline_history))
-
-        # Use top 60% of values for baseline (exclude potential blinks)
-        baseline_start_idx = int(len(left_baseline_values) * 0.4)
-        left_baseline = np.mean(left_baseline_values[baseline_start_idx:])
-        right_baseline = np.mean(right_baseline_values[baseline_start_idx:])
+        # Calculate current baseline (average of the top 60% of recent values)
+        left_baseline = self.left_ear_baseline_history.top_mean()
+        right_baseline = self.right_ear_baseline_history.top_mean()
 
         # Calculate relative drops from baseline
         left_drop = (left_baseline - left_ear) / left_baseline if left_baseline > 0 else 0
@@ -245,12 +250,14 @@ class EnhancedBlinkDetector:
 
         return left_blink and right_blink
 
-    def process_frame(self, frame: np.ndarray) -> Tuple[bool, str]:
+    def process_frame(self, frame: np.ndarray, frame_sequence: Optional[int] = None, rgb: bool = False) -> Tuple[bool, str]:
         """
         Process frame and detect blinks with optional preprocessing.
 
         Args:
-            frame: Input BGR frame from camera
+            frame: Input BGR frame from camera (RGB with rgb=True)
+            frame_sequence: Camera sequence number of the frame, stored with the cached result
+            rgb: The frame is already RGB; skips the colour conversion unless preprocessing
 
         Returns:
             Tuple of (blink_detected: bool, blink_type: str)
@@ -260,14 +267,22 @@ class EnhancedBlinkDetector:
         # Apply preprocessing if enabled (for detection only, not display)
         processed_frame = frame
         if self.enable_preprocessing and self.preprocessor:
-            processed_frame = self.preprocessor.preprocess_frame(frame)
+            # The preprocessor works on BGR frames
+            processed_frame = self.preprocessor.preprocess_frame(cv2.cvtColor(frame, cv2.COLOR_RGB2BGR) if rgb else frame)
+            rgb = False
 
-        # Convert BGR to RGB for MediaPipe
-        rgb_frame = cv2.cvtColor(processed_frame, cv2.COLOR_BGR2RGB)
-        rgb_frame.flags.writeable = False
+        if rgb:
+            rgb_frame = processed_frame
+        else:
+            # Convert BGR to RGB for MediaPipe
+            rgb_frame = cv2.cvtColor(processed_frame, cv2.COLOR_BGR2RGB)
+            rgb_frame.flags.writeable = False
 
         # Process frame with MediaPipe Face Mesh
         results = self.face_mesh.process(rgb_frame)
+        self.last_frame_sequence = frame_sequence
+        self.last_results = results
+        self.last_eyes = None
 
         # Process face landmarks
         if not results.multi_face_landmarks:
@@ -276,13 +291,12 @@ class EnhancedBlinkDetector:
 
         face_landmarks = results.multi_face_landmarks[0]  # Use first face
 
-        # Extract eye landmarks
-        left_eye_points = self.extract_eye_landmarks(face_landmarks, self.LEFT_EYE_KEY)
-        right_eye_points = self.extract_eye_landmarks(face_landmarks, self.RIGHT_EYE_KEY)
+        # Extract eye landmarks: (12, 2), LEFT_EYE_KEY rows, then RIGHT_EYE_KEY
+        eye_points = self.extract_eye_landmarks(face_landmarks)
 
         # Calculate Eye Aspect Ratios
-        left_ear = self.calculate_ear(left_eye_points)
-        right_ear = self.calculate_ear(right_eye_points)
+        left_ear, right_ear = both_eye_aspect_ratios(eye_points)
+        self.last_eyes = (self.last_frame_sequence, eye_points, (left_ear, right_ear))
 
         # Calibrate if still in calibration phase
         if not self.is_calibrated:
@@ -363,6 +377,7 @@ class EnhancedBlinkDetector:
             "detection_method": self.debug_info.get("detection_method", "absolute"),
             "preprocessing_enabled": self.enable_preprocessing,
             "relative_detection_enabled": self.use_relative_detection,
+            "refine_landmarks": self.refine_landmarks,
         }
 
     def reset_counters(self):
@@ -392,16 +407,36 @@ class EnhancedBlinkDetector:
         self.debug_info["glasses_mode"] = False
         self.reset_tracking()
 
-    def get_face_landmarks_for_display(self, frame: np.ndarray):
+    def get_cached_eyes(self, frame_sequence: int, max_age: int = 0) -> Optional[Tuple[np.ndarray, Tuple[float, float]]]:
+        """
+        Eye landmarks and EARs from the last processed frame, without running Face Mesh again.
+
+        Args:
+            frame_sequence: Camera sequence number of the frame being displayed
+            max_age: How many camera frames the result may be away from frame_sequence
+
+        Returns:
+            Tuple of ((12, 2) eye landmarks, (left_ear, right_ear)), or None if no face was
+            found on the last processed frame or it is more than max_age frames away
+        """
+        return cached_eyes(self.last_eyes, frame_sequence, max_age)
+
+    def get_face_landmarks_for_display(self, frame: np.ndarray, frame_sequence: Optional[int] = None):
         """
         Get face landmarks for display overlay (uses original frame, not preprocessed).
 
         Args:
             frame: Original BGR frame
+            frame_sequence: Camera sequence number of the frame; if process_frame already ran
+                on it, its Face Mesh result is reused instead of running Face Mesh again
 
         Returns:
             Face landmarks or None if no face detected
         """
+        if frame_sequence is not None and frame_sequence == self.last_frame_sequence and self.last_results is not None:
+            landmarks = self.last_results.multi_face_landmarks
+            return landmarks[0] if landmarks else None
+
         # Convert BGR to RGB for MediaPipe (use original frame for display)
         rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
         rgb_frame.flags.writeable = False
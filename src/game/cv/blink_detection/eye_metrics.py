@@ -0,0 +1,147 @@
+"""
+Eye aspect ratio maths shared by the blink detectors.
+
+The detectors read twelve Face Mesh landmarks per frame: six per eye, corners plus
+upper and lower lid. They are gathered once with one index array into a (12, 2) array
+and the eye aspect ratios of both eyes come out of one vectorized expression.
+SlidingBaseline keeps a sliding window of EAR values sorted as they arrive, with a
+running sum of the highest ones, so the "open eye" baseline (their mean) needs no sort
+or sum per frame.
+"""
+
+# Standard library imports
+import bisect
+from collections import deque
+from typing import Optional, Sequence, Tuple
+
+# Third-party imports
+import numpy as np
+
+# Eye landmark indices (MediaPipe Face Mesh): corner, upper lid x2, corner, lower lid x2
+LEFT_EYE_KEY = [33, 160, 158, 133, 153, 144]
+RIGHT_EYE_KEY = [362, 385, 387, 263, 373, 380]
+EYE_KEY = np.array(LEFT_EYE_KEY + RIGHT_EYE_KEY)
+
+# Rows of one eye's six points paired up for the EAR distances: |p2-p6|, |p3-p5|, |p1-p4|
+_EAR_FROM = np.array([1, 2, 0])
+_EAR_TO = np.array([5, 4, 3])
+DEFAULT_OPEN_EAR = 0.3  # Returned for an eye whose corners coincide
+
+
+def gather_eye_points(face_landmarks, indices: Sequence[int] = EYE_KEY) -> np.ndarray:
+    """(len(indices), 2) normalized x, y of the given Face Mesh landmarks"""
+    landmarks = face_landmarks.landmark
+    return np.array([(landmarks[i].x, landmarks[i].y) for i in indices], dtype=np.float64)
+
+
+def eye_aspect_ratios(eye_points: np.ndarray) -> np.ndarray:
+    """
+    Eye aspect ratios of every eye in eye_points.
+
+    EAR = (|p2-p6| + |p3-p5|) / (2 * |p1-p4|)
+
+    Args:
+        eye_points: (6 * eyes, 2) points, six per eye in LEFT_EYE_KEY order
+
+    Returns:
+        (eyes,) EARs; DEFAULT_OPEN_EAR for an eye with zero width
+    """
+    eyes = eye_points.reshape(-1, 6, 2)
+    distances = np.hypot(*np.moveaxis(eyes[:, _EAR_FROM] - eyes[:, _EAR_TO], 2, 0))
+    horizontal = distances[:, 2]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ears = (distances[:, 0] + distances[:, 1]) / (2.0 * horizontal)
+    return np.where(horizontal == 0, DEFAULT_OPEN_EAR, ears)
+
+
+def both_eye_aspect_ratios(eye_points: np.ndarray) -> Tuple[float, float]:
+    """(left_ear, right_ear) from (12, 2) points: LEFT_EYE_KEY rows, then RIGHT_EYE_KEY"""
+    left_ear, right_ear = eye_aspect_ratios(eye_points).tolist()
+    return left_ear, right_ear
+
+
+def cached_eyes(last_eyes, frame_sequence: int, max_age: int = 0) -> Optional[Tuple[np.ndarray, Tuple[float, float]]]:
+    """
+    Eye landmarks and EARs from a detector's last_eyes entry, if it is recent enough.
+
+    Args:
+        last_eyes: (frame_sequence, (12, 2) eye landmarks, (left_ear, right_ear)) or None
+        frame_sequence: Camera sequence number of the frame being displayed
+        max_age: How many camera frames the entry may be away from frame_sequence
+
+    Returns:
+        Tuple of ((12, 2) eye landmarks, (left_ear, right_ear)), or None if there is no
+        entry, it has no sequence number or it is more than max_age frames away
+    """
+    if last_eyes is None or last_eyes[0] is None or abs(frame_sequence - last_eyes[0]) > max_age:
+        return None
+    return last_eyes[1], last_eyes[2]
+
+
+class SlidingBaseline:
+    """
+    Sliding window of values with a running mean of its highest values.
+
+    The window is also kept sorted: each append inserts the new value and removes the
+    one falling out of the window by bisection. A running sum of the values from the cut
+    index int(n * exclude_fraction) up is updated on every insert and delete, so
+    top_mean() is O(1) instead of sorting (or slicing and summing) the window per frame.
+    """
+
+    def __init__(self, window: int, exclude_fraction: float = 0.0):
+        """
+        Args:
+            window: Number of most recent values kept
+            exclude_fraction: Fraction of the lowest values top_mean() leaves out
+        """
+        self.window = deque(maxlen=window)
+        self.exclude_fraction = exclude_fraction
+        self._sorted = []
+        self._cut = 0  # Index in _sorted of the lowest value in the top part
+        self._top_sum = 0.0  # Sum of _sorted[_cut:]
+
+    def append(self, value: float) -> None:
+        if len(self.window) == self.window.maxlen:
+            self._remove(self.window[0])
+        self.window.append(value)
+        self._insert(value)
+        self._move_cut()
+
+    def _insert(self, value: float) -> None:
+        index = bisect.bisect_right(self._sorted, value)
+        if index >= self._cut:
+            self._top_sum += value
+        else:
+            self._cut += 1  # Inserted below the top part, which moves up one index
+        self._sorted.insert(index, value)
+
+    def _remove(self, value: float) -> None:
+        index = bisect.bisect_left(self._sorted, value)
+        if index >= self._cut:
+            self._top_sum -= value
+        else:
+            self._cut -= 1  # Removed from below the top part, which moves down one index
+        del self._sorted[index]
+
+    def _move_cut(self) -> None:
+        """Move the cut to int(n * exclude_fraction); at most a step per append"""
+        target = int(len(self._sorted) * self.exclude_fraction)
+        while self._cut < target:
+            self._top_sum -= self._sorted[self._cut]
+            self._cut += 1
+        while self._cut > target:
+            self._cut -= 1
+            self._top_sum += self._sorted[self._cut]
+
+    def clear(self) -> None:
+        self.window.clear()
+        self._sorted.clear()
+        self._cut = 0
+        self._top_sum = 0.0
+
+    def __len__(self) -> int:
+        return len(self.window)
+
+    def top_mean(self) -> float:
+        """Mean of the values with the lowest int(n * exclude_fraction) of them left out"""
+        return self._top_sum / (len(self._sorted) - self._cut)
@@ -4,7 +4,29 @@ Finger gun detection modules for hand tracking and gesture recognition
 
 # Import main classes for easy access
 from .enhanced_hand_tracker import EnhancedHandTracker, FramePreprocessor
-from .kalman_tracker import HandKalmanTracker, LandmarkKalmanFilter
+from .inference_scheduler import InferenceScheduler
+from .inference_worker import InferenceWorker, SharedFrameRing, SharedResultBlock
+from .kalman_tracker import BatchedLandmarkKalmanFilter, HandKalmanTracker, LandmarkKalmanFilter
+from .landmark_arrays import array_to_landmarks, landmarks_to_array
+from .landmark_recording import LandmarkRecorder, LandmarkRecording, replay_gestures
+from .preprocessing_governor import PreprocessingGovernor
 from .region_adaptive_detector import RegionAdaptiveDetector
 
-__all__ = ["EnhancedHandTracker", "FramePreprocessor", "HandKalmanTracker", "LandmarkKalmanFilter", "RegionAdaptiveDetector"]
+__all__ = [
+    "BatchedLandmarkKalmanFilter",
+    "EnhancedHandTracker",
+    "FramePreprocessor",
+    "HandKalmanTracker",
+    "InferenceScheduler",
+    "InferenceWorker",
+    "LandmarkRecorder",
+    "LandmarkRecording",
+    "PreprocessingGovernor",
+    "LandmarkKalmanFilter",
+    "RegionAdaptiveDetector",
+    "SharedFrameRing",
+    "SharedResultBlock",
+    "array_to_landmarks",
+    "landmarks_to_array",
+    "replay_gestures",
+]
@@ -6,6 +6,7 @@ Enhanced hand tracking with preprocessing, joint angles, and Kalman filtering
 import math
 import time
 from collections import deque
+from types import SimpleNamespace
 from typing import Optional, Tuple
 
 # Third-party imports
@@ -16,8 +17,16 @@ import numpy as np
 try:
     # Local application imports
     from utils.constants import (
+        DETECTION_WIDTH,
         INDEX_WRIST_THRESHOLD,
+        INFERENCE_SKIP,
         MIDDLE_RING_THRESHOLD,
+        MODEL_COMPLEXITY,
+        MODEL_COMPLEXITY_BUDGET_MS,
+        PREPROCESS_ADAPTIVE,
+        PREPROCESS_BUDGET_MS,
+        PREPROCESS_ROI_MARGIN,
+        PREPROCESS_ROI_ONLY,
         RING_PINKY_THRESHOLD,
         SHOOT_DISTANCE_THRESHOLD,
         SHOOT_VELOCITY_THRESHOLD,
@@ -25,13 +34,27 @@ try:
     )
 except ImportError:
     # Fallback constants if not in proper package structure
+    DETECTION_WIDTH = 480
     INDEX_WRIST_THRESHOLD = 10
+    INFERENCE_SKIP = True
     MIDDLE_RING_THRESHOLD = 8
+    MODEL_COMPLEXITY = None
+    MODEL_COMPLEXITY_BUDGET_MS = 22.0
+    PREPROCESS_ADAPTIVE = True
+    PREPROCESS_BUDGET_MS = 10.0
+    PREPROCESS_ROI_MARGIN = 24
+    PREPROCESS_ROI_ONLY = True
     RING_PINKY_THRESHOLD = 8
     SHOOT_DISTANCE_THRESHOLD = 0.1
     SHOOT_VELOCITY_THRESHOLD = 0.1
     THUMB_INDEX_THRESHOLD = 35
 
+try:
+    from .inference_scheduler import InferenceScheduler
+except ImportError:
+    # Third-party imports
+    from inference_scheduler import InferenceScheduler
+
 try:
     from .kalman_tracker import HandKalmanTracker
 except ImportError:
@@ -39,16 +62,134 @@ except ImportError:
     from kalman_tracker import HandKalmanTracker
 
 try:
-    from .region_adaptive_detector import RegionAdaptiveDetector
+    from .region_adaptive_detector import ADAPTIVE_THRESHOLDS, RegionAdaptiveDetector
+except ImportError:
+    # Third-party imports
+    from region_adaptive_detector import ADAPTIVE_THRESHOLDS, RegionAdaptiveDetector
+
+try:
+    from .landmark_arrays import (
+        FINGER_JOINTS,
+        INDEX_FINGER_MCP,
+        INDEX_FINGER_TIP,
+        MIDDLE_FINGER_MCP,
+        MIDDLE_FINGER_PIP,
+        MIDDLE_FINGER_TIP,
+        PINKY_MCP,
+        PINKY_TIP,
+        RING_FINGER_TIP,
+        THUMB_IP,
+        THUMB_TIP,
+        WRIST,
+        as_landmark_array,
+        landmarks_to_array,
+        mirror_landmarks,
+    )
+except ImportError:
+    # Third-party imports
+    from landmark_arrays import (
+        FINGER_JOINTS,
+        INDEX_FINGER_MCP,
+        INDEX_FINGER_TIP,
+        MIDDLE_FINGER_MCP,
+        MIDDLE_FINGER_PIP,
+        MIDDLE_FINGER_TIP,
+        PINKY_MCP,
+        PINKY_TIP,
+        RING_FINGER_TIP,
+        THUMB_IP,
+        THUMB_TIP,
+        WRIST,
+        as_landmark_array,
+        landmarks_to_array,
+        mirror_landmarks,
+    )
+
+try:
+    from .model_calibration import (
+        MODEL_COMPLEXITY_NAMES,
+        ModelComplexityMonitor,
+        calibrate_model_complexity,
+        calibration_key,
+        load_calibration,
+        save_calibration,
+    )
+except ImportError:
+    # Third-party imports
+    from model_calibration import (
+        MODEL_COMPLEXITY_NAMES,
+        ModelComplexityMonitor,
+        calibrate_model_complexity,
+        calibration_key,
+        load_calibration,
+        save_calibration,
+    )
+
+try:
+    from .preprocessing_governor import PreprocessingGovernor
 except ImportError:
     # Third-party imports
-    from region_adaptive_detector import RegionAdaptiveDetector
+    from preprocessing_governor import PreprocessingGovernor
+
+# Pixel sizes in the preprocessor are tuned for frames of this width and scale with it
+REFERENCE_WIDTH = 640
+
+# Finger order of the curl array returned by calculate_finger_angles
+FINGER_NAMES = ("INDEX", "MIDDLE", "RING", "PINKY")
+
+# Landmark pairs whose 2D distances the finger gun checks use, computed in one pass
+DISTANCE_PAIRS = np.array(
+    [
+        [THUMB_TIP, INDEX_FINGER_TIP],
+        [MIDDLE_FINGER_TIP, RING_FINGER_TIP],
+        [RING_FINGER_TIP, PINKY_TIP],
+        [INDEX_FINGER_TIP, WRIST],
+        [THUMB_TIP, MIDDLE_FINGER_PIP],
+        [INDEX_FINGER_TIP, INDEX_FINGER_MCP],
+    ]
+)
+
+# Per position category: (thumb-index, middle-ring, ring-pinky) closeness thresholds,
+# index-wrist extension threshold and minimum region confidence, scaled once
+SCALED_THRESHOLDS = {
+    category: (
+        np.array(
+            [
+                (THUMB_INDEX_THRESHOLD / 100.0) * params["thumb_index_multiplier"],
+                (MIDDLE_RING_THRESHOLD / 100.0) * params["middle_ring_multiplier"],
+                (RING_PINKY_THRESHOLD / 100.0) * params["ring_pinky_multiplier"],
+            ]
+        ),
+        (INDEX_WRIST_THRESHOLD / 100.0) * params["index_wrist_multiplier"],
+        params["min_confidence"],
+    )
+    for category, params in ADAPTIVE_THRESHOLDS.items()
+}
+
+# Frames are RGB; MediaPipe's default landmark colour (0, 0, 255) assumes BGR
+LANDMARK_DRAWING_SPEC = mp.solutions.drawing_utils.DrawingSpec(color=(255, 0, 0), thickness=2, circle_radius=2)
 
 
 class FramePreprocessor:
     """Handles frame preprocessing for better hand detection in various lighting conditions"""
 
-    def __init__(self):
+    def __init__(
+        self,
+        roi_only: bool = PREPROCESS_ROI_ONLY,
+        roi_margin: int = PREPROCESS_ROI_MARGIN,
+        adaptive: bool = PREPROCESS_ADAPTIVE,
+        budget_ms: Optional[float] = PREPROCESS_BUDGET_MS,
+    ):
+        """
+        Args:
+            roi_only: While a hand is tracked, enhance only its box plus roi_margin pixels
+                and pass the rest of the frame through untouched
+            roi_margin: Extra pixels around the hand box for ROI-only preprocessing
+            adaptive: Let a PreprocessingGovernor pick the tier per frame; otherwise
+                always run the full chain
+            budget_ms: Preprocessing time per frame above which the governor falls back
+                to cheaper tiers (None for no budget)
+        """
         # CLAHE for adaptive histogram equalization
         self.clahe = cv2.createCLAHE(clipLimit=3.0, tileGridSize=(8, 8))
 
@@ -56,45 +197,109 @@ class FramePreprocessor:
         self.last_hand_region = None
         self.gamma_table_cache = {}
 
+        self.roi_only = roi_only
+        self.roi_margin = roi_margin
+        self.last_pixel_ratio = 1.0  # Fraction of the frame enhanced by the last preprocess_frame call
+
+        self.governor = PreprocessingGovernor(budget_ms) if adaptive else None
+        self.last_tier = "full"  # Tier used by the last preprocess_frame call
+
     def preprocess_frame(self, frame: np.ndarray, hand_roi: Optional[Tuple] = None) -> np.ndarray:
         """
         Apply preprocessing to improve hand detection in various lighting conditions
 
         Args:
-            frame: Input BGR frame
+            frame: Input RGB frame (left untouched; every step writes a new image, and the
+                "none" tier returns the frame itself)
             hand_roi: Optional region of interest (x, y, width, height) for targeted preprocessing
         """
-        # Create a copy to avoid modifying original
+        start_time = time.perf_counter()
+        tier = self.governor.select_tier(frame) if self.governor else "full"
+        self.last_tier = tier
+
+        region = None
+        if self.roi_only and hand_roi is not None:
+            region = self._expand_roi(hand_roi, frame.shape)
+
+        if tier == "none":
+            self.last_pixel_ratio = 0.0
+            processed = frame  # Well-lit scene: MediaPipe reads the camera frame as is
+        elif region is not None:
+            processed = self._preprocess_region(frame, hand_roi, region, tier)
+        else:
+            self.last_pixel_ratio = 1.0
+            processed = self._enhance(frame, tier)
+
+            # Step 6: Optional shadow reduction for hand region
+            if hand_roi is not None and tier == "full":
+                processed = self._reduce_shadows_in_roi(processed, hand_roi)
+
+        if self.governor:
+            self.governor.record(tier, (time.perf_counter() - start_time) * 1000)
+        return processed
+
+    def _expand_roi(self, roi: Tuple, frame_shape: Tuple) -> Optional[Tuple]:
+        """Grow a hand box by roi_margin and clip it to the frame; None if nothing is left"""
+        img_h, img_w = frame_shape[:2]
+        margin = int(self.roi_margin * img_w / REFERENCE_WIDTH)
+        x, y, w, h = (int(v) for v in roi)
+        x_start = max(0, x - margin)
+        y_start = max(0, y - margin)
+        x_end = min(img_w, x + w + margin)
+        y_end = min(img_h, y + h + margin)
+        if x_end <= x_start or y_end <= y_start:
+            return None
+        return (x_start, y_start, x_end, y_end)
+
+    def _preprocess_region(self, frame: np.ndarray, hand_roi: Tuple, region: Tuple, tier: str) -> np.ndarray:
+        """Enhance only the region around the tracked hand
+
+        MediaPipe tracks the hand inside a crop around its previous landmarks, so pixels
+        far from the hand do not affect tracking; they are passed through unchanged.
+        """
+        x_start, y_start, x_end, y_end = region
         processed = frame.copy()
+        processed[y_start:y_end, x_start:x_end] = self._enhance(frame[y_start:y_end, x_start:x_end], tier)
+        if tier == "full":
+            processed = self._reduce_shadows_in_roi(processed, hand_roi)
 
-        # Step 1: Convert to LAB color space for better lighting control
-        lab = cv2.cvtColor(processed, cv2.COLOR_BGR2LAB)
-        l_channel, a_channel, b_channel = cv2.split(lab)
+        img_h, img_w = frame.shape[:2]
+        self.last_pixel_ratio = (x_end - x_start) * (y_end - y_start) / float(img_w * img_h)
+        return processed
 
-        # Step 2: Apply CLAHE to the L channel
-        l_channel = self.clahe.apply(l_channel)
+    def _enhance(self, image: np.ndarray, tier: str = "full") -> np.ndarray:
+        """Run the lighting enhancement chain for a tier ("gamma", "clahe" or "full") on an RGB image
 
-        # Step 3: Merge channels back
-        enhanced_lab = cv2.merge([l_channel, a_channel, b_channel])
-        processed = cv2.cvtColor(enhanced_lab, cv2.COLOR_LAB2BGR)
+        Returns a new image; the input is never modified.
+        """
+        processed = image
+        if tier in ("clahe", "full"):
+            # Step 1: Convert to LAB color space for better lighting control
+            lab = cv2.cvtColor(processed, cv2.COLOR_RGB2LAB)
+            l_channel, a_channel, b_channel = cv2.split(lab)
 
-        # Step 4: Apply bilateral filter to reduce noise while preserving edges
-        # Use smaller kernel for faster processing
-        processed = cv2.bilateralFilter(processed, 5, 50, 50)
+            # Step 2: Apply CLAHE to the L channel
+            l_channel = self.clahe.apply(l_channel)
 
-        # Step 5: Adaptive gamma correction
-        processed = self._apply_adaptive_gamma(processed)
+            # Step 3: Merge channels back
+            enhanced_lab = cv2.merge([l_channel, a_channel, b_channel])
+            processed = cv2.cvtColor(enhanced_lab, cv2.COLOR_LAB2RGB)
 
-        # Step 6: Optional shadow reduction for hand region
-        if hand_roi is not None:
-            processed = self._reduce_shadows_in_roi(processed, hand_roi)
+        if tier == "full":
+            # Step 4: Apply bilateral filter to reduce noise while preserving edges
+            # Use smaller kernel for faster processing
+            processed = cv2.bilateralFilter(processed, 5, 50, 50)
+
+        if tier in ("gamma", "full"):
+            # Step 5: Adaptive gamma correction
+            processed = self._apply_adaptive_gamma(processed)
 
         return processed
 
     def _apply_adaptive_gamma(self, image: np.ndarray) -> np.ndarray:
         """Apply gamma correction based on image brightness"""
         # Calculate mean brightness
-        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+        gray = cv2.cvtColor(image, cv2.COLOR_RGB2GRAY)
         mean_brightness = np.mean(gray)
 
         # Determine gamma value
@@ -151,7 +356,7 @@ class FramePreprocessor:
             return image
 
         # Convert to HSV for shadow detection
-        hsv = cv2.cvtColor(roi_img, cv2.COLOR_BGR2HSV)
+        hsv = cv2.cvtColor(roi_img, cv2.COLOR_RGB2HSV)
         h, s, v = cv2.split(hsv)
 
         # Enhance value channel to reduce shadows
@@ -160,26 +365,33 @@ class FramePreprocessor:
 
         # Merge back
         hsv_enhanced = cv2.merge([h, s, v_enhanced])
-        roi_enhanced = cv2.cvtColor(hsv_enhanced, cv2.COLOR_HSV2BGR)
+        roi_enhanced = cv2.cvtColor(hsv_enhanced, cv2.COLOR_HSV2RGB)
 
         # Blend enhanced ROI back into image
         image[y:y_end, x:x_end] = roi_enhanced
 
         return image
 
-    def get_hand_roi(self, hand_landmarks, frame_shape: Tuple) -> Optional[Tuple]:
-        """Calculate bounding box for hand with padding"""
+    def get_hand_roi(self, hand_landmarks, frame_shape: Tuple, mirrored: bool = False) -> Optional[Tuple]:
+        """Calculate bounding box for hand with padding
+
+        With mirrored, the landmarks are in the mirrored (selfie) view and the box is
+        returned for the unmirrored frame.
+        """
         if hand_landmarks is None:
             return None
 
         h, w = frame_shape[:2]
 
         # Get all x and y coordinates
-        xs = [lm.x * w for lm in hand_landmarks.landmark]
+        if mirrored:
+            xs = [(1.0 - lm.x) * w for lm in hand_landmarks.landmark]
+        else:
+            xs = [lm.x * w for lm in hand_landmarks.landmark]
         ys = [lm.y * h for lm in hand_landmarks.landmark]
 
         # Calculate bounding box with padding
-        padding = 50  # pixels
+        padding = int(50 * w / REFERENCE_WIDTH)  # 50 pixels at 640 wide
         x_min = max(0, int(min(xs) - padding))
         y_min = max(0, int(min(ys) - padding))
         x_max = min(w, int(max(xs) + padding))
@@ -191,20 +403,54 @@ class FramePreprocessor:
 class EnhancedHandTracker:
     """Enhanced hand tracking with preprocessing, joint angles, and temporal smoothing"""
 
-    def __init__(self, enable_preprocessing=True, enable_angles=True, enable_kalman=True):
+    def __init__(
+        self,
+        enable_preprocessing=True,
+        enable_angles=True,
+        enable_kalman=True,
+        load_model=True,
+        detection_width: Optional[int] = DETECTION_WIDTH,
+        skip_frames: bool = INFERENCE_SKIP,
+        model_complexity: Optional[int] = MODEL_COMPLEXITY,
+    ):
+        """
+        Args:
+            enable_preprocessing: Enhance frames before detection
+            enable_angles: Use joint angles for finger gun detection
+            enable_kalman: Smooth landmarks with Kalman filters
+            load_model: Build the MediaPipe Hands graph; pass False when landmarks come from
+                an inference worker and only the gesture logic runs in this process
+            detection_width: Downscale wider frames to this width (keeping the aspect ratio)
+                before preprocessing and detection; None to detect at camera resolution
+            skip_frames: Run inference on every Nth frame only while the hand is steady,
+                filling the gaps with Kalman predictions
+            model_complexity: MediaPipe Hands model, 0 (lite) or 1 (full); None picks the best
+                one that fits MODEL_COMPLEXITY_BUDGET_MS on this machine (cached after the
+                first calibration) and downgrades it if live inference falls behind
+        """
         # Configuration
         self.enable_preprocessing = enable_preprocessing
         self.enable_angles = enable_angles
         self.enable_kalman = enable_kalman
+        self.detection_width = detection_width
+        self._detection_buffer = None  # Reused downscaled frame
 
         # Initialize MediaPipe
         self.mp_hands = mp.solutions.hands
-        self.hands = self.mp_hands.Hands(
-            min_detection_confidence=0.6,  # Slightly lower for preprocessed frames
-            min_tracking_confidence=0.5,
-            max_num_hands=1,
-            model_complexity=1,
-        )
+        self.hands = None
+        self.load_model = load_model
+        self.model_complexity = model_complexity
+        self.model_calibration = None  # Timings behind an automatic model choice
+        self.complexity_monitor = None  # Watches live inference time in automatic mode
+        if load_model:
+            if model_complexity is None:
+                self.model_calibration = load_calibration(calibration_key(detection_width), MODEL_COMPLEXITY_BUDGET_MS)
+                if self.model_calibration:
+                    self.model_complexity = self.model_calibration["model_complexity"]
+                    self.complexity_monitor = ModelComplexityMonitor(self.model_complexity, MODEL_COMPLEXITY_BUDGET_MS)
+            # Without a cached choice the model is built after calibrating on the first frame
+            if self.model_complexity is not None:
+                self.hands = self._create_hands(self.model_complexity)
         self.mp_drawing = mp.solutions.drawing_utils
 
         # Initialize preprocessor
@@ -213,6 +459,10 @@ class EnhancedHandTracker:
         # Initialize Kalman tracker
         self.kalman_tracker = HandKalmanTracker() if enable_kalman else None
 
+        # Decides which frames run inference; the rest are predicted by the Kalman tracker
+        self.inference_scheduler = InferenceScheduler() if skip_frames else None
+        self.last_frame_skipped = False  # Whether the last processed frame skipped inference
+
         # Initialize region adaptive detector (640x480 default camera size)
         self.region_detector = RegionAdaptiveDetector(640, 480)
 
@@ -228,10 +478,50 @@ class EnhancedHandTracker:
         # Performance monitoring
         self.preprocessing_time = 0
         self.detection_time = 0
+        # time.perf_counter() when preprocessing and detection of the last frame finished,
+        # comparable with camera capture timestamps for latency tracking
+        self.preprocessed_at = 0.0
+        self.detected_at = 0.0
 
         # Gesture validation buffer
         self.gesture_buffer = deque(maxlen=5)
 
+    def _create_hands(self, model_complexity: int):
+        """Build the MediaPipe Hands graph"""
+        return self.mp_hands.Hands(
+            min_detection_confidence=0.6,  # Slightly lower for preprocessed frames
+            min_tracking_confidence=0.5,
+            max_num_hands=1,
+            model_complexity=model_complexity,
+        )
+
+    def _calibrate_model(self, detection_frame: np.ndarray) -> None:
+        """Pick the model complexity by timing each one on a real detection frame"""
+        self.model_calibration = calibrate_model_complexity(detection_frame, MODEL_COMPLEXITY_BUDGET_MS, self._create_hands)
+        save_calibration(calibration_key(self.detection_width), self.model_calibration)
+        self.model_complexity = self.model_calibration["model_complexity"]
+        self.complexity_monitor = ModelComplexityMonitor(self.model_complexity, MODEL_COMPLEXITY_BUDGET_MS)
+        self.hands = self._create_hands(self.model_complexity)
+
+    def _downgrade_model(self) -> None:
+        """Switch to the next cheaper model after live inference fell behind the budget"""
+        previous = self.model_complexity
+        live_ms = self.complexity_monitor.average_ms
+        self.model_complexity -= 1
+        print(
+            f"[Hand Tracking] {MODEL_COMPLEXITY_NAMES[previous]} model averages {live_ms:.1f}ms "
+            f"(budget {self.complexity_monitor.budget_ms:.0f}ms), switching to the {MODEL_COMPLEXITY_NAMES[self.model_complexity]} model"
+        )
+        self.hands.close()
+        self.hands = self._create_hands(self.model_complexity)
+        self.complexity_monitor.reset(self.model_complexity)
+
+        # Remember the downgrade so the next start does not begin behind
+        self.model_calibration = dict(
+            self.model_calibration, model_complexity=self.model_complexity, downgraded_from=previous, live_ms=live_ms
+        )
+        save_calibration(calibration_key(self.detection_width), self.model_calibration)
+
     def calculate_distance(self, point1: Tuple[float, float], point2: Tuple[float, float]) -> float:
         """Calculate 2D distance between two points"""
         return math.sqrt((point1[0] - point2[0]) ** 2 + (point1[1] - point2[1]) ** 2)
@@ -240,131 +530,66 @@ class EnhancedHandTracker:
         """Calculate 3D distance between two points"""
         return math.sqrt((point1[0] - point2[0]) ** 2 + (point1[1] - point2[1]) ** 2 + (point1[2] - point2[2]) ** 2)
 
-    def calculate_angle_3points(self, p1, p2, p3) -> float:
-        """Calculate angle at p2 formed by p1-p2-p3"""
-        # Convert landmarks to numpy arrays
-        a = np.array([p1.x, p1.y, p1.z])
-        b = np.array([p2.x, p2.y, p2.z])
-        c = np.array([p3.x, p3.y, p3.z])
+    def calculate_angle_3points(self, p1: np.ndarray, p2: np.ndarray, p3: np.ndarray) -> np.ndarray:
+        """Calculate angles in degrees at p2 formed by p1-p2-p3
 
+        The points are (..., 3) arrays, so any number of joints are handled in one call.
+        """
         # Calculate vectors
-        ba = a - b
-        bc = c - b
+        ba = np.subtract(p1, p2, dtype=np.float64)
+        bc = np.subtract(p3, p2, dtype=np.float64)
 
         # Calculate angle using dot product
-        cosine_angle = np.dot(ba, bc) / (np.linalg.norm(ba) * np.linalg.norm(bc))
-        angle = np.arccos(np.clip(cosine_angle, -1.0, 1.0))
-
-        return np.degrees(angle)
-
-    def calculate_finger_curl(self, mcp, pip, dip, tip) -> float:
-        """Calculate finger curl ratio (0 = straight, 1 = fully curled)"""
-        # Calculate angles at each joint
-        angle_pip = self.calculate_angle_3points(mcp, pip, dip)
-        angle_dip = self.calculate_angle_3points(pip, dip, tip)
+        cosine_angle = np.einsum("...i,...i->...", ba, bc) / (np.linalg.norm(ba, axis=-1) * np.linalg.norm(bc, axis=-1))
+        return np.degrees(np.arccos(np.clip(cosine_angle, -1.0, 1.0)))
 
-        # Normalize angles (180° = straight, 0° = fully bent)
-        curl_pip = 1.0 - (angle_pip / 180.0)
-        curl_dip = 1.0 - (angle_dip / 180.0)
+    def calculate_finger_angles(self, landmarks: np.ndarray) -> Optional[np.ndarray]:
+        """Calculate the curl of each finger in FINGER_NAMES order (0 = straight, 1 = fully curled)
 
-        # Average curl across joints
-        return (curl_pip + curl_dip) / 2.0
-
-    def calculate_finger_angles(self, hand_landmarks) -> dict:
-        """Calculate angles for all fingers"""
+        Returns None when angle detection is disabled.
+        """
         if not self.enable_angles:
-            return {}
-
-        angles = {}
-
-        # Define finger indices
-        finger_indices = {
-            "INDEX": [
-                self.mp_hands.HandLandmark.INDEX_FINGER_MCP,
-                self.mp_hands.HandLandmark.INDEX_FINGER_PIP,
-                self.mp_hands.HandLandmark.INDEX_FINGER_DIP,
-                self.mp_hands.HandLandmark.INDEX_FINGER_TIP,
-            ],
-            "MIDDLE": [
-                self.mp_hands.HandLandmark.MIDDLE_FINGER_MCP,
-                self.mp_hands.HandLandmark.MIDDLE_FINGER_PIP,
-                self.mp_hands.HandLandmark.MIDDLE_FINGER_DIP,
-                self.mp_hands.HandLandmark.MIDDLE_FINGER_TIP,
-            ],
-            "RING": [
-                self.mp_hands.HandLandmark.RING_FINGER_MCP,
-                self.mp_hands.HandLandmark.RING_FINGER_PIP,
-                self.mp_hands.HandLandmark.RING_FINGER_DIP,
-                self.mp_hands.HandLandmark.RING_FINGER_TIP,
-            ],
-            "PINKY": [
-                self.mp_hands.HandLandmark.PINKY_MCP,
-                self.mp_hands.HandLandmark.PINKY_PIP,
-                self.mp_hands.HandLandmark.PINKY_DIP,
-                self.mp_hands.HandLandmark.PINKY_TIP,
-            ],
-        }
+            return None
 
-        # Calculate curl for each finger
-        for finger_name, indices in finger_indices.items():
-            mcp = hand_landmarks.landmark[indices[0]]
-            pip = hand_landmarks.landmark[indices[1]]
-            dip = hand_landmarks.landmark[indices[2]]
-            tip = hand_landmarks.landmark[indices[3]]
+        # (finger, joint, xyz): MCP, PIP, DIP, TIP of each finger
+        joints = landmarks[FINGER_JOINTS]
 
-            angles[f"{finger_name}_curl"] = self.calculate_finger_curl(mcp, pip, dip, tip)
+        # Angles at the PIP and DIP joints of every finger at once
+        angles = self.calculate_angle_3points(joints[:, :2], joints[:, 1:3], joints[:, 2:])
 
-        return angles
+        # Normalize angles (180° = straight, 0° = fully bent) and average across joints
+        curls = 1.0 - angles / 180.0
+        return (curls[:, 0] + curls[:, 1]) / 2.0
 
-    def get_wrist_angle(self, hand_landmarks) -> float:
+    def get_wrist_angle(self, landmarks: np.ndarray) -> float:
         """Calculate the angle of the hand based on wrist and middle finger MCP"""
-        wrist = hand_landmarks.landmark[self.mp_hands.HandLandmark.WRIST]
-        middle_mcp = hand_landmarks.landmark[self.mp_hands.HandLandmark.MIDDLE_FINGER_MCP]
+        dx, dy = np.subtract(landmarks[MIDDLE_FINGER_MCP, :2], landmarks[WRIST, :2], dtype=np.float64).tolist()
 
         # Calculate angle from horizontal
-        dx = middle_mcp.x - wrist.x
-        dy = middle_mcp.y - wrist.y
-        angle = math.atan2(dy, dx) * 180 / math.pi
+        return math.atan2(dy, dx) * 180 / math.pi
 
-        return angle
-
-    def get_palm_normal(self, hand_landmarks) -> np.ndarray:
+    def get_palm_normal(self, landmarks: np.ndarray) -> np.ndarray:
         """Calculate palm normal vector using wrist, index MCP, and pinky MCP"""
-        wrist = hand_landmarks.landmark[self.mp_hands.HandLandmark.WRIST]
-        index_mcp = hand_landmarks.landmark[self.mp_hands.HandLandmark.INDEX_FINGER_MCP]
-        pinky_mcp = hand_landmarks.landmark[self.mp_hands.HandLandmark.PINKY_MCP]
-
-        # Create vectors
-        v1 = np.array([index_mcp.x - wrist.x, index_mcp.y - wrist.y, index_mcp.z - wrist.z])
-        v2 = np.array([pinky_mcp.x - wrist.x, pinky_mcp.y - wrist.y, pinky_mcp.z - wrist.z])
+        v1, v2 = np.subtract(landmarks[[INDEX_FINGER_MCP, PINKY_MCP]], landmarks[WRIST], dtype=np.float64)
 
         # Cross product gives normal
         normal = np.cross(v1, v2)
-        normal = normal / np.linalg.norm(normal)  # Normalize
+        return normal / np.linalg.norm(normal)
 
-        return normal
-
-    def is_pointing_at_camera(self, hand_landmarks) -> bool:
+    def is_pointing_at_camera(self, landmarks: np.ndarray) -> bool:
         """Check if hand is pointing toward camera using Z-coordinates"""
-        index_tip = hand_landmarks.landmark[self.mp_hands.HandLandmark.INDEX_FINGER_TIP]
-        wrist = hand_landmarks.landmark[self.mp_hands.HandLandmark.WRIST]
-
         # If index tip Z is less than wrist Z, finger is pointing at camera
-        z_diff = wrist.z - index_tip.z
+        z_diff = float(landmarks[WRIST, 2]) - float(landmarks[INDEX_FINGER_TIP, 2])
         return z_diff > 0.02
 
-    def detect_finger_gun_with_angles(self, hand_landmarks, angles: dict) -> Tuple[bool, float]:
-        """Detect finger gun using joint angles"""
-        if not angles:
+    def detect_finger_gun_with_angles(self, landmarks: np.ndarray, curls: Optional[np.ndarray]) -> Tuple[bool, float]:
+        """Detect finger gun using finger curls from calculate_finger_angles"""
+        if curls is None:
             return False, 0
 
-        # Check if index is extended
-        index_extended = angles.get("INDEX_curl", 1.0) < 0.35
-
-        # Check if other fingers are curled
-        middle_curled = angles.get("MIDDLE_curl", 0) > 0.55
-        ring_curled = angles.get("RING_curl", 0) > 0.55
-        pinky_curled = angles.get("PINKY_curl", 0) > 0.55
+        # Index extended, other fingers curled
+        index_extended = curls[0] < 0.35
+        middle_curled, ring_curled, pinky_curled = (curls[1:] > 0.55).tolist()
 
         # Calculate confidence based on how well conditions are met
         confidence = 0
@@ -378,9 +603,7 @@ class EnhancedHandTracker:
             confidence += 0.2
 
         # Check thumb position (should be up or to the side)
-        thumb_tip = hand_landmarks.landmark[self.mp_hands.HandLandmark.THUMB_TIP]
-        thumb_ip = hand_landmarks.landmark[self.mp_hands.HandLandmark.THUMB_IP]
-        thumb_up = thumb_tip.y < thumb_ip.y
+        thumb_up = landmarks[THUMB_TIP, 1] < landmarks[THUMB_IP, 1]
         if thumb_up:
             confidence += 0.1
 
@@ -388,77 +611,61 @@ class EnhancedHandTracker:
 
     def detect_finger_gun(
         self, hand_landmarks, frame_width: int, frame_height: int
-    ) -> Tuple[bool, Optional[Tuple[int, int]], Optional[object], Optional[object], Optional[float], float]:
-        """Enhanced finger gun detection with region-adaptive parameters"""
+    ) -> Tuple[bool, Optional[Tuple[int, int]], Optional[np.ndarray], Optional[np.ndarray], Optional[float], float]:
+        """Enhanced finger gun detection with region-adaptive parameters
+
+        Args:
+            hand_landmarks: NormalizedLandmarkList or (21, 3) landmark array; lists are
+                converted to an array once and all geometry runs on the array
+            frame_width, frame_height: Camera resolution the index tip is mapped to
+
+        Returns:
+            (is_gun, index_coords, thumb_tip, middle_pip, thumb_middle_dist, confidence), where
+            thumb_tip and middle_pip are (x, y, z) rows of the landmark array
+        """
         if hand_landmarks is None:
             return False, None, None, None, None, 0
+        landmarks = as_landmark_array(hand_landmarks)
 
         # Get hand position category and adaptive parameters
-        position_category = self.region_detector.get_hand_position_category(hand_landmarks)
-        adaptive_params = self.region_detector.get_adaptive_thresholds(position_category)
-        position_hints = self.region_detector.adjust_detection_for_problem_zone(hand_landmarks)
+        position_category = self.region_detector.get_hand_position_category(landmarks)
+        close_thresholds, index_wrist_threshold, min_confidence = SCALED_THRESHOLDS[position_category]
+        position_hints = self.region_detector.adjust_detection_for_problem_zone(landmarks)
 
         # Store for debug display
         self.last_position_category = position_category
         self.last_position_hints = position_hints
 
-        # Get all necessary landmarks
-        thumb_tip = hand_landmarks.landmark[self.mp_hands.HandLandmark.THUMB_TIP]
-        index_tip = hand_landmarks.landmark[self.mp_hands.HandLandmark.INDEX_FINGER_TIP]
-        middle_tip = hand_landmarks.landmark[self.mp_hands.HandLandmark.MIDDLE_FINGER_TIP]
-        ring_tip = hand_landmarks.landmark[self.mp_hands.HandLandmark.RING_FINGER_TIP]
-        pinky_tip = hand_landmarks.landmark[self.mp_hands.HandLandmark.PINKY_TIP]
-        wrist = hand_landmarks.landmark[self.mp_hands.HandLandmark.WRIST]
-        middle_pip = hand_landmarks.landmark[self.mp_hands.HandLandmark.MIDDLE_FINGER_PIP]
-        index_mcp = hand_landmarks.landmark[self.mp_hands.HandLandmark.INDEX_FINGER_MCP]
-
         # Calculate finger angles if enabled
-        angles = self.calculate_finger_angles(hand_landmarks)
+        curls = self.calculate_finger_angles(landmarks)
 
         # Method 1: Standard detection
-        thumb_index_dist = self.calculate_distance((thumb_tip.x, thumb_tip.y), (index_tip.x, index_tip.y))
-        middle_ring_dist = self.calculate_distance((middle_tip.x, middle_tip.y), (ring_tip.x, ring_tip.y))
-        ring_pinky_dist = self.calculate_distance((ring_tip.x, ring_tip.y), (pinky_tip.x, pinky_tip.y))
-        index_wrist_dist = self.calculate_distance((index_tip.x, index_tip.y), (wrist.x, wrist.y))
-        thumb_middle_dist = self.calculate_distance((thumb_tip.x, thumb_tip.y), (middle_pip.x, middle_pip.y))
-
-        # Apply adaptive multipliers to thresholds
-        scaled_thumb_index = (THUMB_INDEX_THRESHOLD / 100.0) * adaptive_params["thumb_index_multiplier"]
-        scaled_middle_ring = (MIDDLE_RING_THRESHOLD / 100.0) * adaptive_params["middle_ring_multiplier"]
-        scaled_ring_pinky = (RING_PINKY_THRESHOLD / 100.0) * adaptive_params["ring_pinky_multiplier"]
-        scaled_index_wrist = (INDEX_WRIST_THRESHOLD / 100.0) * adaptive_params["index_wrist_multiplier"]
-
-        standard_checks = {
-            "thumb_near_index": thumb_index_dist < scaled_thumb_index,
-            "middle_ring_close": middle_ring_dist < scaled_middle_ring,
-            "ring_pinky_close": ring_pinky_dist < scaled_ring_pinky,
-            "index_extended": index_wrist_dist > scaled_index_wrist,
-        }
+        pairs = landmarks[DISTANCE_PAIRS, :2]
+        distances = np.linalg.norm(np.subtract(pairs[:, 0], pairs[:, 1], dtype=np.float64), axis=1)
+        middle_ring_dist = float(distances[1])
+        index_wrist_dist, thumb_middle_dist, index_length = distances[3:].tolist()
+
+        # Thumb near index, middle and ring close, ring and pinky close; index extended
+        close_checks = distances[:3] < close_thresholds
+        checks_passed = int(close_checks.sum()) + (index_wrist_dist > index_wrist_threshold)
+        standard_score = checks_passed / 4
 
         # In problem zone, don't require all checks
-        if position_category == "problem_zone":
-            # Count how many checks pass
-            checks_passed = sum(standard_checks.values())
+        if position_category == "problem_zone" and checks_passed >= 3:
             # Need at least 3 out of 4 in problem zone
-            standard_score = checks_passed / len(standard_checks)
-            if checks_passed >= 3:
-                standard_score = max(standard_score, 0.75)  # Boost score if most checks pass
-        else:
-            standard_score = sum(standard_checks.values()) / len(standard_checks)
+            standard_score = max(standard_score, 0.75)  # Boost score if most checks pass
 
         # Method 2: Angle-based detection
         angle_detected = False
         angle_confidence = 0
-        if self.enable_angles and angles:
-            angle_detected, angle_confidence = self.detect_finger_gun_with_angles(hand_landmarks, angles)
+        if curls is not None:
+            angle_detected, angle_confidence = self.detect_finger_gun_with_angles(landmarks, curls)
 
         # Method 3: Enhanced detection methods
-        wrist_angle = self.get_wrist_angle(hand_landmarks)
-        pointing_forward = self.is_pointing_at_camera(hand_landmarks)
+        wrist_angle = self.get_wrist_angle(landmarks)
+        pointing_forward = self.is_pointing_at_camera(landmarks)
 
         # Method 4: Index finger extension check
-        index_vector = np.array([index_tip.x - index_mcp.x, index_tip.y - index_mcp.y])
-        index_length = np.linalg.norm(index_vector)
         index_extended_alt = index_length > 0.12
 
         # Combine detection methods with improved logic
@@ -473,7 +680,7 @@ class EnhancedHandTracker:
             )
 
             # Lower thresholds for problem zone
-            if region_confidence > adaptive_params["min_confidence"]:
+            if region_confidence > min_confidence:
                 self.detection_mode = f"region_{position_category}"
                 self.confidence_score = region_confidence
                 is_gun = True
@@ -492,7 +699,7 @@ class EnhancedHandTracker:
         elif standard_score >= 0.6:  # Lower threshold for standard method
             self.detection_mode = "standard"
             self.confidence_score = standard_score
-            is_gun = all(standard_checks.values())
+            is_gun = checks_passed == 4
             final_confidence = standard_score
         elif standard_score >= 0.3:  # Much lower threshold for partial detection
             if pointing_forward and index_extended_alt:
@@ -503,7 +710,7 @@ class EnhancedHandTracker:
             elif abs(wrist_angle) < 75 and index_extended_alt:
                 self.detection_mode = "wrist_angle"
                 self.confidence_score = 0.6
-                is_gun = middle_ring_dist < scaled_middle_ring * 2.5
+                is_gun = middle_ring_dist < close_thresholds[1] * 2.5
                 final_confidence = 0.6
             elif angle_confidence > 0.5:  # Use angles as fallback
                 self.detection_mode = "angles_fallback"
@@ -551,20 +758,33 @@ class EnhancedHandTracker:
                 final_confidence = avg_confidence * 0.5
 
         if is_gun:
-            index_coords = (int(index_tip.x * frame_width), int(index_tip.y * frame_height))
-            return True, index_coords, thumb_tip, middle_pip, thumb_middle_dist, final_confidence
+            index_x, index_y = landmarks[INDEX_FINGER_TIP, :2].tolist()
+            index_coords = (int(index_x * frame_width), int(index_y * frame_height))
+            return True, index_coords, landmarks[THUMB_TIP], landmarks[MIDDLE_FINGER_PIP], thumb_middle_dist, final_confidence
         else:
             return False, None, None, None, None, final_confidence
 
-    def detect_shooting_gesture(self, thumb_tip, thumb_middle_dist: float) -> bool:
-        """Detect shooting gesture (thumb flick) - requires thumb reset between shots"""
-        current_time = time.time()
-        current_thumb_y = thumb_tip.y
+    def detect_shooting_gesture(self, thumb_tip, thumb_middle_dist: float, state=None, now: Optional[float] = None) -> bool:
+        """Detect shooting gesture (thumb flick) - requires thumb reset between shots
+
+        Args:
+            thumb_tip: Thumb tip (x, y, z) as returned by detect_finger_gun
+            thumb_middle_dist: Distance between thumb tip and middle finger PIP
+            state: Object holding the shot state (previous_thumb_y, previous_time, thumb_reset,
+                shooting_detected, last_shoot_time); defaults to the tracker itself
+            now: Capture timestamp of the frame in seconds (defaults to time.time()); the game
+                passes each frame's capture time and replays pass the recorded ones, so
+                thumb velocity follows capture spacing rather than processing jitter
+        """
+        if state is None:
+            state = self
+        current_time = time.time() if now is None else now
+        current_thumb_y = float(thumb_tip[1])
 
-        if self.previous_thumb_y is not None:
-            delta_time = current_time - self.previous_time
+        if state.previous_thumb_y is not None:
+            delta_time = current_time - state.previous_time
             if delta_time != 0:
-                thumb_velocity = (current_thumb_y - self.previous_thumb_y) / delta_time
+                thumb_velocity = (current_thumb_y - state.previous_thumb_y) / delta_time
             else:
                 thumb_velocity = 0
 
@@ -577,45 +797,47 @@ class EnhancedHandTracker:
             reset_distance_threshold = distance_threshold * 2.5
 
             if thumb_velocity < reset_velocity_threshold or thumb_middle_dist > reset_distance_threshold:
-                if current_time - self.last_shoot_time > 0.1:
-                    self.thumb_reset = True
-                    self.shooting_detected = False
+                if current_time - state.last_shoot_time > 0.1:
+                    state.thumb_reset = True
+                    state.shooting_detected = False
 
             # Detect shooting only if thumb was reset
             if thumb_velocity > velocity_threshold and thumb_middle_dist < distance_threshold:
-                if self.thumb_reset and not self.shooting_detected and delta_time > 0.02:
-                    self.shooting_detected = True
-                    self.thumb_reset = False
-                    self.last_shoot_time = current_time
-                    self.previous_thumb_y = current_thumb_y
-                    self.previous_time = current_time
+                if state.thumb_reset and not state.shooting_detected and delta_time > 0.02:
+                    state.shooting_detected = True
+                    state.thumb_reset = False
+                    state.last_shoot_time = current_time
+                    state.previous_thumb_y = current_thumb_y
+                    state.previous_time = current_time
                     return True
 
-        self.previous_thumb_y = current_thumb_y
-        self.previous_time = current_time
+        state.previous_thumb_y = current_thumb_y
+        state.previous_time = current_time
         return False
 
-    def process_frame(self, frame: np.ndarray, debug_mode: bool = False) -> Tuple[np.ndarray, Optional[object], dict]:
-        """Process frame for hand detection with optional preprocessing
+    def detect_landmarks(self, frame: np.ndarray) -> Tuple[np.ndarray, Optional[object]]:
+        """Run preprocessing and MediaPipe hand detection on a frame
 
         Args:
-            frame: Input frame
-            debug_mode: If True, return preprocessed frame for display
+            frame: Unmirrored RGB frame, as delivered by CameraManager.read_rgb_frame
+
+        Returns:
+            Tuple of (detection_frame, results) where detection_frame is the frame fed to MediaPipe
+            (downscaled to detection_width). The landmarks in results are normalized, so they
+            apply unchanged to the full-resolution frame, and mirrored to the selfie view the
+            game is played in.
         """
         start_time = time.time()
 
-        # Only copy frame if we need both versions
-        if self.enable_preprocessing and not debug_mode:
-            original_frame = frame.copy()
-        else:
-            original_frame = frame
+        # Downscale once; preprocessing and MediaPipe both work on the small frame
+        frame = self._downscale_for_detection(frame)
 
         # Apply preprocessing if enabled
         if self.enable_preprocessing and self.preprocessor:
             # Get hand ROI from previous frame if available
             hand_roi = None
             if hasattr(self, "last_hand_landmarks") and self.last_hand_landmarks:
-                hand_roi = self.preprocessor.get_hand_roi(self.last_hand_landmarks, frame.shape)
+                hand_roi = self.preprocessor.get_hand_roi(self.last_hand_landmarks, frame.shape, mirrored=True)
 
             # Preprocess frame
             preprocessed_frame = self.preprocessor.preprocess_frame(frame, hand_roi)
@@ -626,42 +848,67 @@ class EnhancedHandTracker:
         else:
             detection_frame = frame
             self.preprocessing_time = 0
+        self.preprocessed_at = time.perf_counter()
+
+        if self.hands is None and self.load_model:
+            self._calibrate_model(detection_frame)
 
-        # Convert preprocessed frame to RGB for detection
+        # Frames are RGB already, so MediaPipe reads the detection frame directly
         detection_start = time.time()
-        detection_rgb = cv2.cvtColor(detection_frame, cv2.COLOR_BGR2RGB)
-        detection_rgb.flags.writeable = False
-        results = self.hands.process(detection_rgb)
+        results = self.hands.process(detection_frame)
+        if results.multi_hand_landmarks:
+            for hand_landmarks in results.multi_hand_landmarks:
+                mirror_landmarks(hand_landmarks)
+        self.detection_time = (time.time() - detection_start) * 1000  # ms
+        self.detected_at = time.perf_counter()
 
-        # Choose which frame to return for display
-        if debug_mode and self.enable_preprocessing:
-            # In debug mode, show the preprocessed frame
-            display_frame = detection_frame
-        else:
-            # Normal mode, show original frame
-            display_frame = original_frame
+        if self.complexity_monitor and self.complexity_monitor.record(self.detection_time):
+            self._downgrade_model()
 
-        # Convert chosen frame for display
-        image = cv2.cvtColor(display_frame, cv2.COLOR_BGR2RGB)
-        image.flags.writeable = True
-        image = cv2.cvtColor(image, cv2.COLOR_RGB2BGR)
-        self.detection_time = (time.time() - detection_start) * 1000  # ms
+        return detection_frame, results
 
-        # Apply Kalman filtering if enabled
+    def _downscale_for_detection(self, frame: np.ndarray) -> np.ndarray:
+        """Resize a frame to detection_width into a reused buffer (frames no wider pass through)"""
+        frame_h, frame_w = frame.shape[:2]
+        if self.detection_width is None or frame_w <= self.detection_width:
+            return frame
+
+        size = (self.detection_width, int(round(frame_h * self.detection_width / frame_w)))
+        if self._detection_buffer is None or self._detection_buffer.shape[1::-1] != size:
+            self._detection_buffer = np.empty((size[1], size[0], 3), dtype=np.uint8)
+        cv2.resize(frame, size, dst=self._detection_buffer, interpolation=cv2.INTER_AREA)
+        return self._detection_buffer
+
+    def apply_temporal_filter(self, results, capture_timestamp: Optional[float] = None) -> None:
+        """Smooth detected landmarks with the Kalman tracker, or predict them while the hand is lost
+
+        Updates results.multi_hand_landmarks in place and records last_hand_landmarks.
+        capture_timestamp (time.perf_counter() at capture) sets the filter's time step; without
+        it the filter assumes a steady 30 FPS.
+        """
         if results.multi_hand_landmarks and self.enable_kalman and self.kalman_tracker:
             # Apply Kalman filtering to smooth landmarks
             for i, hand_landmarks in enumerate(results.multi_hand_landmarks):
                 smoothed_landmarks = self.kalman_tracker.adaptive_update(
-                    hand_landmarks, self.confidence_score, self.detection_mode
+                    hand_landmarks, self.confidence_score, self.detection_mode, capture_timestamp
                 )
                 results.multi_hand_landmarks[i] = smoothed_landmarks
             self.last_hand_landmarks = results.multi_hand_landmarks[0]
-        elif results.multi_hand_landmarks:
+            if self.inference_scheduler:
+                self.inference_scheduler.update_stability(
+                    self.kalman_tracker.tracking_confidence, self.kalman_tracker.filter.velocity
+                )
+            return
+
+        # Frames are only skipped while the Kalman tracker follows a steady hand
+        if self.inference_scheduler:
+            self.inference_scheduler.update_stability(0.0, None)
+        if results.multi_hand_landmarks:
             self.last_hand_landmarks = results.multi_hand_landmarks[0]
         else:
             # Try to predict landmarks if Kalman is enabled and hand was recently lost
             if self.enable_kalman and self.kalman_tracker:
-                predicted_landmarks = self.kalman_tracker.predict_landmarks()
+                predicted_landmarks = self.kalman_tracker.predict_landmarks(capture_timestamp)
                 if predicted_landmarks:
                     # Create a results-like structure with predicted landmarks
                     if not results.multi_hand_landmarks:
@@ -673,22 +920,92 @@ class EnhancedHandTracker:
             else:
                 self.last_hand_landmarks = None
 
-        # Performance stats
-        stats = {
+    def predict_skipped_frame(self, capture_timestamp: Optional[float] = None):
+        """Results for a frame the inference scheduler skipped: the tracked hand moved on by the Kalman tracker"""
+        predicted_landmarks = None
+        if self.enable_kalman and self.kalman_tracker:
+            predicted_landmarks = self.kalman_tracker.predict_skipped_frame(capture_timestamp)
+        self.last_hand_landmarks = predicted_landmarks
+        return SimpleNamespace(multi_hand_landmarks=[predicted_landmarks] if predicted_landmarks else None)
+
+    def get_tracking_stats(self, total_ms: float) -> dict:
+        """Collect performance and detection statistics for the debug overlay"""
+        return {
             "preprocessing_ms": self.preprocessing_time,
+            "preprocess_pixel_ratio": self.preprocessor.last_pixel_ratio if self.preprocessor else 0.0,
+            "preprocess_tier": self.preprocessor.last_tier if self.preprocessor else "none",
             "detection_ms": self.detection_time,
-            "total_ms": (time.time() - start_time) * 1000,
+            "total_ms": total_ms,
             "detection_mode": self.detection_mode,
             "confidence": self.confidence_score,
             "kalman_active": self.enable_kalman and self.kalman_tracker is not None,
             "kalman_tracking_confidence": self.kalman_tracker.tracking_confidence if self.kalman_tracker else 0,
+            "model_complexity": self.model_complexity,
+            "inference_fps": self.inference_scheduler.inference_fps if self.inference_scheduler else 0.0,
+            "inference_stride": self.inference_scheduler.stride if self.inference_scheduler else 1,
+            "skipped_frames": self.inference_scheduler.skipped_frames if self.inference_scheduler else 0,
         }
 
+    def process_frame(
+        self,
+        frame: np.ndarray,
+        debug_mode: bool = False,
+        capture_timestamp: Optional[float] = None,
+        mirror: bool = True,
+    ) -> Tuple[np.ndarray, Optional[object], dict]:
+        """Process frame for hand detection with optional preprocessing
+
+        Args:
+            frame: Unmirrored RGB frame (read-only; it is never modified)
+            debug_mode: If True, return preprocessed frame for display
+            capture_timestamp: When the frame was captured, for the Kalman filter's time step
+            mirror: Return a mirrored, full-resolution copy to draw overlays on. With False the
+                display frame is returned as is (unmirrored, read-only, and at detection size in
+                debug mode) for previews that mirror and draw overlays after downscaling
+
+        Returns:
+            Tuple of (image, results, stats)
+        """
+        start_time = time.time()
+
+        self.last_frame_skipped = self.inference_scheduler is not None and not self.inference_scheduler.should_infer(frame)
+        if self.last_frame_skipped:
+            # Steady hand: the Kalman tracker stands in for inference on this frame
+            image = cv2.flip(frame, 1) if mirror else frame
+            results = self.predict_skipped_frame(capture_timestamp)
+            return image, results, self.get_tracking_stats((time.time() - start_time) * 1000)
+
+        detection_frame, results = self.detect_landmarks(frame)
+        if self.inference_scheduler:
+            landmarks = landmarks_to_array(results.multi_hand_landmarks[0]) if results.multi_hand_landmarks else None
+            self.inference_scheduler.record_inference(frame, landmarks, capture_timestamp)
+
+        # Choose which frame to return for display
+        if debug_mode and self.enable_preprocessing:
+            # In debug mode, show the preprocessed frame (scaled back up if detection is downscaled)
+            display_frame = detection_frame
+            if mirror and display_frame.shape != frame.shape:
+                display_frame = cv2.resize(display_frame, (frame.shape[1], frame.shape[0]))
+        else:
+            # Normal mode, show original frame
+            display_frame = frame
+
+        # The overlay buffer needs a writable copy anyway; mirroring while copying is free
+        image = cv2.flip(display_frame, 1) if mirror else display_frame
+
+        # Apply Kalman filtering if enabled
+        self.apply_temporal_filter(results, capture_timestamp)
+
+        # Performance stats
+        stats = self.get_tracking_stats((time.time() - start_time) * 1000)
+
         return image, results, stats
 
     def draw_landmarks(self, image: np.ndarray, hand_landmarks) -> None:
-        """Draw hand landmarks on image"""
-        self.mp_drawing.draw_landmarks(image, hand_landmarks, self.mp_hands.HAND_CONNECTIONS)
+        """Draw hand landmarks on a mirrored RGB image"""
+        self.mp_drawing.draw_landmarks(
+            image, hand_landmarks, self.mp_hands.HAND_CONNECTIONS, landmark_drawing_spec=LANDMARK_DRAWING_SPEC
+        )
 
     def reset_tracking_state(self) -> None:
         """Reset tracking state when hand is lost"""
@@ -702,3 +1019,5 @@ class EnhancedHandTracker:
         self.last_hand_landmarks = None
         if self.kalman_tracker:
             self.kalman_tracker.reset()
+        if self.inference_scheduler:
+            self.inference_scheduler.update_stability(0.0, None)
@@ -0,0 +1,169 @@
+"""
+Confidence-gated inference scheduling
+
+While the hand is held steady and tracked with high confidence, running preprocessing
+and MediaPipe on every camera frame buys little: the Kalman filter predicts the skipped
+frames almost exactly. The scheduler then runs real inference on every Nth frame only.
+Two checks bring back every-frame inference. The game side drops the stride to 1 as soon
+as tracking confidence falls or the Kalman thumb or hand velocity rises. The frame side
+compares a tiny grayscale patch of the hand region with the last inferred frame, so a
+thumb flick that starts between inferences is inferred on the very next frame.
+"""
+
+# Standard library imports
+import time
+from collections import deque
+from typing import Optional
+
+# Third-party imports
+import cv2
+import numpy as np
+
+try:
+    # Local application imports
+    from utils.constants import (
+        INFERENCE_SKIP_MAX_HAND_SPEED,
+        INFERENCE_SKIP_MAX_THUMB_SPEED,
+        INFERENCE_SKIP_MIN_CONFIDENCE,
+        INFERENCE_SKIP_MOTION_THRESHOLD,
+        INFERENCE_SKIP_STRIDE,
+    )
+except ImportError:
+    # Fallback constants if not in proper package structure
+    INFERENCE_SKIP_MAX_HAND_SPEED = 0.15
+    INFERENCE_SKIP_MAX_THUMB_SPEED = 0.05
+    INFERENCE_SKIP_MIN_CONFIDENCE = 0.7
+    INFERENCE_SKIP_MOTION_THRESHOLD = 12.0
+    INFERENCE_SKIP_STRIDE = 3
+
+try:
+    from .landmark_arrays import THUMB_TIP
+except ImportError:
+    # Third-party imports
+    from landmark_arrays import THUMB_TIP
+
+PATCH_SIZE = (12, 12)  # Grayscale cells the hand region is averaged into for the motion check
+HAND_BOX_PADDING = 0.05  # Normalized padding around the landmarks' bounding box
+MOTION_HOLD_FRAMES = 6  # Frames inferred at full rate after the motion check fires (a flick and its reset)
+RATE_WINDOW = 30  # Inferred frames the effective inference rate is averaged over
+
+
+class InferenceScheduler:
+    """Decides per camera frame whether to run hand inference or let the Kalman filter predict it"""
+
+    def __init__(
+        self,
+        max_stride: int = INFERENCE_SKIP_STRIDE,
+        min_confidence: float = INFERENCE_SKIP_MIN_CONFIDENCE,
+        max_thumb_speed: float = INFERENCE_SKIP_MAX_THUMB_SPEED,
+        max_hand_speed: float = INFERENCE_SKIP_MAX_HAND_SPEED,
+        motion_threshold: float = INFERENCE_SKIP_MOTION_THRESHOLD,
+    ):
+        """
+        Args:
+            max_stride: Run inference on every Nth frame while the hand is steady
+            min_confidence: Kalman tracking confidence needed to skip frames
+            max_thumb_speed: Vertical thumb tip speed (normalized units per second) above
+                which every frame is inferred, so shot detection sees the whole flick
+            max_hand_speed: Fastest landmark speed (normalized units per second) that still
+                counts as a steady hand
+            motion_threshold: Largest change of a hand patch cell (0-255 luma) tolerated
+                on a skipped frame
+        """
+        self.max_stride = max_stride
+        self.min_confidence = min_confidence
+        self.max_thumb_speed = max_thumb_speed
+        self.max_hand_speed = max_hand_speed
+        self.motion_threshold = motion_threshold
+
+        self.stride = 1  # Infer every Nth frame; 1 while the hand is moving, uncertain or lost
+        self.inferred_frames = 0
+        self.skipped_frames = 0
+        self._frames_since_inference = 0
+        self._motion_hold = 0
+        self._hand_box = None  # Normalized (x_min, y_min, x_max, y_max) in the unmirrored frame
+        self._reference = np.empty((PATCH_SIZE[1], PATCH_SIZE[0]), dtype=np.uint8)
+        self._patch = np.empty_like(self._reference)
+        self._inference_times = deque(maxlen=RATE_WINDOW)
+
+    def update_stability(self, tracking_confidence: float, landmark_velocity: Optional[np.ndarray]) -> int:
+        """Set the stride from the Kalman tracker after a measured frame (game side)
+
+        Args:
+            tracking_confidence: HandKalmanTracker.tracking_confidence
+            landmark_velocity: (21, 3) Kalman landmark velocities, or None without a tracked hand
+
+        Returns:
+            The new stride
+        """
+        steady = False
+        if landmark_velocity is not None and tracking_confidence >= self.min_confidence:
+            thumb_speed = abs(float(landmark_velocity[THUMB_TIP, 1]))  # The flick is vertical
+            hand_speed = float(np.hypot(landmark_velocity[:, 0], landmark_velocity[:, 1]).max())
+            steady = thumb_speed < self.max_thumb_speed and hand_speed < self.max_hand_speed
+        self.stride = self.max_stride if steady else 1
+        return self.stride
+
+    def should_infer(self, frame: np.ndarray) -> bool:
+        """Whether to run inference on this unmirrored RGB frame (frame side)"""
+        if self._motion_hold > 0:
+            self._motion_hold -= 1
+            return True
+        if self.stride <= 1 or self._hand_box is None or self._frames_since_inference + 1 >= self.stride:
+            return True
+        if self._hand_moved(frame):
+            self._motion_hold = MOTION_HOLD_FRAMES
+            return True
+
+        self._frames_since_inference += 1
+        self.skipped_frames += 1
+        return False
+
+    def record_inference(self, frame: np.ndarray, landmarks: Optional[np.ndarray], timestamp: Optional[float] = None) -> None:
+        """Note that inference ran on frame
+
+        Args:
+            frame: The unmirrored RGB frame inference ran on
+            landmarks: (21, 3) mirrored, normalized landmarks that were detected, or None
+            timestamp: Capture time of the frame (time.perf_counter)
+        """
+        self.inferred_frames += 1
+        self._frames_since_inference = 0
+        self._inference_times.append(time.perf_counter() if timestamp is None else timestamp)
+
+        if landmarks is None:
+            self._hand_box = None
+            return
+        # Landmarks are mirrored to the selfie view; the frame is not
+        x_min = 1.0 - float(landmarks[:, 0].max()) - HAND_BOX_PADDING
+        x_max = 1.0 - float(landmarks[:, 0].min()) + HAND_BOX_PADDING
+        y_min = float(landmarks[:, 1].min()) - HAND_BOX_PADDING
+        y_max = float(landmarks[:, 1].max()) + HAND_BOX_PADDING
+        self._hand_box = (max(x_min, 0.0), max(y_min, 0.0), min(x_max, 1.0), min(y_max, 1.0))
+        if not self._hand_patch(frame, self._reference):
+            self._hand_box = None
+
+    def _hand_patch(self, frame: np.ndarray, out: np.ndarray) -> bool:
+        """Average the hand region of frame into out; False if the region is empty"""
+        frame_h, frame_w = frame.shape[:2]
+        x_min, y_min, x_max, y_max = self._hand_box
+        region = frame[int(y_min * frame_h) : int(y_max * frame_h), int(x_min * frame_w) : int(x_max * frame_w)]
+        if region.shape[0] < PATCH_SIZE[1] or region.shape[1] < PATCH_SIZE[0]:
+            return False
+        gray = cv2.cvtColor(region, cv2.COLOR_RGB2GRAY)
+        cv2.resize(gray, PATCH_SIZE, dst=out, interpolation=cv2.INTER_AREA)
+        return True
+
+    def _hand_moved(self, frame: np.ndarray) -> bool:
+        """Whether any cell of the hand region changed since the last inferred frame"""
+        if not self._hand_patch(frame, self._patch):
+            return True
+        return int(cv2.absdiff(self._patch, self._reference).max()) > self.motion_threshold
+
+    @property
+    def inference_fps(self) -> float:
+        """Effective inference rate over the last RATE_WINDOW inferred frames"""
+        if len(self._inference_times) < 2:
+            return 0.0
+        elapsed = self._inference_times[-1] - self._inference_times[0]
+        return (len(self._inference_times) - 1) / elapsed if elapsed > 0 else 0.0
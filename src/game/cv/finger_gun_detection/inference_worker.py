@@ -0,0 +1,527 @@
+"""
+Out-of-process hand inference with shared-memory frame transport
+
+The capture side writes every (RGB) camera frame into a SharedFrameRing. A worker process
+reads the newest frame, runs preprocessing and MediaPipe Hands, and publishes the raw
+landmark arrays plus timing stats into a SharedResultBlock. The render loop only ever
+polls the newest result, so inference time no longer comes out of the frame budget.
+"""
+
+# Standard library imports
+import multiprocessing
+import signal
+import sys
+import time
+from multiprocessing import shared_memory
+from typing import Callable, Optional, Tuple
+
+# Third-party imports
+import numpy as np
+
+from .landmark_arrays import NUM_HAND_LANDMARKS
+from .preprocessing_governor import PREPROCESS_TIERS
+
+# Maximum hands reported by the worker (the game tracks a single hand)
+MAX_HANDS = 1
+
+# Result block metadata layout (float64 slots)
+_RESULT_COUNTER = 0  # Seqlock counter: odd while the worker is writing
+_RESULT_FRAME_SEQUENCE = 1
+_RESULT_CAPTURE_TIMESTAMP = 2
+_RESULT_HAND_COUNT = 3
+_RESULT_PREPROCESSING_MS = 4
+_RESULT_DETECTION_MS = 5
+_RESULT_TOTAL_MS = 6
+_RESULT_PREPROCESSED_AT = 7
+_RESULT_DETECTED_AT = 8
+_RESULT_PREPROCESS_PIXEL_RATIO = 9
+_RESULT_PREPROCESS_TIER = 10  # Index into PREPROCESS_TIERS
+_RESULT_SKIPPED = 11  # 1 if the scheduler skipped inference on this frame (no landmarks)
+_RESULT_INFERENCE_FPS = 12
+_RESULT_SKIPPED_FRAMES = 13
+_RESULT_MODEL_COMPLEXITY = 14  # -1 until the worker has picked a model
+_RESULT_META_SIZE = 15
+
+# Seqlock read attempts (yielding between them) before falling back to the last good result
+_RESULT_READ_RETRIES = 8
+
+
+class SharedFrameRing:
+    """Fixed-size ring of camera frames in shared memory
+
+    Each slot carries the frame's sequence number and capture timestamp. A slot's
+    sequence is set to -1 while it is being written, so readers can detect torn frames.
+    """
+
+    def __init__(self, frame_shape: Tuple[int, int, int], slots: int = 4, name: Optional[str] = None):
+        self.frame_shape = tuple(frame_shape)
+        self.slots = slots
+        meta_bytes = slots * 2 * 8
+        frame_bytes = int(np.prod(self.frame_shape))
+
+        if name is None:
+            self.shm = shared_memory.SharedMemory(create=True, size=meta_bytes + slots * frame_bytes)
+            self.owner = True
+        else:
+            self.shm = shared_memory.SharedMemory(name=name)
+            self.owner = False
+
+        self._meta = np.ndarray((slots, 2), dtype=np.float64, buffer=self.shm.buf)
+        self._frames = np.ndarray((slots,) + self.frame_shape, dtype=np.uint8, buffer=self.shm.buf, offset=meta_bytes)
+        if self.owner:
+            self._meta[:] = 0
+
+    @property
+    def name(self) -> str:
+        return self.shm.name
+
+    def write(self, frame: np.ndarray, sequence: int, timestamp: float) -> bool:
+        """Copy a frame into the ring; returns False if the frame does not fit the ring"""
+        if frame.shape != self.frame_shape:
+            return False
+        slot = sequence % self.slots
+        self._meta[slot, 0] = -1  # Mark slot as being written
+        np.copyto(self._frames[slot], frame)
+        self._meta[slot, 1] = timestamp
+        self._meta[slot, 0] = sequence
+        return True
+
+    def latest_sequence(self) -> int:
+        """Sequence number of the newest complete frame in the ring"""
+        return int(self._meta[:, 0].max())
+
+    def read_latest(self, out: np.ndarray, newer_than: int = 0) -> Optional[Tuple[int, float]]:
+        """Copy the newest frame into out if it is newer than newer_than
+
+        Returns (sequence, capture_timestamp), or None if there is no newer complete frame.
+        """
+        slot = int(self._meta[:, 0].argmax())
+        sequence = int(self._meta[slot, 0])
+        if sequence <= newer_than:
+            return None
+        timestamp = float(self._meta[slot, 1])
+        np.copyto(out, self._frames[slot])
+
+        # The writer may have lapped the ring while we were copying
+        if int(self._meta[slot, 0]) != sequence:
+            return None
+        return sequence, timestamp
+
+    def close(self) -> None:
+        """Detach from (and, for the owner, destroy) the shared memory block"""
+        del self._meta, self._frames
+        self.shm.close()
+        if self.owner:
+            self.shm.unlink()
+
+
+class InferenceResult:
+    """Landmarks and timings produced by the worker for one frame"""
+
+    def __init__(
+        self,
+        frame_sequence: int,
+        capture_timestamp: float,
+        landmarks: np.ndarray,
+        preprocessing_ms: float,
+        detection_ms: float,
+        total_ms: float,
+        preprocessed_at: float = 0.0,
+        detected_at: float = 0.0,
+        preprocess_pixel_ratio: float = 1.0,
+        preprocess_tier: str = "full",
+        skipped: bool = False,
+        inference_fps: float = 0.0,
+        skipped_frames: int = 0,
+        model_complexity: Optional[int] = None,
+    ):
+        self.frame_sequence = frame_sequence
+        self.capture_timestamp = capture_timestamp
+        self.landmarks = landmarks  # (hand_count, 21, 3) float32
+        self.preprocessing_ms = preprocessing_ms
+        self.detection_ms = detection_ms
+        self.total_ms = total_ms
+        # time.perf_counter() in the worker when preprocessing/detection finished; the
+        # clock is system-wide, so these compare directly with capture_timestamp
+        self.preprocessed_at = preprocessed_at
+        self.detected_at = detected_at
+        self.preprocess_pixel_ratio = preprocess_pixel_ratio  # Fraction of the frame preprocessed
+        self.preprocess_tier = preprocess_tier
+        # Skipped frames carry no landmarks; the game predicts them with its Kalman tracker
+        self.skipped = skipped
+        self.inference_fps = inference_fps  # Frames per second that actually ran inference
+        self.skipped_frames = skipped_frames  # Frames skipped since the worker started
+        self.model_complexity = model_complexity  # MediaPipe Hands model the worker runs
+
+
+class SharedResultBlock:
+    """Single-slot, seqlock-protected inference result in shared memory"""
+
+    def __init__(self, name: Optional[str] = None):
+        meta_bytes = _RESULT_META_SIZE * 8
+        landmark_bytes = MAX_HANDS * NUM_HAND_LANDMARKS * 3 * 4
+
+        if name is None:
+            self.shm = shared_memory.SharedMemory(create=True, size=meta_bytes + landmark_bytes)
+            self.owner = True
+        else:
+            self.shm = shared_memory.SharedMemory(name=name)
+            self.owner = False
+
+        self._meta = np.ndarray((_RESULT_META_SIZE,), dtype=np.float64, buffer=self.shm.buf)
+        self._landmarks = np.ndarray(
+            (MAX_HANDS, NUM_HAND_LANDMARKS, 3), dtype=np.float32, buffer=self.shm.buf, offset=meta_bytes
+        )
+        if self.owner:
+            self._meta[:] = 0
+        self._last_good = None  # Newest consistent result read, returned while a write is in progress
+
+    @property
+    def name(self) -> str:
+        return self.shm.name
+
+    def write(
+        self,
+        frame_sequence: int,
+        capture_timestamp: float,
+        landmarks: list,
+        preprocessing_ms: float,
+        detection_ms: float,
+        total_ms: float,
+        preprocessed_at: float = 0.0,
+        detected_at: float = 0.0,
+        preprocess_pixel_ratio: float = 1.0,
+        preprocess_tier: str = "full",
+        skipped: bool = False,
+        inference_fps: float = 0.0,
+        skipped_frames: int = 0,
+        model_complexity: Optional[int] = None,
+    ) -> None:
+        """Publish a result (called by the worker)"""
+        hand_count = min(len(landmarks), MAX_HANDS)
+        self._meta[_RESULT_COUNTER] += 1  # Odd: write in progress
+        for i in range(hand_count):
+            self._landmarks[i] = landmarks[i]
+        self._meta[_RESULT_FRAME_SEQUENCE] = frame_sequence
+        self._meta[_RESULT_CAPTURE_TIMESTAMP] = capture_timestamp
+        self._meta[_RESULT_HAND_COUNT] = hand_count
+        self._meta[_RESULT_PREPROCESSING_MS] = preprocessing_ms
+        self._meta[_RESULT_DETECTION_MS] = detection_ms
+        self._meta[_RESULT_TOTAL_MS] = total_ms
+        self._meta[_RESULT_PREPROCESSED_AT] = preprocessed_at
+        self._meta[_RESULT_DETECTED_AT] = detected_at
+        self._meta[_RESULT_PREPROCESS_PIXEL_RATIO] = preprocess_pixel_ratio
+        self._meta[_RESULT_PREPROCESS_TIER] = PREPROCESS_TIERS.index(preprocess_tier)
+        self._meta[_RESULT_SKIPPED] = skipped
+        self._meta[_RESULT_INFERENCE_FPS] = inference_fps
+        self._meta[_RESULT_SKIPPED_FRAMES] = skipped_frames
+        self._meta[_RESULT_MODEL_COMPLEXITY] = -1 if model_complexity is None else model_complexity
+        self._meta[_RESULT_COUNTER] += 1  # Even: result complete
+
+    def latest_frame_sequence(self) -> int:
+        """Sequence number of the frame the current result was computed from"""
+        return int(self._meta[_RESULT_FRAME_SEQUENCE])
+
+    def read(self, newer_than: int = 0) -> Optional[InferenceResult]:
+        """Return the current result if it is for a frame newer than newer_than (never blocks)
+
+        A result the worker is still writing is retried a few times, yielding in between;
+        if it is still torn, the last consistent result is returned instead.
+        """
+        for _ in range(_RESULT_READ_RETRIES):
+            counter = self._meta[_RESULT_COUNTER]
+            if int(counter) % 2 == 0:
+                frame_sequence = int(self._meta[_RESULT_FRAME_SEQUENCE])
+                if frame_sequence <= newer_than:
+                    return None
+                hand_count = int(self._meta[_RESULT_HAND_COUNT])
+                model_complexity = int(self._meta[_RESULT_MODEL_COMPLEXITY])
+                result = InferenceResult(
+                    frame_sequence,
+                    float(self._meta[_RESULT_CAPTURE_TIMESTAMP]),
+                    self._landmarks[:hand_count].copy(),
+                    float(self._meta[_RESULT_PREPROCESSING_MS]),
+                    float(self._meta[_RESULT_DETECTION_MS]),
+                    float(self._meta[_RESULT_TOTAL_MS]),
+                    float(self._meta[_RESULT_PREPROCESSED_AT]),
+                    float(self._meta[_RESULT_DETECTED_AT]),
+                    float(self._meta[_RESULT_PREPROCESS_PIXEL_RATIO]),
+                    PREPROCESS_TIERS[int(self._meta[_RESULT_PREPROCESS_TIER])],
+                    bool(self._meta[_RESULT_SKIPPED]),
+                    float(self._meta[_RESULT_INFERENCE_FPS]),
+                    int(self._meta[_RESULT_SKIPPED_FRAMES]),
+                    model_complexity if model_complexity >= 0 else None,
+                )
+                if self._meta[_RESULT_COUNTER] == counter:
+                    self._last_good = result
+                    return result
+            time.sleep(0)  # Worker is mid-write: let it finish
+
+        last_good = self._last_good
+        if last_good is not None and last_good.frame_sequence > newer_than:
+            return last_good
+        return None
+
+    def close(self) -> None:
+        """Detach from (and, for the owner, destroy) the shared memory block"""
+        del self._meta, self._landmarks
+        self.shm.close()
+        if self.owner:
+            self.shm.unlink()
+
+
+def _worker_main(
+    ring_name: str, frame_shape: Tuple[int, int, int], slots: int, result_name: str, stop_event, inference_stride
+) -> None:
+    """Inference worker process entry point"""
+    from .enhanced_hand_tracker import EnhancedHandTracker
+    from .landmark_arrays import landmarks_to_array
+
+    # terminate() sends SIGTERM; exit through the finally below so the blocks are closed
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+
+    ring = SharedFrameRing(frame_shape, slots, name=ring_name)
+    result_block = SharedResultBlock(name=result_name)
+
+    # Kalman smoothing and gesture logic stay in the game process, which knows the
+    # current detection mode and confidence; the worker only produces raw landmarks
+    tracker = EnhancedHandTracker(enable_kalman=False)
+    scheduler = tracker.inference_scheduler
+    frame = np.empty(frame_shape, dtype=np.uint8)
+    last_sequence = 0
+
+    try:
+        while not stop_event.is_set():
+            packet = ring.read_latest(frame, last_sequence)
+            if packet is None:
+                time.sleep(0.002)
+                continue
+            sequence, capture_timestamp = packet
+            last_sequence = sequence
+
+            start_time = time.time()
+            if scheduler:
+                # The game process sets the stride from its Kalman tracker
+                scheduler.stride = inference_stride.value
+                if not scheduler.should_infer(frame):
+                    result_block.write(
+                        sequence,
+                        capture_timestamp,
+                        [],
+                        0.0,
+                        0.0,
+                        (time.time() - start_time) * 1000,
+                        skipped=True,
+                        inference_fps=scheduler.inference_fps,
+                        skipped_frames=scheduler.skipped_frames,
+                        model_complexity=tracker.model_complexity,
+                    )
+                    continue
+
+            _, results = tracker.detect_landmarks(frame)
+            landmarks = []
+            if results.multi_hand_landmarks:
+                landmarks = [landmarks_to_array(hand) for hand in results.multi_hand_landmarks]
+            # Previous landmarks drive the preprocessor's shadow-reduction ROI
+            tracker.last_hand_landmarks = results.multi_hand_landmarks[0] if results.multi_hand_landmarks else None
+            if scheduler:
+                scheduler.record_inference(frame, landmarks[0] if landmarks else None, capture_timestamp)
+
+            result_block.write(
+                sequence,
+                capture_timestamp,
+                landmarks,
+                tracker.preprocessing_time,
+                tracker.detection_time,
+                (time.time() - start_time) * 1000,
+                tracker.preprocessed_at,
+                tracker.detected_at,
+                tracker.preprocessor.last_pixel_ratio if tracker.preprocessor else 0.0,
+                tracker.preprocessor.last_tier if tracker.preprocessor else "none",
+                inference_fps=scheduler.inference_fps if scheduler else 0.0,
+                skipped_frames=scheduler.skipped_frames if scheduler else 0,
+                model_complexity=tracker.model_complexity,
+            )
+    finally:
+        if tracker.hands is not None:
+            tracker.hands.close()
+        ring.close()
+        result_block.close()
+
+
+class InferenceWorker:
+    """Game-side handle on the inference worker process
+
+    Owns the shared memory blocks, starts the worker, and restarts it when it dies or
+    stops producing results. Each restart gets fresh blocks (a worker killed mid-write
+    leaves its result block torn), and the old ones are closed and unlinked. After too
+    many failed starts in a row it gives up so the caller can fall back to in-process
+    inference.
+    """
+
+    def __init__(
+        self,
+        frame_shape: Tuple[int, int, int],
+        slots: int = 4,
+        stall_timeout: float = 2.0,
+        startup_timeout: float = 30.0,
+        max_failed_starts: int = 5,
+        on_frame_ring: Optional[Callable[[Optional[SharedFrameRing]], None]] = None,
+    ):
+        """
+        Args:
+            on_frame_ring: Called with the frame ring whenever it is replaced, and with None
+                before it is closed; frame producers must write to the ring it was last given
+        """
+        self.frame_shape = tuple(frame_shape)
+        self.slots = slots
+        self.stall_timeout = stall_timeout  # Max gap between results once the worker is running
+        self.startup_timeout = startup_timeout  # Max time to import MediaPipe and produce a first result
+        self.max_failed_starts = max_failed_starts
+        self.on_frame_ring = on_frame_ring
+
+        self.frame_ring = None
+        self.result_block = None
+
+        # Spawn rather than fork: the game process already runs capture and loader threads
+        self._context = multiprocessing.get_context("spawn")
+        self._stop_event = self._context.Event()
+        # Inference stride the game process asks for (1: every frame), read by the worker per frame
+        self._inference_stride = self._context.Value("i", 1, lock=False)
+        self.process = None
+
+        self.restarts = 0
+        self.failed_starts = 0  # Consecutive starts that died before producing a result
+        self.failed = False
+        self._observed_result_sequence = 0  # Result sequence seen at the last health check
+        self._last_progress_time = 0.0
+        self._started_time = 0.0
+        self._produced_result = False  # Whether the current worker has published anything yet
+        self._next_start_time = 0.0
+
+        self._create_shared_memory()
+        try:
+            self._start_process()
+        except Exception:
+            self._release_shared_memory()
+            raise
+
+    def _create_shared_memory(self) -> None:
+        """Create the frame ring and result block and hand the ring to the frame producer"""
+        self.frame_ring = SharedFrameRing(self.frame_shape, self.slots)
+        self.result_block = SharedResultBlock()
+        self._observed_result_sequence = 0
+        if self.on_frame_ring:
+            self.on_frame_ring(self.frame_ring)
+
+    def _release_shared_memory(self) -> None:
+        """Detach the frame producer, then close and unlink both blocks"""
+        try:
+            if self.on_frame_ring:
+                self.on_frame_ring(None)
+        finally:
+            try:
+                if self.frame_ring is not None:
+                    self.frame_ring.close()
+            finally:
+                if self.result_block is not None:
+                    self.result_block.close()
+                self.frame_ring = None
+                self.result_block = None
+
+    def _stop_process(self, timeout: float) -> None:
+        """Ask the worker to stop, terminating (then killing) it if it does not"""
+        self._stop_event.set()
+        if self.process is None:
+            return
+        self.process.join(timeout=timeout)
+        if self.process.is_alive():
+            self.process.terminate()
+            self.process.join(timeout=1.0)
+        if self.process.is_alive():
+            self.process.kill()
+            self.process.join()
+        self.process = None
+
+    def _start_process(self) -> None:
+        """Launch a new worker process"""
+        self._stop_event.clear()
+        self.process = self._context.Process(
+            target=_worker_main,
+            args=(
+                self.frame_ring.name,
+                self.frame_shape,
+                self.frame_ring.slots,
+                self.result_block.name,
+                self._stop_event,
+                self._inference_stride,
+            ),
+            name="HandInferenceWorker",
+            daemon=True,
+        )
+        self.process.start()
+        self._started_time = time.time()
+        self._produced_result = False
+
+    def poll(self) -> bool:
+        """Check worker health, restarting it if needed
+
+        Returns False once the worker has failed too often and should no longer be used.
+        """
+        if self.failed:
+            return False
+
+        now = time.time()
+        result_sequence = self.result_block.latest_frame_sequence()
+        if result_sequence != self._observed_result_sequence:
+            self._observed_result_sequence = result_sequence
+            self._last_progress_time = now
+            self._produced_result = True
+            self.failed_starts = 0
+
+        alive = self.process is not None and self.process.is_alive()
+        if self._produced_result:
+            # Only a stall if there are frames the worker should have got through by now
+            waiting = self.frame_ring.latest_sequence() > result_sequence
+            stalled = alive and waiting and now - self._last_progress_time > self.stall_timeout
+        else:
+            stalled = alive and now - self._started_time > self.startup_timeout
+        if alive and not stalled:
+            return True
+
+        if now < self._next_start_time:
+            return True  # Waiting out the restart backoff
+
+        if stalled:
+            print("[Inference Worker] Worker stopped responding, restarting")
+        else:
+            print(f"[Inference Worker] Worker exited (code {self.process.exitcode}), restarting")
+        self._stop_process(timeout=0.0)
+        self._release_shared_memory()
+
+        self.failed_starts += 1
+        if self.failed_starts > self.max_failed_starts:
+            print("[Inference Worker] Too many failed restarts, giving up")
+            self.failed = True
+            return False
+
+        self.restarts += 1
+        self._next_start_time = now + min(2.0, 0.25 * self.failed_starts)
+        self._create_shared_memory()
+        self._start_process()
+        return True
+
+    def set_inference_stride(self, stride: int) -> None:
+        """Ask the worker to infer every stride-th frame (1: every frame)"""
+        self._inference_stride.value = stride
+
+    def read_result(self, newer_than: int = 0) -> Optional[InferenceResult]:
+        """Newest inference result for a frame after newer_than, or None (never blocks)"""
+        return self.result_block.read(newer_than)
+
+    def close(self) -> None:
+        """Stop the worker and free the shared memory"""
+        try:
+            self._stop_process(timeout=2.0)
+        finally:
+            self._release_shared_memory()
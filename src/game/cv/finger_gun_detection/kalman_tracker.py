@@ -3,22 +3,60 @@ Kalman filter implementation for smooth hand landmark tracking
 """
 
 # Standard library imports
-from typing import Dict, Optional, Tuple
+from typing import Optional, Tuple
 
 # Third-party imports
 import cv2
 import numpy as np
 
+try:
+    from .landmark_arrays import NUM_HAND_LANDMARKS, WRIST, landmarks_to_array
+except ImportError:
+    # Third-party imports
+    from landmark_arrays import NUM_HAND_LANDMARKS, WRIST, landmarks_to_array
+
+# Nominal time step (~30 FPS); process noise is specified per step of this length
+FRAME_DT = 0.033
+
+# Elapsed times between capture timestamps are clamped to this range, so duplicate or
+# out-of-order timestamps and long stalls cannot produce a degenerate motion model
+MIN_DT = 0.005
+MAX_DT = 0.25
+
+
+# A landmark this far behind the wrist (MediaPipe z, roughly image-width units) is likely
+# hidden behind the palm and gets half the detection confidence, i.e. twice the noise
+OCCLUDED_DEPTH_SCALE = 0.05
+
+
+def landmark_confidences(measurements: np.ndarray, detection_confidence: float) -> np.ndarray:
+    """(N,) per-landmark confidence: the hand's detection confidence, lowered for landmarks behind the wrist"""
+    depth_behind_wrist = np.maximum(measurements[:, 2] - measurements[WRIST, 2], 0.0)
+    return detection_confidence / (1.0 + depth_behind_wrist / OCCLUDED_DEPTH_SCALE)
+
+
+def elapsed_time(timestamp: Optional[float], last_timestamp: Optional[float]) -> float:
+    """Seconds between two capture timestamps, FRAME_DT if either is unknown"""
+    if timestamp is None or last_timestamp is None:
+        return FRAME_DT
+    return min(max(timestamp - last_timestamp, MIN_DT), MAX_DT)
+
 
 class LandmarkKalmanFilter:
-    """Kalman filter for a single 3D landmark"""
+    """Kalman filter for a single 3D landmark
+
+    HandKalmanTracker filters all landmarks at once with BatchedLandmarkKalmanFilter; this
+    per-landmark version is kept for standalone use and as its reference implementation.
+    """
 
     def __init__(self, process_noise=0.03, measurement_noise=0.1):
         # State vector: [x, y, z, vx, vy, vz] (position and velocity)
         self.kalman = cv2.KalmanFilter(6, 3)
+        self.process_noise = process_noise
+        self.last_timestamp = None
 
-        # Assuming ~30 FPS, dt = 0.033 seconds
-        dt = 0.033
+        dt = FRAME_DT
+        self._dt = dt  # Time step the matrices are currently built for
 
         # Transition matrix (constant velocity model)
         self.kalman.transitionMatrix = np.array(
@@ -52,18 +90,33 @@ class LandmarkKalmanFilter:
         self.lost_frames = 0
         self.max_lost_frames = 3
 
-    def update(self, measurement: np.ndarray, confidence: float = 1.0) -> np.ndarray:
+    def _set_time_step(self, timestamp: Optional[float]) -> None:
+        """Rebuild the transition and process noise matrices for the time since the last step"""
+        dt = elapsed_time(timestamp, self.last_timestamp)
+        if timestamp is not None:
+            self.last_timestamp = timestamp
+        if dt == self._dt:
+            return
+        self._dt = dt
+        transition = np.eye(6, dtype=np.float32)
+        transition[:3, 3:] = np.eye(3, dtype=np.float32) * dt
+        self.kalman.transitionMatrix = transition
+        self.kalman.processNoiseCov = np.eye(6, dtype=np.float32) * (self.process_noise * dt / FRAME_DT)
+
+    def update(self, measurement: np.ndarray, confidence: float = 1.0, timestamp: Optional[float] = None) -> np.ndarray:
         """
         Update Kalman filter with new measurement
 
         Args:
             measurement: [x, y, z] position
             confidence: Detection confidence (0-1), affects noise parameters
+            timestamp: Capture time of the measurement in seconds; None assumes FRAME_DT
 
         Returns:
             Filtered [x, y, z] position
         """
         if not self.initialized:
+            self.last_timestamp = timestamp
             # Initialize state with first measurement
             self.kalman.statePre = np.array(
                 [measurement[0], measurement[1], measurement[2], 0, 0, 0], dtype=np.float32  # Initial velocity is zero
@@ -79,6 +132,7 @@ class LandmarkKalmanFilter:
         self.kalman.measurementNoiseCov = np.eye(3, dtype=np.float32) * adaptive_noise
 
         # Predict next state
+        self._set_time_step(timestamp)
         prediction = self.kalman.predict()
 
         # Correct with measurement
@@ -90,10 +144,13 @@ class LandmarkKalmanFilter:
         self.lost_frames = 0
         return np.array([state[0], state[1], state[2]]).flatten()
 
-    def predict_only(self) -> Optional[np.ndarray]:
+    def predict_only(self, timestamp: Optional[float] = None) -> Optional[np.ndarray]:
         """
         Predict position without measurement (when landmark is lost)
 
+        Args:
+            timestamp: Capture time of the frame without a measurement
+
         Returns:
             Predicted [x, y, z] position or None if lost for too long
         """
@@ -107,6 +164,7 @@ class LandmarkKalmanFilter:
             return None
 
         # Predict next state without correction
+        self._set_time_step(timestamp)
         prediction = self.kalman.predict()
 
         # Return predicted position
@@ -117,86 +175,201 @@ class LandmarkKalmanFilter:
         self.initialized = False
         self.lost_frames = 0
         self.kalman.errorCovPost = np.eye(6, dtype=np.float32)
+        self.last_timestamp = None
+
+
+class BatchedLandmarkKalmanFilter:
+    """Constant-velocity Kalman filter over a batch of 3D landmarks
+
+    Equivalent to one LandmarkKalmanFilter per landmark, but predicts and corrects every
+    landmark with a handful of numpy operations on an (N, 6) state array. Position and
+    velocity noise are isotropic, so each landmark's 6x6 covariance is three identical
+    2x2 [position, velocity] blocks, stored once per landmark as (P_pp, P_pv, P_vv).
+
+    Each step uses the real time since the previous measurement when capture timestamps
+    are given, so velocities stay right when the frame rate changes or frames are dropped.
+    """
+
+    def __init__(self, count: int, process_noise=0.03, measurement_noise=0.1, max_lost_frames=3):
+        self.count = count
+        self.process_noise = process_noise
+        self.measurement_noise = measurement_noise  # Scaled up per landmark as confidence drops
+        self.max_lost_frames = max_lost_frames
+
+        # State per landmark: [x, y, z, vx, vy, vz]
+        self.state = np.zeros((count, 6))
+        self.position = self.state[:, :3]
+        self.velocity = self.state[:, 3:]
+        self.covariance = np.empty((count, 3))  # P_pp, P_pv, P_vv
+        self._reset_covariance()
+
+        self.initialized = False
+        self.lost_frames = 0
+        self.last_timestamp = None
+
+    def _reset_covariance(self) -> None:
+        self.covariance[:] = (1.0, 0.0, 1.0)  # Identity
+
+    def _predict(self, timestamp: Optional[float]) -> None:
+        """Advance every landmark by the time since the last step (constant velocity model)"""
+        dt = elapsed_time(timestamp, self.last_timestamp)
+        if timestamp is not None:
+            self.last_timestamp = timestamp
+        process_noise = self.process_noise * dt / FRAME_DT
+
+        self.position += dt * self.velocity
+
+        p_pp, p_pv, p_vv = self.covariance.T
+        p_pp += dt * (2 * p_pv + dt * p_vv) + process_noise
+        p_pv += dt * p_vv
+        p_vv += process_noise
+
+    def update(self, measurements: np.ndarray, confidence=1.0, timestamp: Optional[float] = None) -> np.ndarray:
+        """
+        Update all landmarks with new measurements
+
+        Args:
+            measurements: (N, 3) array of x, y, z positions
+            confidence: Detection confidence (0-1), either for the whole hand or an (N,)
+                array per landmark; lower confidence means more measurement noise
+            timestamp: Capture time of the measurements in seconds; None assumes FRAME_DT
+
+        Returns:
+            Filtered (N, 3) positions
+        """
+        if not self.initialized:
+            # Initialize state with first measurement, initial velocity is zero
+            self.position[:] = measurements
+            self.velocity[:] = 0
+            self._reset_covariance()
+            self.initialized = True
+            self.lost_frames = 0
+            self.last_timestamp = timestamp
+            return measurements
+
+        self._predict(timestamp)
+
+        # Per-landmark gain; each axis shares its landmark's gain
+        measurement_noise = self.measurement_noise / np.maximum(confidence, 0.1)
+        p_pp, p_pv, p_vv = self.covariance.T
+        innovation_variance = p_pp + measurement_noise
+        position_gain = p_pp / innovation_variance
+        velocity_gain = p_pv / innovation_variance
+
+        innovation = measurements - self.position
+        self.position += position_gain[:, None] * innovation
+        self.velocity += velocity_gain[:, None] * innovation
+
+        p_vv -= velocity_gain * p_pv
+        p_pv *= 1 - position_gain
+        p_pp *= 1 - position_gain
+
+        self.lost_frames = 0
+        return self.position.copy()
+
+    def predict_only(self, timestamp: Optional[float] = None) -> Optional[np.ndarray]:
+        """
+        Predict positions without measurements (when the hand is lost)
+
+        Args:
+            timestamp: Capture time of the frame without measurements
+
+        Returns:
+            Predicted (N, 3) positions or None if lost for too long
+        """
+        if not self.initialized:
+            return None
+
+        self.lost_frames += 1
+        if self.lost_frames > self.max_lost_frames:
+            # Lost for too long, reset filter
+            self.initialized = False
+            return None
+
+        return self.predict(timestamp)
+
+    def predict(self, timestamp: Optional[float] = None) -> Optional[np.ndarray]:
+        """
+        Advance to a frame that was not measured on purpose (the hand is not lost)
+
+        Args:
+            timestamp: Capture time of the frame
+
+        Returns:
+            Predicted (N, 3) positions or None if the filter is not initialized
+        """
+        if not self.initialized:
+            return None
+
+        self._predict(timestamp)
+        return self.position.copy()
+
+    def reset(self):
+        """Reset the Kalman filter"""
+        self.initialized = False
+        self.lost_frames = 0
+        self._reset_covariance()
+        self.last_timestamp = None
 
 
 class HandKalmanTracker:
-    """Manages Kalman filters for all hand landmarks"""
+    """Manages Kalman filtering for all hand landmarks"""
 
     def __init__(self, process_noise=0.03, measurement_noise=0.1):
         self.process_noise = process_noise
         self.measurement_noise = measurement_noise
 
-        # Dictionary to store Kalman filters for each landmark
-        self.filters: Dict[int, LandmarkKalmanFilter] = {}
-
-        # Key landmarks to track (optimize by only tracking important ones)
-        self.key_landmarks = [
-            0,  # WRIST
-            4,  # THUMB_TIP
-            8,  # INDEX_FINGER_TIP
-            12,  # MIDDLE_FINGER_TIP
-            16,  # RING_FINGER_TIP
-            20,  # PINKY_TIP
-            5,  # INDEX_FINGER_MCP
-            9,  # MIDDLE_FINGER_MCP
-            13,  # RING_FINGER_MCP
-            17,  # PINKY_MCP
-            6,  # INDEX_FINGER_PIP
-            10,  # MIDDLE_FINGER_PIP
-            14,  # RING_FINGER_PIP
-            18,  # PINKY_PIP
-        ]
-
-        # Initialize filters for key landmarks
-        for landmark_id in self.key_landmarks:
-            self.filters[landmark_id] = LandmarkKalmanFilter(process_noise, measurement_noise)
+        # One batched filter covers every landmark, so there is no saving in tracking a subset
+        self.filter = BatchedLandmarkKalmanFilter(NUM_HAND_LANDMARKS, process_noise, measurement_noise)
 
         # Store last known good hand landmarks
         self.last_landmarks = None
         self.tracking_confidence = 1.0
 
-    def update_landmarks(self, hand_landmarks, detection_confidence: float = 1.0):
+    @staticmethod
+    def _apply_positions(hand_landmarks, positions: np.ndarray) -> None:
+        """Write (N, 3) positions back into a landmark list"""
+        for landmark, (x, y, z) in zip(hand_landmarks.landmark, positions.tolist()):
+            landmark.x = x
+            landmark.y = y
+            landmark.z = z
+
+    def update_landmarks(self, hand_landmarks, detection_confidence: float = 1.0, timestamp: Optional[float] = None):
         """
         Update all landmark positions with Kalman filtering
 
         Args:
             hand_landmarks: MediaPipe hand landmarks
-            detection_confidence: Overall hand detection confidence
+            detection_confidence: Overall hand detection confidence; landmarks behind the
+                wrist get less of it (see landmark_confidences)
+            timestamp: Capture time of the camera frame the landmarks come from
 
         Returns:
             Smoothed hand landmarks
         """
         if hand_landmarks is None:
             # No detection, use prediction only
-            return self.predict_landmarks()
+            return self.predict_landmarks(timestamp)
 
         self.tracking_confidence = detection_confidence
-        smoothed_landmarks = hand_landmarks  # Start with original
-
-        # Update each tracked landmark
-        for landmark_id in self.key_landmarks:
-            if landmark_id >= len(hand_landmarks.landmark):
-                continue
-
-            landmark = hand_landmarks.landmark[landmark_id]
-            measurement = np.array([landmark.x, landmark.y, landmark.z])
+        measurements = landmarks_to_array(hand_landmarks)
+        if len(measurements) != self.filter.count:
+            return hand_landmarks
 
-            # Update Kalman filter
-            if landmark_id in self.filters:
-                filtered_pos = self.filters[landmark_id].update(measurement, detection_confidence)
-
-                # Apply smoothed position back to landmark
-                hand_landmarks.landmark[landmark_id].x = filtered_pos[0]
-                hand_landmarks.landmark[landmark_id].y = filtered_pos[1]
-                hand_landmarks.landmark[landmark_id].z = filtered_pos[2]
+        confidences = landmark_confidences(measurements, detection_confidence)
+        filtered_positions = self.filter.update(measurements, confidences, timestamp)
+        self._apply_positions(hand_landmarks, filtered_positions)
 
         self.last_landmarks = hand_landmarks
         return hand_landmarks
 
-    def predict_landmarks(self):
+    def predict_landmarks(self, timestamp: Optional[float] = None):
         """
         Predict landmark positions when hand is temporarily lost
 
+        Args:
+            timestamp: Capture time of the camera frame without a hand
+
         Returns:
             Predicted hand landmarks or None if lost for too long
         """
@@ -204,39 +377,52 @@ class HandKalmanTracker:
             return None
 
         # Check if we can still predict
-        can_predict = False
-        for filter in self.filters.values():
-            if filter.initialized and filter.lost_frames < filter.max_lost_frames:
-                can_predict = True
-                break
-
-        if not can_predict:
+        if not self.filter.initialized or self.filter.lost_frames >= self.filter.max_lost_frames:
             self.reset()
             return None
 
-        # Create predicted landmarks from last known positions
+        # Update last known positions with predictions
         predicted_landmarks = self.last_landmarks
-
-        # Update positions with predictions
-        for landmark_id, filter in self.filters.items():
-            if landmark_id >= len(predicted_landmarks.landmark):
-                continue
-
-            predicted_pos = filter.predict_only()
-            if predicted_pos is not None:
-                predicted_landmarks.landmark[landmark_id].x = predicted_pos[0]
-                predicted_landmarks.landmark[landmark_id].y = predicted_pos[1]
-                predicted_landmarks.landmark[landmark_id].z = predicted_pos[2]
+        predicted_positions = self.filter.predict_only(timestamp)
+        if predicted_positions is not None:
+            self._apply_positions(predicted_landmarks, predicted_positions)
 
         # Reduce tracking confidence for predictions
         self.tracking_confidence *= 0.8
 
         return predicted_landmarks
 
+    def predict_skipped_frame(self, timestamp: Optional[float] = None):
+        """
+        Predict landmark positions for a frame inference skipped while the hand is tracked
+
+        Unlike predict_landmarks, this neither counts as a lost frame nor lowers the
+        tracking confidence.
+
+        Args:
+            timestamp: Capture time of the skipped camera frame
+
+        Returns:
+            Predicted hand landmarks or None if no hand is tracked
+        """
+        if self.last_landmarks is None:
+            return None
+
+        predicted_positions = self.filter.predict(timestamp)
+        if predicted_positions is None:
+            return None
+        self._apply_positions(self.last_landmarks, predicted_positions)
+        return self.last_landmarks
+
+    def get_landmark_velocity(self, index: int) -> Optional[np.ndarray]:
+        """Filtered (vx, vy, vz) of one landmark in normalized units per second, or None if not tracking"""
+        if not self.filter.initialized:
+            return None
+        return self.filter.velocity[index].copy()
+
     def reset(self):
-        """Reset all Kalman filters"""
-        for filter in self.filters.values():
-            filter.reset()
+        """Reset the Kalman filter"""
+        self.filter.reset()
         self.last_landmarks = None
         self.tracking_confidence = 1.0
 
@@ -250,7 +436,9 @@ class HandKalmanTracker:
         # More smoothing when confidence is low
         return 1.0 - self.tracking_confidence
 
-    def adaptive_update(self, hand_landmarks, detection_confidence: float, detection_mode: str = "standard"):
+    def adaptive_update(
+        self, hand_landmarks, detection_confidence: float, detection_mode: str = "standard", timestamp: Optional[float] = None
+    ):
         """
         Adaptively update filters based on detection mode and confidence
 
@@ -258,6 +446,7 @@ class HandKalmanTracker:
             hand_landmarks: MediaPipe hand landmarks
             detection_confidence: Overall detection confidence
             detection_mode: Current detection mode (affects filter parameters)
+            timestamp: Capture time of the camera frame the landmarks come from
 
         Returns:
             Smoothed hand landmarks
@@ -276,14 +465,13 @@ class HandKalmanTracker:
             process_noise = 0.04
             measurement_noise = 0.08
 
-        # Update filter parameters if they've changed significantly
-        if abs(self.process_noise - process_noise) > 0.01:
+        # Update filter parameters if they've changed; the filter scales the measurement
+        # noise up per landmark as confidence drops
+        if process_noise != self.process_noise or measurement_noise != self.measurement_noise:
             self.process_noise = process_noise
             self.measurement_noise = measurement_noise
-            # Update all filters with new parameters
-            for filter in self.filters.values():
-                filter.kalman.processNoiseCov = np.eye(6, dtype=np.float32) * process_noise
-                filter.kalman.measurementNoiseCov = np.eye(3, dtype=np.float32) * measurement_noise
+            self.filter.process_noise = process_noise
+            self.filter.measurement_noise = measurement_noise
 
         # Perform update
-        return self.update_landmarks(hand_landmarks, detection_confidence)
+        return self.update_landmarks(hand_landmarks, detection_confidence, timestamp)
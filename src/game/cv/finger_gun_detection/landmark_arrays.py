@@ -0,0 +1,52 @@
+"""
+Conversions between MediaPipe hand landmark lists and numpy landmark arrays
+"""
+
+# Third-party imports
+import numpy as np
+from mediapipe.framework.formats import landmark_pb2
+
+# MediaPipe Hands reports 21 landmarks per hand
+NUM_HAND_LANDMARKS = 21
+
+# Landmark indices (rows of a landmark array) used by the gesture logic
+WRIST = 0
+THUMB_IP = 3
+THUMB_TIP = 4
+INDEX_FINGER_MCP = 5
+INDEX_FINGER_TIP = 8
+MIDDLE_FINGER_MCP = 9
+MIDDLE_FINGER_PIP = 10
+MIDDLE_FINGER_TIP = 12
+RING_FINGER_TIP = 16
+PINKY_MCP = 17
+PINKY_TIP = 20
+
+# MCP, PIP, DIP and TIP rows of the index, middle, ring and pinky fingers
+FINGER_JOINTS = np.array([[5, 6, 7, 8], [9, 10, 11, 12], [13, 14, 15, 16], [17, 18, 19, 20]])
+
+
+def landmarks_to_array(hand_landmarks) -> np.ndarray:
+    """Convert a NormalizedLandmarkList into a (21, 3) float32 array of x, y, z"""
+    return np.array([(lm.x, lm.y, lm.z) for lm in hand_landmarks.landmark], dtype=np.float32)
+
+
+def as_landmark_array(hand_landmarks) -> np.ndarray:
+    """Return a (21, 3) landmark array, converting a NormalizedLandmarkList if needed"""
+    if isinstance(hand_landmarks, np.ndarray):
+        return hand_landmarks
+    return landmarks_to_array(hand_landmarks)
+
+
+def array_to_landmarks(landmark_array: np.ndarray) -> landmark_pb2.NormalizedLandmarkList:
+    """Convert a (21, 3) landmark array back into a NormalizedLandmarkList"""
+    hand_landmarks = landmark_pb2.NormalizedLandmarkList()
+    for x, y, z in landmark_array.tolist():
+        hand_landmarks.landmark.add(x=x, y=y, z=z)
+    return hand_landmarks
+
+
+def mirror_landmarks(hand_landmarks) -> None:
+    """Flip x coordinates in place, turning landmarks from an unmirrored frame into the selfie view"""
+    for lm in hand_landmarks.landmark:
+        lm.x = 1.0 - lm.x
@@ -0,0 +1,246 @@
+"""
+Compact recording and replay of hand landmarks
+
+A recording stores, per camera frame, the capture timestamp, the detection mode, whether
+a hand was found, whether a shot fired, and the 21 hand landmarks. Landmarks are
+quantized to int16 and delta-encoded against the previous frame, with a keyframe of
+absolute values every KEYFRAME_INTERVAL frames (and whenever the hand reappears).
+
+File layout: one JSON header line padded to HEADER_SIZE bytes, followed by fixed-size
+RECORD_DTYPE records, so a recording can be opened with np.memmap without parsing.
+Replaying feeds the decoded landmarks straight into detect_finger_gun and
+detect_shooting_gesture, without running MediaPipe.
+"""
+
+# Standard library imports
+import json
+from types import SimpleNamespace
+from typing import Iterator, List
+
+# Third-party imports
+import numpy as np
+
+from .landmark_arrays import NUM_HAND_LANDMARKS, as_landmark_array
+
+RECORDING_FORMAT = "arcvde-landmarks"
+RECORDING_VERSION = 1
+HEADER_SIZE = 512  # Bytes reserved for the JSON header (keeps records aligned)
+
+LANDMARK_SCALE = 8192  # Quantization steps per normalized unit (~0.08 px at 640 wide)
+KEYFRAME_INTERVAL = 30  # Frames between absolute landmark keyframes
+
+# Record flags
+FLAG_HAND = 1  # A hand was detected on this frame
+FLAG_KEYFRAME = 2  # Landmarks are absolute rather than deltas
+FLAG_SHOT = 4  # A shot fired on this frame
+
+# Detection modes reported by the trackers; stored as an index into this table
+DETECTION_MODES = (
+    "none",
+    "standard",
+    "standard_adaptive",
+    "angles",
+    "angles_fallback",
+    "angles_only",
+    "depth",
+    "wrist_angle",
+    "region_normal",
+    "region_problem_zone",
+    "region_edge",
+)
+UNKNOWN_MODE = 255
+
+RECORD_DTYPE = np.dtype(
+    [
+        ("timestamp", "<f8"),  # Capture timestamp, seconds since the first recorded frame
+        ("flags", "u1"),
+        ("mode", "u1"),
+        ("landmarks", "<i2", (NUM_HAND_LANDMARKS, 3)),
+    ]
+)
+
+
+class LandmarkRecorder:
+    """Appends per-frame landmarks and shot events to a recording file"""
+
+    def __init__(self, path: str, frame_width: int, frame_height: int):
+        self.path = path
+        self.frames = 0
+        self._file = open(path, "wb")
+        self._start_timestamp = None
+        self._previous = None  # Quantized landmarks of the previous frame (int32)
+        self._since_keyframe = 0
+        self._record = np.zeros(1, dtype=RECORD_DTYPE)
+
+        header = {
+            "format": RECORDING_FORMAT,
+            "version": RECORDING_VERSION,
+            "frame_width": frame_width,
+            "frame_height": frame_height,
+            "landmark_scale": LANDMARK_SCALE,
+            "detection_modes": list(DETECTION_MODES),
+        }
+        encoded = json.dumps(header).encode("utf-8") + b"\n"
+        if len(encoded) > HEADER_SIZE:
+            raise ValueError("Recording header does not fit in HEADER_SIZE")
+        self._file.write(encoded.ljust(HEADER_SIZE, b" "))
+
+    def record(self, capture_timestamp: float, hand_landmarks, detection_mode: str, shot: bool = False) -> None:
+        """Append one frame
+
+        Args:
+            capture_timestamp: Capture time of the frame (time.perf_counter)
+            hand_landmarks: NormalizedLandmarkList or (21, 3) landmark array, or None when no hand was found
+            detection_mode: Tracker detection mode for this frame
+            shot: Whether a shot fired on this frame
+        """
+        if self._start_timestamp is None:
+            self._start_timestamp = capture_timestamp
+
+        record = self._record[0]
+        record["timestamp"] = capture_timestamp - self._start_timestamp
+        record["mode"] = DETECTION_MODES.index(detection_mode) if detection_mode in DETECTION_MODES else UNKNOWN_MODE
+        flags = FLAG_SHOT if shot else 0
+
+        if hand_landmarks is None:
+            record["landmarks"] = 0
+            self._previous = None
+            flags |= FLAG_KEYFRAME
+        else:
+            quantized = np.rint(as_landmark_array(hand_landmarks) * LANDMARK_SCALE).astype(np.int32)
+            # Keyframes store absolute values as int16: saturate (at +-4 units) instead of wrapping
+            np.clip(quantized, np.iinfo(np.int16).min, np.iinfo(np.int16).max, out=quantized)
+            flags |= FLAG_HAND
+            delta = None
+            if self._previous is not None and self._since_keyframe < KEYFRAME_INTERVAL:
+                delta = quantized - self._previous
+                if np.abs(delta).max() > np.iinfo(np.int16).max:
+                    delta = None  # Jump too large for a delta: write a keyframe instead
+            if delta is None:
+                record["landmarks"] = quantized
+                flags |= FLAG_KEYFRAME
+                self._since_keyframe = 0
+            else:
+                record["landmarks"] = delta
+                self._since_keyframe += 1
+            self._previous = quantized
+
+        record["flags"] = flags
+        self._file.write(self._record.tobytes())
+        self.frames += 1
+
+    def close(self) -> None:
+        """Flush and close the file"""
+        if not self._file.closed:
+            self._file.close()
+
+
+class LandmarkRecording:
+    """A recording opened for replay (records are memory-mapped, not read into memory)"""
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as f:
+            header = json.loads(f.read(HEADER_SIZE).split(b"\n", 1)[0])
+        if header.get("format") != RECORDING_FORMAT:
+            raise ValueError(f"{path} is not a landmark recording")
+        self.header = header
+        self.frame_width = header["frame_width"]
+        self.frame_height = header["frame_height"]
+        self.detection_modes = header["detection_modes"]
+
+        record_bytes = _file_size(path) - HEADER_SIZE
+        count = record_bytes // RECORD_DTYPE.itemsize
+        if count > 0:
+            self.records = np.memmap(path, dtype=RECORD_DTYPE, mode="r", offset=HEADER_SIZE, shape=(count,))
+        else:
+            self.records = np.zeros(0, dtype=RECORD_DTYPE)
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    @property
+    def timestamps(self) -> np.ndarray:
+        return self.records["timestamp"]
+
+    @property
+    def hand_present(self) -> np.ndarray:
+        return (self.records["flags"] & FLAG_HAND) != 0
+
+    @property
+    def shots(self) -> np.ndarray:
+        return (self.records["flags"] & FLAG_SHOT) != 0
+
+    def modes(self) -> List[str]:
+        """Detection mode name for every frame"""
+        names = list(self.detection_modes)
+        return [names[m] if m < len(names) else "unknown" for m in self.records["mode"]]
+
+    def decode_landmarks(self) -> np.ndarray:
+        """Decode every frame's landmarks into an (N, 21, 3) float32 array (zeros without a hand)"""
+        values = self.records["landmarks"].astype(np.int32)
+        keyframes = (self.records["flags"] & FLAG_KEYFRAME) != 0
+
+        # Each frame is its keyframe plus the deltas since: a running sum that restarts
+        # at every keyframe, computed as cumsum minus the cumsum just before the keyframe
+        cumulative = np.cumsum(values, axis=0)
+        indices = np.arange(len(values))
+        last_keyframe = np.maximum.accumulate(np.where(keyframes, indices, 0))
+        before_keyframe = np.where(last_keyframe > 0, last_keyframe - 1, 0)
+        offset = np.where((last_keyframe > 0)[:, None, None], cumulative[before_keyframe], 0)
+        decoded = cumulative - offset
+        return decoded.astype(np.float32) / self.header["landmark_scale"]
+
+
+def _file_size(path: str) -> int:
+    with open(path, "rb") as f:
+        f.seek(0, 2)
+        return f.tell()
+
+
+def replay_gestures(recording: LandmarkRecording, hand_tracker) -> Iterator[SimpleNamespace]:
+    """Run the finger gun and shooting gesture logic over a recording
+
+    Yields one result per frame with the recorded and replayed detection: timestamp,
+    is_gun, index_coords, confidence, detection_mode, shot (replayed) and recorded_shot.
+    """
+    landmarks = recording.decode_landmarks()
+    hand_present = recording.hand_present
+    recorded_shots = recording.shots
+    timestamps = recording.timestamps
+
+    # Shot state lives on its own object, as it does per screen in the game
+    state = SimpleNamespace(
+        shooting_detected=False, last_shoot_time=0.0, previous_thumb_y=None, previous_time=0.0, thumb_reset=True
+    )
+    hand_tracker.reset_tracking_state()
+
+    for i in range(len(recording)):
+        timestamp = float(timestamps[i])
+        result = SimpleNamespace(
+            timestamp=timestamp,
+            is_gun=False,
+            index_coords=None,
+            confidence=0.0,
+            detection_mode="none",
+            shot=False,
+            recorded_shot=bool(recorded_shots[i]),
+        )
+        if not hand_present[i]:
+            hand_tracker.reset_tracking_state()
+            state.shooting_detected = False
+            state.previous_thumb_y = None
+            state.thumb_reset = True
+            yield result
+            continue
+
+        is_gun, index_coords, thumb_tip, _, thumb_middle_dist, confidence = hand_tracker.detect_finger_gun(
+            landmarks[i], recording.frame_width, recording.frame_height
+        )
+        result.is_gun = is_gun
+        result.index_coords = index_coords
+        result.confidence = confidence
+        result.detection_mode = hand_tracker.detection_mode
+        if is_gun and index_coords:
+            result.shot = hand_tracker.detect_shooting_gesture(thumb_tip, thumb_middle_dist, state=state, now=timestamp)
+        yield result
@@ -0,0 +1,140 @@
+"""
+MediaPipe Hands model complexity calibration
+
+The full hand model (model_complexity=1) is noticeably more accurate than the lite one
+(0), but on slower machines it cannot keep up with the camera. At startup each complexity
+is timed on a real camera frame and the best one that fits the per-frame budget is used.
+The choice is cached per MediaPipe version and detection width, so later starts skip the
+calibration. While playing, a monitor keeps watching inference time and downgrades to the
+lite model when the machine falls behind; the downgrade is cached too.
+"""
+
+# Standard library imports
+import time
+from typing import Callable, Dict, Optional
+
+# Third-party imports
+import mediapipe as mp
+import numpy as np
+
+try:
+    # Local application imports
+    from utils.disk_cache import load_cache, save_cache
+except ImportError:
+    # Outside the game there is nowhere to cache to: calibrate on every start
+    def load_cache(name):
+        return None
+
+    def save_cache(name, data):
+        return False
+
+
+MODEL_COMPLEXITIES = (1, 0)  # Best first
+MODEL_COMPLEXITY_NAMES = {0: "lite", 1: "full"}
+CALIBRATION_CACHE_NAME = "model_complexity"
+CALIBRATION_MAX_AGE = 7 * 24 * 3600  # Seconds before a cached choice (or downgrade) is re-measured
+CALIBRATION_WARMUP_RUNS = 3  # Runs ignored per complexity (graph start-up)
+CALIBRATION_RUNS = 12  # Timed runs per complexity
+
+MONITOR_WARMUP_FRAMES = 10  # Frames ignored after the model is (re)built
+MONITOR_SMOOTHING = 0.05  # Weight of the newest frame in the live inference time average
+MONITOR_DOWNGRADE_FRAMES = 60  # Consecutive frames over budget before downgrading (about 2 s)
+
+
+def calibration_key(detection_width: Optional[int]) -> str:
+    """Cache key: timings depend on the MediaPipe build and the detection frame size"""
+    return f"mediapipe {mp.__version__}, width {detection_width or 'camera'}"
+
+
+def load_calibration(key: str, budget_ms: float) -> Optional[dict]:
+    """Cached calibration for key, or None if missing, stale, or measured against another budget"""
+    entry = (load_cache(CALIBRATION_CACHE_NAME) or {}).get(key)
+    if not entry or entry.get("budget_ms") != budget_ms or entry.get("model_complexity") not in MODEL_COMPLEXITIES:
+        return None
+    if time.time() - entry.get("calibrated_at", 0) > CALIBRATION_MAX_AGE:
+        return None
+    return entry
+
+
+def save_calibration(key: str, calibration: dict) -> None:
+    """Store a calibration (or a live downgrade) under key"""
+    cache = load_cache(CALIBRATION_CACHE_NAME) or {}
+    cache[key] = calibration
+    save_cache(CALIBRATION_CACHE_NAME, cache)
+
+
+def time_model(hands, frame: np.ndarray, runs: int = CALIBRATION_RUNS) -> float:
+    """90th percentile time in ms of hands.process on frame"""
+    for _ in range(CALIBRATION_WARMUP_RUNS):
+        hands.process(frame)
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        hands.process(frame)
+        timings.append((time.perf_counter() - start) * 1000)
+    return float(np.percentile(timings, 90))
+
+
+def calibrate_model_complexity(frame: np.ndarray, budget_ms: float, create_hands: Callable[[int], object]) -> dict:
+    """Time every model complexity on frame and pick the best that fits budget_ms
+
+    Args:
+        frame: Detection frame (downscaled and preprocessed) to time the models on
+        budget_ms: MediaPipe time allowed per frame
+        create_hands: Builds a Hands graph for a model complexity
+
+    Returns:
+        Calibration dict with the chosen model_complexity and the timings behind it
+    """
+    timings: Dict[str, float] = {}  # p90 ms by model name
+    for complexity in MODEL_COMPLEXITIES:
+        hands = create_hands(complexity)
+        try:
+            timings[MODEL_COMPLEXITY_NAMES[complexity]] = time_model(hands, frame)
+        finally:
+            hands.close()
+
+    fitting = [complexity for complexity in MODEL_COMPLEXITIES if timings[MODEL_COMPLEXITY_NAMES[complexity]] <= budget_ms]
+    chosen = fitting[0] if fitting else MODEL_COMPLEXITIES[-1]
+
+    timing_text = ", ".join(f"{name} {ms:.1f}ms" for name, ms in timings.items())
+    print(
+        f"[Hand Tracking] Model calibration: {timing_text} (p90, budget {budget_ms:.0f}ms) "
+        f"-> {MODEL_COMPLEXITY_NAMES[chosen]} model"
+    )
+    return {"model_complexity": chosen, "timings_ms": timings, "budget_ms": budget_ms, "calibrated_at": time.time()}
+
+
+class ModelComplexityMonitor:
+    """Watches live inference time and signals when the model should be downgraded"""
+
+    def __init__(self, model_complexity: int, budget_ms: float):
+        self.model_complexity = model_complexity
+        self.budget_ms = budget_ms
+        self.average_ms: Optional[float] = None
+        self._frames = 0
+        self._frames_over_budget = 0
+
+    def reset(self, model_complexity: int) -> None:
+        """Start watching a newly built model"""
+        self.model_complexity = model_complexity
+        self.average_ms = None
+        self._frames = 0
+        self._frames_over_budget = 0
+
+    def record(self, detection_ms: float) -> bool:
+        """Feed one frame's inference time; True when a cheaper model should take over"""
+        self._frames += 1
+        if self._frames <= MONITOR_WARMUP_FRAMES:
+            return False
+
+        if self.average_ms is None:
+            self.average_ms = detection_ms
+        else:
+            self.average_ms += MONITOR_SMOOTHING * (detection_ms - self.average_ms)
+
+        if self.average_ms <= self.budget_ms:
+            self._frames_over_budget = 0
+            return False
+        self._frames_over_budget += 1
+        return self._frames_over_budget >= MONITOR_DOWNGRADE_FRAMES and self.model_complexity > MODEL_COMPLEXITIES[-1]
@@ -0,0 +1,126 @@
+"""
+Adaptive preprocessing governor
+
+Picks how much of the FramePreprocessor chain to run on each frame. Scene brightness and
+contrast are measured on a tiny downsampled luma image; gamma correction is only needed
+when the scene is too dark or too bright, and CLAHE only when contrast is low. Both
+decisions use hysteresis bands so the tier does not flicker around a threshold, and a
+per-frame millisecond budget caps the tier when preprocessing takes too long.
+"""
+
+# Standard library imports
+from typing import Dict, Optional
+
+# Third-party imports
+import cv2
+import numpy as np
+
+# Preprocessing tiers, cheapest first
+PREPROCESS_TIERS = ("none", "gamma", "clahe", "full")
+
+MEASURE_SIZE = (64, 48)  # Downsampled luma image used to measure the scene
+
+# Hysteresis bands: (enter, leave) thresholds on the 0-255 luma scale
+DARK_BRIGHTNESS = (85, 100)  # Gamma turns on below 85 and off again above 100
+BRIGHT_BRIGHTNESS = (165, 150)  # Gamma turns on above 165 and off again below 150
+LOW_CONTRAST = (35, 45)  # CLAHE turns on below a luma std of 35 and off above 45
+
+BUDGET_WARMUP_FRAMES = 5  # First runs of each tier are ignored (lazy OpenCV initialization)
+BUDGET_SMOOTHING = 0.1  # Weight of the newest sample in the per-tier cost average
+BUDGET_RECOVERY_FRAMES = 90  # Frames within budget before a capped tier is raised again
+BUDGET_HEADROOM = 0.8  # A tier is only restored if its average cost is below this share of the budget
+
+
+class PreprocessingGovernor:
+    """Chooses a preprocessing tier per frame from scene statistics and a time budget"""
+
+    def __init__(self, budget_ms: Optional[float] = None):
+        """
+        Args:
+            budget_ms: Preprocessing time allowed per frame; None disables the budget
+        """
+        self.budget_ms = budget_ms
+        self.brightness = 128.0
+        self.contrast = 64.0
+        self.needs_gamma = False
+        self.needs_clahe = False
+
+        self.scene_tier = "none"  # What the scene asks for
+        self.tier = "none"  # What actually runs (scene tier limited by the budget cap)
+        self.cap = len(PREPROCESS_TIERS) - 1  # Most expensive tier index the budget allows
+        self.tier_cost_ms: Dict[str, float] = {}  # Moving average of preprocessing time per tier
+        self._tier_runs: Dict[str, int] = {}
+        self._frames_within_budget = 0
+        self._luma = np.empty((MEASURE_SIZE[1], MEASURE_SIZE[0]), dtype=np.uint8)
+        self._small = np.empty((MEASURE_SIZE[1], MEASURE_SIZE[0], 3), dtype=np.uint8)
+
+    def measure_scene(self, frame: np.ndarray) -> None:
+        """Update brightness (mean luma) and contrast (luma std) from an RGB frame"""
+        cv2.resize(frame, MEASURE_SIZE, dst=self._small, interpolation=cv2.INTER_NEAREST)  # Sample, do not average
+        cv2.cvtColor(self._small, cv2.COLOR_RGB2GRAY, dst=self._luma)
+        mean, std = cv2.meanStdDev(self._luma)
+        self.brightness = float(mean[0, 0])
+        self.contrast = float(std[0, 0])
+
+        if self.needs_gamma:
+            self.needs_gamma = not (DARK_BRIGHTNESS[1] < self.brightness < BRIGHT_BRIGHTNESS[1])
+        else:
+            self.needs_gamma = self.brightness < DARK_BRIGHTNESS[0] or self.brightness > BRIGHT_BRIGHTNESS[0]
+
+        if self.needs_clahe:
+            self.needs_clahe = self.contrast < LOW_CONTRAST[1]
+        else:
+            self.needs_clahe = self.contrast < LOW_CONTRAST[0]
+
+    def select_tier(self, frame: np.ndarray) -> str:
+        """Measure the frame and return the tier to preprocess it with"""
+        self.measure_scene(frame)
+        if self.needs_gamma and self.needs_clahe:
+            self.scene_tier = "full"
+        elif self.needs_clahe:
+            self.scene_tier = "clahe"
+        elif self.needs_gamma:
+            self.scene_tier = "gamma"
+        else:
+            self.scene_tier = "none"
+
+        self.tier = PREPROCESS_TIERS[min(PREPROCESS_TIERS.index(self.scene_tier), self.cap)]
+        return self.tier
+
+    def record(self, tier: str, elapsed_ms: float) -> None:
+        """Feed back how long preprocessing took, lowering or restoring the budget cap"""
+        runs = self._tier_runs.get(tier, 0) + 1
+        self._tier_runs[tier] = runs
+        if runs <= BUDGET_WARMUP_FRAMES:
+            return
+
+        previous = self.tier_cost_ms.get(tier)
+        cost = elapsed_ms if previous is None else previous + BUDGET_SMOOTHING * (elapsed_ms - previous)
+        self.tier_cost_ms[tier] = cost
+        if self.budget_ms is None:
+            return
+
+        tier_index = PREPROCESS_TIERS.index(tier)
+        if cost > self.budget_ms and tier_index > 0:
+            # Falling behind: never run this tier (or anything dearer) until it fits again
+            self._frames_within_budget = 0
+            if tier_index - 1 < self.cap:
+                self.cap = tier_index - 1
+                print(f"[Preprocessing] {tier} takes {cost:.1f}ms (budget {self.budget_ms:.1f}ms), capping at {self.cap_tier}")
+            return
+
+        if self.cap < len(PREPROCESS_TIERS) - 1 and tier_index == self.cap:
+            self._frames_within_budget += 1
+            if self._frames_within_budget >= BUDGET_RECOVERY_FRAMES:
+                self._frames_within_budget = 0
+                # Restore the next tier unless it is already known not to fit
+                next_tier = PREPROCESS_TIERS[self.cap + 1]
+                next_cost = self.tier_cost_ms.get(next_tier)
+                if next_cost is None or next_cost < self.budget_ms * BUDGET_HEADROOM:
+                    self.cap += 1
+                else:
+                    del self.tier_cost_ms[next_tier]  # Stale: retry it after the next recovery period
+
+    @property
+    def cap_tier(self) -> str:
+        return PREPROCESS_TIERS[self.cap]
@@ -3,11 +3,52 @@ Region-adaptive detection for problematic areas of the camera frame
 """
 
 # Standard library imports
+import math
 from typing import Optional, Tuple
 
 # Third-party imports
 import numpy as np
 
+try:
+    from .landmark_arrays import INDEX_FINGER_MCP, INDEX_FINGER_TIP, MIDDLE_FINGER_MCP, MIDDLE_FINGER_TIP, WRIST
+except ImportError:
+    # Third-party imports
+    from landmark_arrays import INDEX_FINGER_MCP, INDEX_FINGER_TIP, MIDDLE_FINGER_MCP, MIDDLE_FINGER_TIP, WRIST
+
+# Threshold adjustments per position category, built once; treat them as read-only
+ADAPTIVE_THRESHOLDS = {
+    # Much more lenient thresholds for problem zone
+    "problem_zone": {
+        "thumb_index_multiplier": 1.8,  # 80% more lenient
+        "middle_ring_multiplier": 2.0,  # 100% more lenient
+        "ring_pinky_multiplier": 2.0,  # 100% more lenient
+        "index_wrist_multiplier": 0.7,  # 30% less strict
+        "min_confidence": 0.4,  # Lower confidence requirement
+        "angle_weight_boost": 0.3,  # Boost angle detection weight
+        "require_all_checks": False,  # Don't require all checks to pass
+    },
+    # Moderately lenient for edge positions
+    "edge": {
+        "thumb_index_multiplier": 1.4,
+        "middle_ring_multiplier": 1.5,
+        "ring_pinky_multiplier": 1.5,
+        "index_wrist_multiplier": 0.85,
+        "min_confidence": 0.5,
+        "angle_weight_boost": 0.15,
+        "require_all_checks": False,
+    },
+    # Normal thresholds for center area
+    "normal": {
+        "thumb_index_multiplier": 1.0,
+        "middle_ring_multiplier": 1.0,
+        "ring_pinky_multiplier": 1.0,
+        "index_wrist_multiplier": 1.0,
+        "min_confidence": 0.6,
+        "angle_weight_boost": 0.0,
+        "require_all_checks": True,
+    },
+}
+
 
 class RegionAdaptiveDetector:
     """Adapts detection parameters based on hand position in frame"""
@@ -25,21 +66,18 @@ class RegionAdaptiveDetector:
             "y_max": frame_height,  # All the way to bottom edge (480)
         }
 
-    def get_hand_position_category(self, hand_landmarks) -> str:
+    def get_hand_position_category(self, landmarks: Optional[np.ndarray]) -> str:
         """
-        Categorize hand position in frame
+        Categorize hand position in frame from a (21, 3) landmark array
         Returns: 'problem_zone', 'edge', or 'normal'
         """
-        if not hand_landmarks:
+        if landmarks is None:
             return "normal"
 
-        # Get multiple reference points for more accurate position
-        wrist = hand_landmarks.landmark[0]  # WRIST landmark
-        middle_mcp = hand_landmarks.landmark[9]  # MIDDLE_FINGER_MCP
-
         # Use average of wrist and middle MCP for more stable position
-        avg_x = ((wrist.x + middle_mcp.x) / 2) * self.frame_width
-        avg_y = ((wrist.y + middle_mcp.y) / 2) * self.frame_height
+        center = landmarks[[WRIST, MIDDLE_FINGER_MCP], :2].sum(axis=0, dtype=np.float64) / 2
+        avg_x = float(center[0]) * self.frame_width
+        avg_y = float(center[1]) * self.frame_height
 
         # Debug: uncomment to see exact positions
         # print(f"Hand position: ({avg_x:.0f}, {avg_y:.0f}), Problem region: x[{self.problem_region['x_min']}-{self.problem_region['x_max']}], y[{self.problem_region['y_min']}-{self.problem_region['y_max']}], In zone: {in_x_range and in_y_range}")
@@ -66,67 +104,32 @@ class RegionAdaptiveDetector:
 
     def get_adaptive_thresholds(self, position_category: str) -> dict:
         """
-        Get adjusted thresholds based on position category
+        Get adjusted thresholds based on position category (shared, do not modify)
         """
-        if position_category == "problem_zone":
-            # Much more lenient thresholds for problem zone
-            return {
-                "thumb_index_multiplier": 1.8,  # 80% more lenient
-                "middle_ring_multiplier": 2.0,  # 100% more lenient
-                "ring_pinky_multiplier": 2.0,  # 100% more lenient
-                "index_wrist_multiplier": 0.7,  # 30% less strict
-                "min_confidence": 0.4,  # Lower confidence requirement
-                "angle_weight_boost": 0.3,  # Boost angle detection weight
-                "require_all_checks": False,  # Don't require all checks to pass
-            }
-        elif position_category == "edge":
-            # Moderately lenient for edge positions
-            return {
-                "thumb_index_multiplier": 1.4,
-                "middle_ring_multiplier": 1.5,
-                "ring_pinky_multiplier": 1.5,
-                "index_wrist_multiplier": 0.85,
-                "min_confidence": 0.5,
-                "angle_weight_boost": 0.15,
-                "require_all_checks": False,
-            }
-        else:
-            # Normal thresholds for center area
-            return {
-                "thumb_index_multiplier": 1.0,
-                "middle_ring_multiplier": 1.0,
-                "ring_pinky_multiplier": 1.0,
-                "index_wrist_multiplier": 1.0,
-                "min_confidence": 0.6,
-                "angle_weight_boost": 0.0,
-                "require_all_checks": True,
-            }
-
-    def adjust_detection_for_problem_zone(self, hand_landmarks) -> dict:
+        return ADAPTIVE_THRESHOLDS.get(position_category, ADAPTIVE_THRESHOLDS["normal"])
+
+    def adjust_detection_for_problem_zone(self, landmarks: np.ndarray) -> dict:
         """
-        Special adjustments for the problem zone
+        Special adjustments for the problem zone, from a (21, 3) landmark array
         """
         hints = {}
 
         # In problem zone, we often see compressed perspective
         # Index finger appears shorter, other fingers bunch together
 
-        # Get key landmarks
-        index_tip = hand_landmarks.landmark[8]  # INDEX_FINGER_TIP
-        index_mcp = hand_landmarks.landmark[5]  # INDEX_FINGER_MCP
-        middle_tip = hand_landmarks.landmark[12]  # MIDDLE_FINGER_TIP
-        wrist = hand_landmarks.landmark[0]  # WRIST
+        # Wrist to index MCP vector
+        dx, dy = np.subtract(landmarks[INDEX_FINGER_MCP, :2], landmarks[WRIST, :2], dtype=np.float64).tolist()
 
         # Check if hand is angled upward (common in bottom region)
-        hand_angle = np.arctan2(index_mcp.y - wrist.y, index_mcp.x - wrist.x)
+        hand_angle = math.atan2(dy, dx)
         hints["hand_pointing_up"] = hand_angle < -0.5  # Pointing upward
 
         # Check if fingers appear compressed (Z-depth issue)
-        z_spread = abs(index_tip.z - middle_tip.z)
+        z_spread = abs(float(landmarks[INDEX_FINGER_TIP, 2]) - float(landmarks[MIDDLE_FINGER_TIP, 2]))
         hints["fingers_compressed"] = z_spread < 0.02
 
         # Check if hand appears small (far or angled)
-        hand_size = np.sqrt((index_mcp.x - wrist.x) ** 2 + (index_mcp.y - wrist.y) ** 2)
+        hand_size = math.hypot(dx, dy)
         hints["hand_small"] = hand_size < 0.15
 
         return hints
@@ -0,0 +1,55 @@
+"""
+Hand tracking overlays drawn onto the camera preview at preview resolution
+
+Overlays used to be drawn on the full-resolution camera frame, which was then
+downscaled to the preview, so most of the drawn pixels were thrown away. They are now
+drawn from landmark arrays straight into the preview buffer after the downscale, and
+only by screens that actually show a preview.
+"""
+
+# Standard library imports
+from typing import Tuple
+
+# Third-party imports
+import cv2
+import mediapipe as mp
+import numpy as np
+
+# (21, 2) landmark rows joined by a bone, as MediaPipe draws them
+HAND_CONNECTIONS = np.array(sorted(mp.solutions.hands.HAND_CONNECTIONS), dtype=np.intp)
+INDEX_FINGER_TIP = 8
+
+# Frames are RGB; colours match LANDMARK_DRAWING_SPEC and MediaPipe's connection colour
+CONNECTION_COLOR = (224, 224, 224)
+LANDMARK_COLOR = (255, 0, 0)
+LANDMARK_RADIUS = 2
+GUN_COLOR = (0, 255, 0)
+GUN_RADIUS = 15  # Index fingertip marker radius in camera pixels, scaled to the preview
+SHOOT_COLOR = (255, 0, 0)
+
+
+def draw_hand(image: np.ndarray, landmarks: np.ndarray, is_gun: bool, scale: float) -> None:
+    """Draw one hand onto a mirrored RGB preview image
+
+    Args:
+        image: Preview pixels, drawn on in place
+        landmarks: (21, 3) normalized landmarks, mirrored to the selfie view
+        is_gun: Mark the index fingertip as a finger gun
+        scale: Preview width over camera frame width
+    """
+    height, width = image.shape[:2]
+    points = np.rint(landmarks[:, :2] * (width, height)).astype(np.int32)
+    cv2.polylines(image, points[HAND_CONNECTIONS], False, CONNECTION_COLOR, 1)
+    for x, y in points.tolist():
+        cv2.circle(image, (x, y), LANDMARK_RADIUS, LANDMARK_COLOR, -1)
+    if is_gun:
+        x, y = points[INDEX_FINGER_TIP].tolist()
+        cv2.circle(image, (x, y), max(int(round(GUN_RADIUS * scale)), 2), GUN_COLOR, -1)
+
+
+def draw_shoot_label(image: np.ndarray, scale: float, origin: Tuple[int, int] = (10, 30)) -> None:
+    """Draw the SHOOT! label (sized for the camera frame) onto a preview image"""
+    position = (int(origin[0] * scale), int(origin[1] * scale))
+    cv2.putText(
+        image, "SHOOT!", position, cv2.FONT_HERSHEY_SIMPLEX, scale, SHOOT_COLOR, max(int(round(2 * scale)), 1), cv2.LINE_AA
+    )
@@ -0,0 +1,380 @@
+"""
+Process-wide vision service that runs hand tracking once per camera frame
+and shares the result with whichever screen is active
+"""
+
+# Standard library imports
+import time
+from types import SimpleNamespace
+from typing import List, Optional, Tuple
+
+# Third-party imports
+import numpy as np
+
+# Local application imports
+from utils.constants import MODEL_COMPLEXITY_BUDGET_MS
+from utils.latency_tracker import get_latency_tracker
+
+try:
+    # Local application imports
+    from game.cv.finger_gun_detection import EnhancedHandTracker as HandTracker
+    from game.cv.finger_gun_detection import InferenceWorker, LandmarkRecorder, array_to_landmarks, landmarks_to_array
+    from game.cv.finger_gun_detection.model_calibration import MODEL_COMPLEXITY_NAMES, calibration_key, load_calibration
+
+    print("[Hand Tracking] Using Enhanced Tracker with preprocessing, angles, and Kalman filter")
+except ImportError:
+    # Original tracker fallback
+    # Local application imports
+    from game.hand_tracker import HandTracker
+
+    InferenceWorker = None
+    LandmarkRecorder = None
+    load_calibration = None
+
+    def landmarks_to_array(hand_landmarks) -> np.ndarray:
+        return np.array([(lm.x, lm.y, lm.z) for lm in hand_landmarks.landmark], dtype=np.float32)
+
+    print("[Hand Tracking] Using Original Tracker")
+
+
+class VisionFrame:
+    """Hand tracking result for a single camera frame"""
+
+    def __init__(
+        self,
+        sequence: int,
+        timestamp: float,
+        frame: np.ndarray,
+        results,
+        stats: Optional[dict],
+        hands: List[Tuple],
+        frame_sequence: Optional[int] = None,
+        landmarks: Optional[List[np.ndarray]] = None,
+    ):
+        self.sequence = sequence  # Sequence number of the camera frame the landmarks were detected on
+        self.timestamp = timestamp  # Capture timestamp of that frame (time.perf_counter)
+        # Sequence number of the camera frame shown in frame; newer than sequence while
+        # inference runs in the worker process and the preview runs ahead of detection
+        self.frame_sequence = frame_sequence if frame_sequence is not None else sequence
+        # Unmirrored, read-only RGB frame for the preview (the preprocessed detection frame
+        # in debug mode); previews mirror it and draw overlays after downscaling
+        self.frame = frame
+        self.results = results  # Raw MediaPipe results
+        self.stats = stats  # Tracking statistics (enhanced tracker only)
+        self.hands = hands  # List of (hand_landmarks, detect_finger_gun result tuple)
+        # (21, 3) mirrored, normalized landmarks per hand, for drawing the preview overlay
+        self.landmarks = (
+            [landmarks_to_array(hand_landmarks) for hand_landmarks, _ in hands] if landmarks is None else landmarks
+        )
+
+
+class VisionClient:
+    """Per-screen handle on the shared hand tracker
+
+    Attribute access falls through to the shared tracker, while shot-gesture state
+    (thumb reset, last shot time, previous thumb position) is kept per screen so one
+    screen's flick never leaks into another.
+    """
+
+    def __init__(self, service: "VisionService"):
+        self._service = service
+        self.reset_gesture_state()
+
+    def __getattr__(self, name):
+        # Only called for attributes not found on the client itself
+        return getattr(self._service.hand_tracker, name)
+
+    def reset_gesture_state(self) -> None:
+        """Reset this screen's shot-gesture state"""
+        self.shooting_detected = False
+        self.last_shoot_time = 0
+        self.previous_thumb_y = None
+        self.previous_time = 0
+        self.thumb_reset = True
+
+    def detect_shooting_gesture(self, thumb_tip, thumb_middle_dist: float, now: Optional[float] = None) -> bool:
+        """Detect a thumb flick using this screen's shot-gesture state"""
+        return self._service.hand_tracker.detect_shooting_gesture(thumb_tip, thumb_middle_dist, state=self, now=now)
+
+    def reset_tracking_state(self) -> None:
+        """Reset this screen's gesture state and the shared tracker's temporal state"""
+        self.reset_gesture_state()
+        self._service.hand_tracker.reset_tracking_state()
+
+
+class VisionService:
+    """Owns the single hand tracker and processes each camera frame exactly once
+
+    With use_inference_worker, preprocessing and MediaPipe run in a separate process fed
+    through shared memory; this process only applies Kalman smoothing and the gesture
+    logic to the newest landmarks, so the render loop never waits on inference.
+    """
+
+    def __init__(self, camera_manager, hand_tracker=None, use_inference_worker: bool = False):
+        self.camera_manager = camera_manager
+        self.latest: Optional[VisionFrame] = None
+        self.latency_tracker = get_latency_tracker()
+
+        self.inference_worker = None
+        self.worker_restarts = 0
+        self._last_result = None
+        self._last_result_results = None
+        self._last_result_hands = []
+        self._last_result_landmarks = []
+        self._last_result_stats = None
+        self._last_preprocess_stats = (1.0, "full")  # Pixel ratio and tier of the newest inferred frame
+        self._worker_model_info = None  # Model the worker reported and its cached calibration
+        self.recorder = None  # LandmarkRecorder while a recording is running
+
+        if hand_tracker is not None:
+            self.hand_tracker = hand_tracker
+        elif use_inference_worker and InferenceWorker is not None:
+            # Landmarks come from the worker; this tracker only runs smoothing and gestures
+            self.hand_tracker = HandTracker(load_model=False)
+            self._start_inference_worker()
+        else:
+            self.hand_tracker = HandTracker()
+
+    def _start_inference_worker(self) -> None:
+        """Start the inference worker for the camera's current resolution"""
+        frame_shape = (self.camera_manager.frame_height, self.camera_manager.frame_width, 3)
+        try:
+            # The worker hands the camera each new frame ring, including on restarts
+            self.inference_worker = InferenceWorker(frame_shape, on_frame_ring=self.camera_manager.attach_frame_ring)
+        except Exception as e:
+            print(f"[Hand Tracking] Could not start inference worker: {e}")
+            self._fall_back_to_in_process()
+            return
+        self._last_result = None
+        print(f"[Hand Tracking] Running inference in worker process (pid {self.inference_worker.process.pid})")
+
+    def _stop_inference_worker(self) -> None:
+        """Shut the worker down (it detaches the frame ring from the camera first)"""
+        if self.inference_worker is None:
+            return
+        self.worker_restarts += self.inference_worker.restarts
+        self.inference_worker.close()
+        self.inference_worker = None
+
+    def _fall_back_to_in_process(self) -> None:
+        """Give up on the worker and load MediaPipe in this process"""
+        print("[Hand Tracking] Falling back to in-process inference")
+        self._stop_inference_worker()
+        self.hand_tracker = HandTracker()
+        self.hand_tracker.reset_tracking_state()
+
+    def create_client(self) -> VisionClient:
+        """Create a per-screen handle on the shared tracker"""
+        return VisionClient(self)
+
+    def process(self, debug_mode: bool = False) -> Optional[VisionFrame]:
+        """Run hand tracking on the newest camera frame
+
+        Returns the cached result when the camera has not delivered a new frame since
+        the last call, or None when no frame is available.
+        """
+        ret, frame = self.camera_manager.read_rgb_frame("hand_tracking")
+        if not ret or frame is None:
+            if self.latest is not None:
+                self.hand_tracker.reset_tracking_state()
+                self.latest = None
+            return None
+
+        sequence = self.camera_manager.last_read_sequence
+        if self.inference_worker is not None:
+            return self._process_from_worker(frame, sequence)
+
+        if self.latest is not None and self.latest.frame_sequence == sequence:
+            return self.latest
+
+        # Handle tracker return values
+        if hasattr(self.hand_tracker, "enable_preprocessing"):  # Enhanced tracker
+            capture_timestamp = self.camera_manager.last_read_timestamp
+            processed_frame, results, stats = self.hand_tracker.process_frame(
+                frame, debug_mode, capture_timestamp, mirror=False
+            )
+            if not self.hand_tracker.last_frame_skipped:
+                self.latency_tracker.record("preprocess", capture_timestamp, self.hand_tracker.preprocessed_at)
+                self.latency_tracker.record("detect", capture_timestamp, self.hand_tracker.detected_at)
+            self.latency_tracker.record("kalman", capture_timestamp)
+        else:  # Original tracker
+            _, results = self.hand_tracker.process_frame(frame)
+            processed_frame = frame
+            stats = None
+
+        hands = []
+        if results.multi_hand_landmarks:
+            for hand_landmarks in results.multi_hand_landmarks:
+                detection = self.hand_tracker.detect_finger_gun(
+                    hand_landmarks, self.camera_manager.frame_width, self.camera_manager.frame_height
+                )
+                hands.append((hand_landmarks, detection))
+        else:
+            self.hand_tracker.reset_tracking_state()
+
+        self.latest = VisionFrame(sequence, self.camera_manager.last_read_timestamp, processed_frame, results, stats, hands)
+        return self.latest
+
+    def _process_from_worker(self, frame: np.ndarray, frame_sequence: int) -> Optional[VisionFrame]:
+        """Combine the newest camera frame with the newest landmarks from the worker"""
+        worker = self.inference_worker
+
+        # A camera switch can change the resolution; the ring is sized per resolution
+        if frame.shape != worker.frame_shape:
+            self._stop_inference_worker()
+            self._start_inference_worker()
+            return self.latest
+
+        if not worker.poll():
+            self._fall_back_to_in_process()
+            return self.latest
+
+        newer_than = self._last_result.frame_sequence if self._last_result is not None else 0
+        result = worker.read_result(newer_than)
+        if result is None and self.latest is not None and self.latest.frame_sequence == frame_sequence:
+            return self.latest
+
+        if result is not None:
+            start_time = time.time()
+            if result.skipped:
+                # Steady hand: the worker skipped inference and the Kalman tracker fills in
+                results = self.hand_tracker.predict_skipped_frame(result.capture_timestamp)
+            else:
+                results = SimpleNamespace(multi_hand_landmarks=[array_to_landmarks(hand) for hand in result.landmarks] or None)
+                self.hand_tracker.apply_temporal_filter(results, result.capture_timestamp)
+                self.latency_tracker.record("preprocess", result.capture_timestamp, result.preprocessed_at)
+                self.latency_tracker.record("detect", result.capture_timestamp, result.detected_at)
+            self.latency_tracker.record("kalman", result.capture_timestamp)
+
+            hands = []
+            if results.multi_hand_landmarks:
+                for hand_landmarks in results.multi_hand_landmarks:
+                    detection = self.hand_tracker.detect_finger_gun(
+                        hand_landmarks, self.camera_manager.frame_width, self.camera_manager.frame_height
+                    )
+                    hands.append((hand_landmarks, detection))
+            else:
+                self.hand_tracker.reset_tracking_state()
+
+            # The worker skips frames at the stride the shared tracker's scheduler asks for
+            scheduler = self.hand_tracker.inference_scheduler
+            worker.set_inference_stride(scheduler.stride if scheduler else 1)
+
+            if not result.skipped:
+                self.hand_tracker.preprocessing_time = result.preprocessing_ms
+                self.hand_tracker.detection_time = result.detection_ms
+                self._last_preprocess_stats = (result.preprocess_pixel_ratio, result.preprocess_tier)
+            stats = self.hand_tracker.get_tracking_stats(result.total_ms + (time.time() - start_time) * 1000)
+            stats["preprocess_pixel_ratio"], stats["preprocess_tier"] = self._last_preprocess_stats
+            stats["inference_fps"] = result.inference_fps
+            stats["skipped_frames"] = result.skipped_frames
+            stats["model_complexity"] = result.model_complexity
+            stats["inference_mode"] = "worker"
+            stats["worker_restarts"] = self.worker_restarts + worker.restarts
+
+            self._last_result = result
+            self._last_result_results = results
+            self._last_result_hands = hands
+            self._last_result_landmarks = [landmarks_to_array(hand_landmarks) for hand_landmarks, _ in hands]
+            self._last_result_stats = stats
+
+        if self._last_result is None:
+            # Worker has not produced anything yet: show the plain camera frame
+            self.latest = VisionFrame(0, 0.0, frame, SimpleNamespace(multi_hand_landmarks=None), None, [], frame_sequence)
+            return self.latest
+
+        # The newest camera frame with the newest landmarks; the preview draws them over it
+        self.latest = VisionFrame(
+            self._last_result.frame_sequence,
+            self._last_result.capture_timestamp,
+            frame,
+            self._last_result_results,
+            self._last_result_stats,
+            self._last_result_hands,
+            frame_sequence,
+            self._last_result_landmarks,
+        )
+        return self.latest
+
+    def get_model_info(self) -> Optional[dict]:
+        """MediaPipe model in use and the calibration that chose it (None if not known yet)
+
+        Returns a dict with model_complexity, its display name, and calibration (None when
+        the model was forced by configuration).
+        """
+        if load_calibration is None:
+            return None
+        if self.inference_worker is None:
+            if getattr(self.hand_tracker, "model_complexity", None) is None:
+                return None
+            complexity = self.hand_tracker.model_complexity
+            return {
+                "model_complexity": complexity,
+                "name": MODEL_COMPLEXITY_NAMES[complexity],
+                "calibration": self.hand_tracker.model_calibration,
+            }
+
+        # The worker calibrates and caches; re-read the cache only when it reports another model
+        complexity = self._last_result.model_complexity if self._last_result is not None else None
+        if complexity is None:
+            return None
+        if self._worker_model_info is None or self._worker_model_info["model_complexity"] != complexity:
+            calibration = load_calibration(calibration_key(self.hand_tracker.detection_width), MODEL_COMPLEXITY_BUDGET_MS)
+            if calibration and calibration["model_complexity"] != complexity:
+                calibration = None  # Model forced by configuration
+            self._worker_model_info = {
+                "model_complexity": complexity,
+                "name": MODEL_COMPLEXITY_NAMES[complexity],
+                "calibration": calibration,
+            }
+        return self._worker_model_info
+
+    def start_recording(self, path: Optional[str] = None) -> Optional[str]:
+        """Start recording landmarks to a file; returns its path, or None if unsupported"""
+        if LandmarkRecorder is None:
+            print("[Hand Tracking] Landmark recording needs the enhanced tracker")
+            return None
+        self.stop_recording()
+        if path is None:
+            path = time.strftime("landmarks_%Y%m%d_%H%M%S.lmk")
+        self.recorder = LandmarkRecorder(path, self.camera_manager.frame_width, self.camera_manager.frame_height)
+        print(f"[Hand Tracking] Recording landmarks to {path}")
+        return path
+
+    def stop_recording(self) -> None:
+        """Close the current landmark recording, if any"""
+        if self.recorder is None:
+            return
+        self.recorder.close()
+        print(f"[Hand Tracking] Recorded {self.recorder.frames} frames to {self.recorder.path}")
+        self.recorder = None
+
+    def record_landmarks(self, vision_frame: VisionFrame, shot: bool) -> None:
+        """Append the first hand of a processed frame (and whether it fired) to the recording"""
+        if self.recorder is None or vision_frame.timestamp <= 0:
+            return
+        hand_landmarks = vision_frame.hands[0][0] if vision_frame.hands else None
+        detection_mode = getattr(self.hand_tracker, "detection_mode", "standard") if hand_landmarks else "none"
+        self.recorder.record(vision_frame.timestamp, hand_landmarks, detection_mode, shot)
+
+    def release(self) -> None:
+        """Stop the inference worker and release the MediaPipe graph"""
+        self.stop_recording()
+        self._stop_inference_worker()
+        if getattr(self.hand_tracker, "hands", None) is not None:
+            self.hand_tracker.hands.close()
+        self.latest = None
+
+
+# Global vision service instance
+_vision_service = None
+
+
+def get_vision_service(camera_manager=None, use_inference_worker: bool = False) -> VisionService:
+    """Get the global vision service instance, creating it for camera_manager on first use"""
+    global _vision_service
+    if _vision_service is None:
+        if camera_manager is None:
+            raise ValueError("The vision service must be created with a camera manager")
+        _vision_service = VisionService(camera_manager, use_inference_worker=use_inference_worker)
+    return _vision_service
@@ -3,6 +3,7 @@ Main game manager that handles different screens and game flow
 """
 
 # Standard library imports
+import os
 import sys
 import threading
 from typing import Dict, Optional
@@ -11,6 +12,7 @@ from typing import Dict, Optional
 import pygame
 
 # Local application imports
+from game.cv.vision_service import get_vision_service
 from screens.blinky_bird_screen import BlinkyBirdScreen
 from screens.capybara_hunt_screen import CapybaraHuntScreen
 from screens.credits_screen import CreditsScreen
@@ -35,7 +37,13 @@ from utils.constants import (
     GAME_STATE_SETTINGS,
     SCREEN_HEIGHT,
     SCREEN_WIDTH,
+    USE_INFERENCE_WORKER,
 )
+from utils.latency_tracker import get_latency_tracker
+from utils.settings_manager import get_settings_manager
+
+# Path to record hand landmarks to from startup (see game.cv.finger_gun_detection.landmark_recording)
+RECORD_LANDMARKS_ENV = "ARCVDE_RECORD_LANDMARKS"
 
 
 class GameManager:
@@ -67,6 +75,7 @@ class GameManager:
         # Loading state tracking
         self.loading_complete = False
         self.camera_manager = None
+        self.vision_service = None
         self.initialization_started = False
 
         # Performance tracking
@@ -82,9 +91,15 @@ class GameManager:
         """Initialize remaining game screens after camera is ready"""
         try:
             print("Initializing camera...")
-            self.camera_manager = CameraManager()
+            self.camera_manager = CameraManager(threaded_capture=True)
             self.camera_manager.initialize_camera(DEFAULT_CAMERA_ID)
 
+            # One hand tracker shared by every screen (MediaPipe runs once, in a worker process if enabled)
+            print("Initializing vision service...")
+            self.vision_service = get_vision_service(self.camera_manager, use_inference_worker=USE_INFERENCE_WORKER)
+            if os.environ.get(RECORD_LANDMARKS_ENV):
+                self.vision_service.start_recording(os.environ[RECORD_LANDMARKS_ENV])
+
             print("Initializing game screens...")
             self.screens[GAME_STATE_MENU] = MenuScreen(self.screen, self.camera_manager)
             print("Menu screen initialized")
@@ -134,6 +149,20 @@ class GameManager:
                 self.running = False
                 return
 
+            # F9 in debug mode exports the motion-to-photon latency samples
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_F9:
+                if get_settings_manager().get("debug_mode", False):
+                    path = get_latency_tracker().export_csv()
+                    print(f"Latency samples exported to {path}")
+
+            # F10 in debug mode starts/stops recording landmarks for offline replay
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_F10:
+                if get_settings_manager().get("debug_mode", False) and self.vision_service:
+                    if self.vision_service.recorder is None:
+                        self.vision_service.start_recording()
+                    else:
+                        self.vision_service.stop_recording()
+
             # Let current screen handle the event
             current_screen = self.screens.get(self.current_state)
             if current_screen and hasattr(current_screen, "handle_event"):
@@ -169,9 +198,10 @@ class GameManager:
             if old_state == GAME_STATE_CAPYBARA_HUNT:
                 sound_manager.stop_ambient(fade_ms=500)  # Gentle fade
 
-            # When leaving Blinky Bird, stop its music
+            # When leaving Blinky Bird, stop its music and its blink detection thread
             if old_state == GAME_STATE_BLINKY_BIRD:
                 sound_manager.stop_ambient(fade_ms=500)  # Gentle fade
+                self.screens[GAME_STATE_BLINKY_BIRD].stop_detection()
 
             # When entering menu, instructions, or basic game modes, start elevator music
             if new_state in [
@@ -263,6 +293,7 @@ class GameManager:
             current_screen.draw()
 
         pygame.display.flip()
+        get_latency_tracker().on_display_flip()
 
     def run(self) -> None:
         """Main game loop"""
@@ -312,6 +343,14 @@ class GameManager:
         """Clean up resources"""
         print("Cleaning up resources...")
 
+        # Stop blink detection before the camera goes away
+        if GAME_STATE_BLINKY_BIRD in self.screens:
+            self.screens[GAME_STATE_BLINKY_BIRD].stop_detection()
+
+        # Release the shared hand tracker
+        if self.vision_service:
+            self.vision_service.release()
+
         # Release camera (only if it was initialized)
         if self.camera_manager:
             self.camera_manager.release()
@@ -31,6 +31,9 @@ except ImportError:
     SHOOT_VELOCITY_THRESHOLD = 0.1
     THUMB_INDEX_THRESHOLD = 35
 
+# Frames are RGB; MediaPipe's default landmark colour (0, 0, 255) assumes BGR
+LANDMARK_DRAWING_SPEC = mp.solutions.drawing_utils.DrawingSpec(color=(255, 0, 0), thickness=2, circle_radius=2)
+
 
 class HandTracker:
     """Enhanced hand tracking for finger gun detection"""
@@ -188,15 +191,27 @@ class HandTracker:
         else:
             return False, None, None, None, None, self.confidence_score
 
-    def detect_shooting_gesture(self, thumb_tip, thumb_middle_dist: float) -> bool:
-        """Detect shooting gesture (thumb flick) - requires thumb reset between shots"""
-        current_time = time.time()
+    def detect_shooting_gesture(self, thumb_tip, thumb_middle_dist: float, state=None, now: Optional[float] = None) -> bool:
+        """Detect shooting gesture (thumb flick) - requires thumb reset between shots
+
+        Args:
+            thumb_tip: Thumb tip landmark
+            thumb_middle_dist: Distance between thumb tip and middle finger PIP
+            state: Object holding the shot state (previous_thumb_y, previous_time, thumb_reset,
+                shooting_detected, last_shoot_time); defaults to the tracker itself
+            now: Capture timestamp of the frame in seconds (defaults to time.time()); the game
+                passes each frame's capture time and replays pass the recorded ones, so
+                thumb velocity follows capture spacing rather than processing jitter
+        """
+        if state is None:
+            state = self
+        current_time = time.time() if now is None else now
         current_thumb_y = thumb_tip.y
 
-        if self.previous_thumb_y is not None:
-            delta_time = current_time - self.previous_time
+        if state.previous_thumb_y is not None:
+            delta_time = current_time - state.previous_time
             if delta_time != 0:
-                thumb_velocity = (current_thumb_y - self.previous_thumb_y) / delta_time
+                thumb_velocity = (current_thumb_y - state.previous_thumb_y) / delta_time
             else:
                 thumb_velocity = 0
 
@@ -211,39 +226,49 @@ class HandTracker:
 
             if thumb_velocity < reset_velocity_threshold or thumb_middle_dist > reset_distance_threshold:
                 # Only reset if we haven't just shot (prevents immediate reset from recoil)
-                if current_time - self.last_shoot_time > 0.1:
-                    self.thumb_reset = True
-                    self.shooting_detected = False
+                if current_time - state.last_shoot_time > 0.1:
+                    state.thumb_reset = True
+                    state.shooting_detected = False
 
             # Detect shooting only if thumb was reset
             # Also require minimum time between thumb movements to prevent hand shake triggering
             if thumb_velocity > velocity_threshold and thumb_middle_dist < distance_threshold:
-                if self.thumb_reset and not self.shooting_detected and delta_time > 0.02:
-                    self.shooting_detected = True
-                    self.thumb_reset = False  # Require reset for next shot
-                    self.last_shoot_time = current_time
-                    self.previous_thumb_y = current_thumb_y
-                    self.previous_time = current_time
+                if state.thumb_reset and not state.shooting_detected and delta_time > 0.02:
+                    state.shooting_detected = True
+                    state.thumb_reset = False  # Require reset for next shot
+                    state.last_shoot_time = current_time
+                    state.previous_thumb_y = current_thumb_y
+                    state.previous_time = current_time
                     return True
 
-        self.previous_thumb_y = current_thumb_y
-        self.previous_time = current_time
+        state.previous_thumb_y = current_thumb_y
+        state.previous_time = current_time
         return False
 
     def process_frame(self, frame: np.ndarray) -> Tuple[np.ndarray, Optional[object]]:
-        """Process frame for hand detection"""
-        # Convert BGR to RGB
-        image = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        image.flags.writeable = False
-        results = self.hands.process(image)
-        image.flags.writeable = True
-        image = cv2.cvtColor(image, cv2.COLOR_RGB2BGR)
-
+        """Process frame for hand detection
+
+        Args:
+            frame: Unmirrored RGB frame, as delivered by CameraManager.read_rgb_frame
+
+        Returns:
+            Tuple of (image, results): a mirrored RGB copy to draw overlays on, and the
+            MediaPipe results with landmarks mirrored to match it
+        """
+        results = self.hands.process(frame)
+        if results.multi_hand_landmarks:
+            for hand_landmarks in results.multi_hand_landmarks:
+                for lm in hand_landmarks.landmark:
+                    lm.x = 1.0 - lm.x
+
+        image = cv2.flip(frame, 1)
         return image, results
 
     def draw_landmarks(self, image: np.ndarray, hand_landmarks) -> None:
-        """Draw hand landmarks on image"""
-        self.mp_drawing.draw_landmarks(image, hand_landmarks, self.mp_hands.HAND_CONNECTIONS)
+        """Draw hand landmarks on a mirrored RGB image"""
+        self.mp_drawing.draw_landmarks(
+            image, hand_landmarks, self.mp_hands.HAND_CONNECTIONS, landmark_drawing_spec=LANDMARK_DRAWING_SPEC
+        )
 
     def reset_tracking_state(self) -> None:
         """Reset tracking state when hand is lost"""
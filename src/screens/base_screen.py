@@ -6,23 +6,27 @@ Base screen class with shared finger gun functionality
 from typing import Optional, Tuple
 
 # Third-party imports
-import cv2
+import numpy as np
 import pygame
 
-try:
-    # Local application imports
-    from game.cv.finger_gun_detection import EnhancedHandTracker as HandTracker
-
-    print("[Hand Tracking] Using Enhanced Tracker with preprocessing, angles, and Kalman filter")
-except ImportError:
-    # Original tracker fallback
-    # Local application imports
-    from game.hand_tracker import HandTracker
-
-    print("[Hand Tracking] Using Original Tracker")
 # Local application imports
+from game.cv.finger_gun_detection.landmark_arrays import INDEX_FINGER_TIP
+from game.cv.preview_overlay import draw_hand, draw_shoot_label
+from game.cv.vision_service import get_vision_service
 from utils.camera_manager import CameraManager
-from utils.constants import DARK_GRAY, GREEN, PURPLE, SCREEN_HEIGHT, SCREEN_WIDTH, UI_ACCENT, WHITE, YELLOW
+from utils.constants import (
+    CROSSHAIR_PREDICTION,
+    DARK_GRAY,
+    GREEN,
+    PURPLE,
+    SCREEN_HEIGHT,
+    SCREEN_WIDTH,
+    UI_ACCENT,
+    WHITE,
+    YELLOW,
+)
+from utils.crosshair_predictor import CrosshairPredictor
+from utils.latency_tracker import get_latency_tracker
 from utils.settings_manager import get_settings_manager
 from utils.sound_manager import get_sound_manager
 
@@ -34,17 +38,26 @@ class BaseScreen:
         self.screen = screen
         self.camera_manager = camera_manager
 
-        self.hand_tracker = HandTracker()
+        # Hand tracking runs once per frame in the shared vision service; the client
+        # keeps this screen's shot-gesture state separate from other screens
+        self.vision_service = get_vision_service(camera_manager)
+        self.hand_tracker = self.vision_service.create_client()
         self.sound_manager = get_sound_manager()
         self.settings_manager = get_settings_manager()
+        self.latency_tracker = get_latency_tracker()
 
         # Finger gun interaction state
-        self.crosshair_pos = None
+        self.crosshair_pos = None  # Measured fingertip position: shots and button hit-tests
+        self.crosshair_draw_pos = None  # Where the crosshair is drawn (predicted to display time)
         self.crosshair_color = GREEN
+        # Moves the drawn crosshair every render frame, ahead to where the hand is at display time
+        self.crosshair_predictor = CrosshairPredictor() if CROSSHAIR_PREDICTION else None
         self.shoot_detected = False
         self.last_shoot_check_time = 0
         self.shoot_detected_time = 0
-        self._processed_camera_frame = None
+        self._preview_frame = None  # Newest VisionFrame, drawn by draw_camera_with_tracking
+        self._shoot_label_sequence = None  # Landmark sequence whose preview shows SHOOT!
+        self._last_tracked_sequence = 0
 
         # Shooting animation state
         self.shoot_pos = None
@@ -53,53 +66,53 @@ class BaseScreen:
 
     def process_finger_gun_tracking(self) -> None:
         """Process finger gun tracking - shared across all screens"""
-        ret, frame = self.camera_manager.read_frame()
-        if not ret or frame is None:
-            self.hand_tracker.reset_tracking_state()
-            self.crosshair_pos = None
+        debug_mode = self.settings_manager.get("debug_mode", False)
+        vision_frame = self.vision_service.process(debug_mode)
+        if vision_frame is None:
+            self.hand_tracker.reset_gesture_state()
+            self._clear_crosshair()
             self.shoot_detected = False
             return
 
-        # Process frame for hand detection
-        debug_mode = self.settings_manager.get("debug_mode", False)
+        # The preview can advance without new landmarks when inference runs in the worker
+        self._preview_frame = vision_frame
 
-        # Handle tracker return values
-        if hasattr(self.hand_tracker, "enable_preprocessing"):  # Enhanced tracker
-            processed_frame, results, stats = self.hand_tracker.process_frame(frame, debug_mode)
-            self.last_tracking_stats = stats  # Store for debug overlay
-        else:  # Original tracker
-            processed_frame, results = self.hand_tracker.process_frame(frame)
-            self.last_tracking_stats = None
-
-        if results.multi_hand_landmarks:
-            for hand_landmarks in results.multi_hand_landmarks:
-                self.hand_tracker.draw_landmarks(processed_frame, hand_landmarks)
-
-                # Detect finger gun
-                (
-                    is_gun,
-                    index_coords,
-                    thumb_tip,
-                    middle_mcp,
-                    thumb_middle_dist,
-                    confidence,
-                ) = self.hand_tracker.detect_finger_gun(
-                    hand_landmarks, self.camera_manager.frame_width, self.camera_manager.frame_height
-                )
+        # No new landmarks since the last update (no new camera frame, or the worker is
+        # still busy); re-running shot detection would only skew the thumb velocity estimate
+        if vision_frame.sequence == self._last_tracked_sequence:
+            if self.crosshair_predictor and self.crosshair_pos:
+                self.crosshair_draw_pos = self.crosshair_predictor.predict()
+            return
+        self._last_tracked_sequence = vision_frame.sequence
 
-                if is_gun and index_coords:
-                    cv2.circle(processed_frame, index_coords, 15, (0, 255, 0), -1)
+        self.last_tracking_stats = vision_frame.stats  # Store for debug overlay
+        capture_timestamp = vision_frame.timestamp
+        shot_fired = False
+        gesture_shot = False
 
+        if vision_frame.hands:
+            for hand_landmarks, detection in vision_frame.hands:
+                is_gun, index_coords, thumb_tip, middle_mcp, thumb_middle_dist, confidence = detection
+
+                if is_gun and index_coords:
                     # Map finger position to screen coordinates
                     screen_x = int((index_coords[0] / self.camera_manager.frame_width) * SCREEN_WIDTH)
                     screen_y = int((index_coords[1] / self.camera_manager.frame_height) * SCREEN_HEIGHT)
                     self.crosshair_pos = (screen_x, screen_y)
+                    self.crosshair_draw_pos = self.crosshair_pos
+                    if self.crosshair_predictor:
+                        self.crosshair_predictor.add_sample(self.crosshair_pos, capture_timestamp, self._fingertip_velocity())
+                        self.crosshair_draw_pos = self.crosshair_predictor.predict()
 
                     # Always use green for crosshair
                     self.crosshair_color = GREEN
 
                     # Detect shooting gesture
-                    shoot_this_frame = self.hand_tracker.detect_shooting_gesture(thumb_tip, thumb_middle_dist)
+                    shoot_this_frame = self.hand_tracker.detect_shooting_gesture(
+                        thumb_tip, thumb_middle_dist, now=capture_timestamp
+                    )
+                    self.latency_tracker.record("gesture", capture_timestamp)
+                    gesture_shot = gesture_shot or shoot_this_frame
                     if shoot_this_frame and not self.shoot_detected:  # Only set if not already detected
                         # Standard library imports
                         import time
@@ -109,6 +122,8 @@ class BaseScreen:
                         if current_time - self.shoot_detected_time > 0.3:  # 300ms cooldown between shots
                             self.shoot_detected = True
                             self.shoot_detected_time = current_time
+                            self.latency_tracker.record("shot", capture_timestamp)
+                            shot_fired = True
 
                             # Trigger shoot animation and sound
                             self.shoot_pos = self.crosshair_pos
@@ -117,17 +132,35 @@ class BaseScreen:
 
                     # Show if shoot is detected on camera feed
                     if shoot_this_frame:  # Show SHOOT! when shooting happens, not when flag is set
-                        cv2.putText(processed_frame, "SHOOT!", (10, 30), cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 0, 255), 2)
+                        self._shoot_label_sequence = vision_frame.sequence
 
                 else:
-                    self.crosshair_pos = None
+                    self._clear_crosshair()
         else:
-            self.hand_tracker.reset_tracking_state()
-            self.crosshair_pos = None
+            self.hand_tracker.reset_gesture_state()
+            self._clear_crosshair()
             self.shoot_detected = False
 
-        # Store processed frame for display
-        self._processed_camera_frame = processed_frame
+        self.vision_service.record_landmarks(vision_frame, gesture_shot)
+
+        # The next display flip is the first to show these landmarks (and this shot)
+        self.latency_tracker.mark_presented(capture_timestamp, shot_fired)
+
+    def _fingertip_velocity(self) -> Optional[Tuple[float, float]]:
+        """Index fingertip velocity in screen pixels per second from the Kalman filter state"""
+        kalman_tracker = getattr(self.hand_tracker, "kalman_tracker", None)
+        velocity = kalman_tracker.get_landmark_velocity(INDEX_FINGER_TIP) if kalman_tracker else None
+        if velocity is None:
+            return None
+        # Landmarks are mirrored and normalized, like the index_coords mapped to the screen
+        return float(velocity[0]) * SCREEN_WIDTH, float(velocity[1]) * SCREEN_HEIGHT
+
+    def _clear_crosshair(self) -> None:
+        """Hide the crosshair; it reappears at the next sample without gliding there"""
+        self.crosshair_pos = None
+        self.crosshair_draw_pos = None
+        if self.crosshair_predictor:
+            self.crosshair_predictor.reset()
 
     def draw_crosshair(self, pos: Tuple[int, int], color: Tuple[int, int, int]) -> None:
         """Draw crosshair at given position - shared across all screens"""
@@ -153,11 +186,14 @@ class BaseScreen:
 
     def draw_camera_with_tracking(self, x: int, y: int, width: int, height: int) -> None:
         """Draw camera feed with hand tracking overlays"""
-        if self._processed_camera_frame is not None:
-            camera_surface = self.camera_manager.frame_to_pygame_surface(self._processed_camera_frame, (width, height))
+        if self._preview_frame is not None:
+            # Mirrored and overlaid after downscaling, so only preview pixels are touched
+            camera_surface = self.camera_manager.frame_to_pygame_surface(
+                self._preview_frame.frame, (width, height), rgb=True, mirror=True, overlay=self._draw_tracking_overlay
+            )
         else:
             # Fallback to raw frame
-            ret, frame = self.camera_manager.read_frame()
+            ret, frame = self.camera_manager.read_frame("preview")
             if ret and frame is not None:
                 camera_surface = self.camera_manager.frame_to_pygame_surface(frame, (width, height))
             else:
@@ -207,6 +243,15 @@ class BaseScreen:
             label_rect = label.get_rect(center=(x + width // 2, zone_y + 10))
             self.screen.blit(label, label_rect)
 
+    def _draw_tracking_overlay(self, image: np.ndarray) -> None:
+        """Draw the landmarks, finger gun marker and SHOOT! label onto the preview pixels"""
+        vision_frame = self._preview_frame
+        scale = image.shape[1] / self.camera_manager.frame_width
+        for landmarks, (_, detection) in zip(vision_frame.landmarks, vision_frame.hands):
+            draw_hand(image, landmarks, detection[0] and detection[1] is not None, scale)
+        if self._shoot_label_sequence == vision_frame.sequence:
+            draw_shoot_label(image, scale)
+
     def highlight_button_if_aimed(self, button, highlight_color: Optional[Tuple[int, int, int]] = None) -> None:
         """Highlight button if crosshair is over it"""
         if self.crosshair_pos and hasattr(button, "rect") and button.rect.collidepoint(self.crosshair_pos):
@@ -237,7 +282,7 @@ class BaseScreen:
         debug_y = CAMERA_Y + CAMERA_HEIGHT + 10  # 10px gap below camera
 
         # Create semi-transparent background for debug info
-        debug_surface = pygame.Surface((CAMERA_WIDTH, 200))  # Match camera width
+        debug_surface = pygame.Surface((CAMERA_WIDTH, 340))  # Match camera width; room for latency stats
         debug_surface.set_alpha(200)
         debug_surface.fill((0, 0, 0))
         self.screen.blit(debug_surface, (debug_x, debug_y))
@@ -262,11 +307,19 @@ class BaseScreen:
         y_offset += 20
 
         preprocess_text = f"Preprocessing: {stats['preprocessing_ms']:.1f}ms"
+        if "preprocess_tier" in stats:
+            preprocess_text += f" [{stats['preprocess_tier']}]"
+        if 0 < stats.get("preprocess_pixel_ratio", 1.0) < 1.0:
+            preprocess_text += f" ROI {stats['preprocess_pixel_ratio']:.0%}"
         preprocess_surface = debug_font.render(preprocess_text, True, WHITE)
         self.screen.blit(preprocess_surface, (x_offset, y_offset))
         y_offset += 20
 
         detection_text = f"Detection: {stats['detection_ms']:.1f}ms"
+        if stats.get("inference_fps"):
+            # Effective inference rate; frames in between are Kalman predictions while the hand is steady
+            detection_text += f" @ {stats['inference_fps']:.0f}/s, 1 in {stats['inference_stride']}"
+            detection_text += f" ({stats['skipped_frames']} skipped)"
         detection_surface = debug_font.render(detection_text, True, WHITE)
         self.screen.blit(detection_surface, (x_offset, y_offset))
         y_offset += 20
@@ -300,6 +353,13 @@ class BaseScreen:
             self.screen.blit(kalman_surface, (x_offset, y_offset))
             y_offset += 20
 
+        # Crosshair prediction lead
+        if self.crosshair_predictor and self.crosshair_pos:
+            lead_text = f"Crosshair lead: {self.crosshair_predictor.lead_px:.0f}px"
+            lead_surface = debug_font.render(lead_text, True, (200, 200, 200))
+            self.screen.blit(lead_surface, (x_offset, y_offset))
+            y_offset += 20
+
         # Feature status
         if hasattr(self.hand_tracker, "enable_preprocessing"):
             features = []
@@ -313,6 +373,19 @@ class BaseScreen:
             feature_text = f"Features: {', '.join(features)}"
             feature_surface = debug_font.render(feature_text, True, (200, 200, 200))
             self.screen.blit(feature_surface, (x_offset, y_offset))
+            y_offset += 20
+
+        # Motion-to-photon latency (ms after capture), rolling percentiles per stage
+        latency_summary = self.latency_tracker.summary()
+        if latency_summary:
+            header_surface = debug_font.render("Latency p50/p95/p99 ms (F9: CSV)", True, (0, 255, 255))
+            self.screen.blit(header_surface, (x_offset, y_offset))
+            y_offset += 18
+            for stage, (p50, p95, p99) in latency_summary.items():
+                latency_text = f"{stage}: {p50:.0f} / {p95:.0f} / {p99:.0f}"
+                latency_surface = debug_font.render(latency_text, True, WHITE)
+                self.screen.blit(latency_surface, (x_offset, y_offset))
+                y_offset += 16
 
     def draw_shoot_animation(self) -> None:
         """Draw shooting animation - simple target practice style"""
@@ -5,6 +5,7 @@ Integrates blink detection with Flappy Bird-style gameplay.
 
 # Standard library imports
 import time
+from collections import deque
 from typing import Optional
 
 # Third-party imports
@@ -14,10 +15,11 @@ import pygame
 
 # Local application imports
 from game.blinky_bird import BlinkyBirdGame, GameState
-from game.cv.blink_detection import BlinkDetector
+from game.cv.blink_detection import BlinkDetectionWorker, BlinkDetector
 from screens.base_screen import BaseScreen
 from utils.camera_manager import CameraManager
 from utils.constants import (
+    BLINK_REFINE_LANDMARKS,
     CAMERA_HEIGHT,
     CAMERA_WIDTH,
     CAMERA_X,
@@ -36,6 +38,9 @@ from utils.constants import (
     WHITE,
 )
 
+LATENCY_WINDOW = 90  # Frames the debug panel's latency medians cover
+LATENCY_LOOP_HISTORY = 16  # Render loop timestamps kept to replay the previous path's timing
+
 
 class BlinkyBirdScreen(BaseScreen):
     """
@@ -60,7 +65,14 @@ class BlinkyBirdScreen(BaseScreen):
 
         # Initialize game and blink detector
         self.game = BlinkyBirdGame(SCREEN_WIDTH, SCREEN_HEIGHT)
-        self.blink_detector = BlinkDetector(calibration_time=2.0, sensitivity=1.0)
+        self.blink_detector = BlinkDetector(
+            calibration_time=2.0,
+            sensitivity=1.0,
+            refine_landmarks=BLINK_REFINE_LANDMARKS,
+        )
+        # Runs the detector on each camera frame as it arrives and queues blink events for update()
+        self.blink_worker = BlinkDetectionWorker(camera_manager, self.blink_detector)
+        self.detector_snapshot = self.blink_worker.snapshot  # Taken once per draw()
 
         # UI state
         self.show_debug_info = False
@@ -70,6 +82,19 @@ class BlinkyBirdScreen(BaseScreen):
         self.last_blink_type = "None"
         self.paused = False
 
+        # Newest camera frame (unmirrored RGB), read in update() for the preview
+        self.current_frame = None
+        self.current_frame_sequence = 0
+
+        # Blink input latency: capture to handled in update(), and what the same frames would
+        # have taken on the previous path (read in draw(), detected in the next update())
+        self._update_times = deque(maxlen=LATENCY_LOOP_HISTORY)
+        self._draw_times = deque(maxlen=LATENCY_LOOP_HISTORY)
+        self._pending_timings = deque()
+        self.blink_latency_ms = deque(maxlen=LATENCY_WINDOW)
+        self.draw_path_latency_ms = deque(maxlen=LATENCY_WINDOW)
+        self.detection_ms = deque(maxlen=LATENCY_WINDOW)
+
         # Camera preview settings
         self.preview_width = CAMERA_WIDTH
         self.preview_height = CAMERA_HEIGHT
@@ -97,7 +122,7 @@ class BlinkyBirdScreen(BaseScreen):
                 self.paused = False  # Unpause when resetting
             elif event.key == pygame.K_c:
                 # Recalibrate blink detector
-                self.blink_detector.recalibrate()
+                self.blink_worker.recalibrate()
                 # Reset game and teleport bird to middle of screen (y-axis)
                 self.game.reset_game()
                 self.game.bird.y = SCREEN_HEIGHT // 2
@@ -120,7 +145,7 @@ class BlinkyBirdScreen(BaseScreen):
     def update(self, dt: float, current_time: int) -> Optional[str]:
         """Update game logic and blink detection."""
         # Handle calibration state first
-        detector_status = self.blink_detector.get_status()
+        detector_status = self.blink_worker.snapshot.status
 
         # Set game state based on calibration status
         if not detector_status["calibrated"]:
@@ -139,20 +164,19 @@ class BlinkyBirdScreen(BaseScreen):
                     self.game.state = GameState.READY
                     self.game.ready_time = time.time()
 
-        # Process camera frame for blink detection
-        if hasattr(self, "current_frame") and self.current_frame is not None:
-            blink_detected, blink_type = self.blink_detector.process_frame(self.current_frame)
-
-            # Get fresh detector status after processing (calibration might have just completed!)
-            fresh_detector_status = self.blink_detector.get_status()
-
+        # Blink detection runs as frames arrive; handle every blink queued since the last update
+        now = time.perf_counter()
+        self._update_times.append(now)
+        self._acquire_frame()
+        for event in self.blink_worker.drain_events():
             # Only handle actual blinks if calibrated and not paused
-            if fresh_detector_status["calibrated"] and blink_detected and blink_type == "Blink" and not self.paused:
+            if self.blink_worker.snapshot.is_calibrated and event.blink_type == "Blink" and not self.paused:
                 self.last_blink_feedback_time = time.time()
-                self.last_blink_type = blink_type
+                self.last_blink_type = event.blink_type
 
                 # Handle blinks in game
-                self.game.handle_blink(blink_type)
+                self.game.handle_blink(event.blink_type)
+        self._update_latency_stats()
 
         # Update game state (skip if paused)
         if not self.paused:
@@ -168,11 +192,51 @@ class BlinkyBirdScreen(BaseScreen):
 
         return None
 
+    def _acquire_frame(self) -> None:
+        """Take the newest camera frame for the preview, and detect blinks on it without a worker thread"""
+        if self.camera_manager.threaded_capture:
+            self.blink_worker.start()  # No-op once running
+
+        ret, frame = self.camera_manager.read_rgb_frame("blinky_bird")
+        if not ret:
+            self.current_frame = None
+            return
+        sequence = self.camera_manager.last_read_sequence
+        if not self.blink_worker.running and sequence != self.blink_worker.last_sequence:
+            # Synchronous capture: nothing to wait on in the background, so detect here
+            self.blink_worker.process(frame, sequence, self.camera_manager.last_read_timestamp)
+        self.current_frame = frame
+        self.current_frame_sequence = sequence
+
+    def _update_latency_stats(self) -> None:
+        """Turn the worker's per-frame timings into blink input latency, once the loop has moved on"""
+        self._pending_timings.extend(self.blink_worker.drain_timings())
+        while self._pending_timings:
+            capture_timestamp, detected_at, detection_ms = self._pending_timings[0]
+            if not self._draw_times or capture_timestamp < self._draw_times[0]:
+                self._pending_timings.popleft()  # Older than the loop history (e.g. just started)
+                continue
+
+            # Now: handled by the first update() after detection finished
+            handled = next((t for t in self._update_times if t >= detected_at), None)
+            # Before: read by the first draw() after capture, detected in the update() after that
+            read = next((t for t in self._draw_times if t > capture_timestamp), None)
+            detected = next((t for t in self._update_times if read is not None and t > read), None)
+            if handled is None or detected is None:
+                break  # The loop has not reached these points yet
+
+            self._pending_timings.popleft()
+            self.blink_latency_ms.append((handled - capture_timestamp) * 1000)
+            self.draw_path_latency_ms.append((detected - capture_timestamp) * 1000 + detection_ms)
+            self.detection_ms.append(detection_ms)
+
+    def stop_detection(self) -> None:
+        """Stop the blink detection thread (restarted by the next update())"""
+        self.blink_worker.stop()
+
     def draw(self) -> None:
         """Draw the complete Blinky Bird screen."""
-        # Get camera frame for processing and display
-        ret, frame = self.camera_manager.read_frame()
-        self.current_frame = frame if ret else None
+        self._draw_times.append(time.perf_counter())
 
         # Clear screen with game background
         self.screen.fill((135, 206, 235))  # Sky blue background
@@ -182,7 +246,9 @@ class BlinkyBirdScreen(BaseScreen):
 
         # Draw UI overlays based on game state
         game_info = self.game.get_game_info()
-        detector_status = self.blink_detector.get_status()
+        # Detector state as the worker published it; the detector itself may be mid-frame
+        self.detector_snapshot = self.blink_worker.snapshot
+        detector_status = self.detector_snapshot.status
 
         if self.game.state == GameState.WAITING_FOR_CALIBRATION:
             self._draw_waiting_screen()
@@ -309,7 +375,7 @@ class BlinkyBirdScreen(BaseScreen):
         self.screen.blit(score_text, score_rect)
 
         # Blink counter (fun stats!)
-        detector_status = self.blink_detector.get_status()
+        detector_status = self.detector_snapshot.status
         blink_count = detector_status.get("blink_count", 0)
         blink_text = self.medium_font.render(f"Blinks: {blink_count}", True, VAPORWAVE_CYAN)
         blink_rect = blink_text.get_rect(center=(SCREEN_WIDTH // 2, 85))
@@ -340,7 +406,7 @@ class BlinkyBirdScreen(BaseScreen):
         self.screen.blit(score_text, score_rect)
 
         # Final blink count (fun stats!)
-        detector_status = self.blink_detector.get_status()
+        detector_status = self.detector_snapshot.status
         final_blink_count = detector_status.get("blink_count", 0)
         blink_text = self.medium_font.render(f"Total Blinks: {final_blink_count}", True, VAPORWAVE_MINT)
         blink_rect = blink_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 5))
@@ -367,16 +433,14 @@ class BlinkyBirdScreen(BaseScreen):
 
     def _draw_camera_preview(self):
         """Draw camera preview with blink detection visualization."""
-        if hasattr(self, "current_frame") and self.current_frame is not None:
-            # Create a copy of the frame for drawing overlays
-            frame_with_overlay = self.current_frame.copy()
-
-            # Add eye detection overlay
-            self._draw_eye_overlay_on_frame(frame_with_overlay)
-
-            # Convert frame to pygame surface using camera_manager method
+        if self.current_frame is not None:
+            # Mirrored and overlaid after downscaling, so only preview pixels are touched
             frame_surface = self.camera_manager.frame_to_pygame_surface(
-                frame_with_overlay, (self.preview_width, self.preview_height)
+                self.current_frame,
+                (self.preview_width, self.preview_height),
+                rgb=True,
+                mirror=True,
+                overlay=self._draw_eye_overlay_on_frame,
             )
 
             # Draw preview border
@@ -392,138 +456,91 @@ class BlinkyBirdScreen(BaseScreen):
             # No label above camera preview for cleaner look
 
     def _draw_eye_overlay_on_frame(self, frame: np.ndarray):
-        """Draw eye detection overlay on the camera frame."""
-        # Convert frame to RGB for MediaPipe processing
-        rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        rgb_frame.flags.writeable = False
+        """Draw eye detection overlay on the mirrored RGB preview pixels."""
+        # Reuse blink detection's Face Mesh pass instead of running Face Mesh again. It runs
+        # as frames arrive, so the cached result can be a camera frame off the preview
+        cached = self.detector_snapshot.get_cached_eyes(self.current_frame_sequence, max_age=1)
+        if cached is None:
+            return
 
-        # Process with MediaPipe Face Mesh
-        results = self.blink_detector.face_mesh.process(rgb_frame)
+        eye_landmarks, ears = cached
+        h, w = frame.shape[:2]
+        eye_points = (eye_landmarks * (w, h)).astype(np.int32)
+        scale = w / self.current_frame.shape[1]  # Overlay sizes are in camera pixels
 
-        if results.multi_face_landmarks:
-            face_landmarks = results.multi_face_landmarks[0]
-            h, w = frame.shape[:2]
+        # Draw eye landmarks and bounding boxes
+        self._draw_eye_landmarks(frame, eye_points, ears, scale)
 
-            # Draw eye landmarks and bounding boxes
-            self._draw_eye_landmarks(frame, face_landmarks, w, h)
+        # Add eye state text
+        self._draw_eye_state_text(frame, eye_points, scale)
 
-            # Add eye state text
-            self._draw_eye_state_text(frame, face_landmarks, w, h)
-
-    def _draw_eye_landmarks(self, frame: np.ndarray, face_landmarks, w: int, h: int):
+    def _draw_eye_landmarks(self, frame: np.ndarray, eye_points: np.ndarray, ears: tuple, scale: float):
         """Draw eye landmark points and bounding boxes on frame."""
         # Get eye states for coloring
-        detector_status = self.blink_detector.get_status()
+        detector_status = self.detector_snapshot.status
 
-        # Define colors
+        # Define colors (the preview is RGB)
         open_color = (0, 255, 0)  # Green for open eyes
-        closed_color = (0, 0, 255)  # Red for closed eyes
-
-        # Draw left eye landmarks
-        left_eye_indices = self.blink_detector.LEFT_EYE_KEY
-        left_closed = False
-
-        if detector_status["calibrated"]:
-            # Calculate current EAR to determine if eye is closed
-            left_eye_points = []
-            for idx in left_eye_indices:
-                landmark = face_landmarks.landmark[idx]
-                left_eye_points.append((landmark.x, landmark.y))
-
-            left_ear = self.blink_detector.calculate_ear(left_eye_points)
-            left_closed = left_ear < detector_status.get("adaptive_threshold_left", 0.25)
-
-        # Draw left eye landmarks
-        left_color = closed_color if left_closed else open_color
-        for idx in left_eye_indices:
-            landmark = face_landmarks.landmark[idx]
-            x, y = int(landmark.x * w), int(landmark.y * h)
-            cv2.circle(frame, (x, y), 2, left_color, -1)
-
-        # Draw left eye bounding box
-        if left_eye_indices:
-            left_points = [
-                (int(face_landmarks.landmark[idx].x * w), int(face_landmarks.landmark[idx].y * h)) for idx in left_eye_indices
-            ]
-            left_rect = cv2.boundingRect(np.array(left_points))
-            cv2.rectangle(frame, left_rect, left_color, 2)
-
-        # Draw right eye landmarks
-        right_eye_indices = self.blink_detector.RIGHT_EYE_KEY
-        right_closed = False
-
-        if detector_status["calibrated"]:
-            right_eye_points = []
-            for idx in right_eye_indices:
-                landmark = face_landmarks.landmark[idx]
-                right_eye_points.append((landmark.x, landmark.y))
-
-            right_ear = self.blink_detector.calculate_ear(right_eye_points)
-            right_closed = right_ear < detector_status.get("adaptive_threshold_right", 0.25)
-
-        # Draw right eye landmarks
-        right_color = closed_color if right_closed else open_color
-        for idx in right_eye_indices:
-            landmark = face_landmarks.landmark[idx]
-            x, y = int(landmark.x * w), int(landmark.y * h)
-            cv2.circle(frame, (x, y), 2, right_color, -1)
-
-        # Draw right eye bounding box
-        if right_eye_indices:
-            right_points = [
-                (int(face_landmarks.landmark[idx].x * w), int(face_landmarks.landmark[idx].y * h)) for idx in right_eye_indices
-            ]
-            right_rect = cv2.boundingRect(np.array(right_points))
-            cv2.rectangle(frame, right_rect, right_color, 2)
-
-    def _draw_eye_state_text(self, frame: np.ndarray, face_landmarks, w: int, h: int):
+        closed_color = (255, 0, 0)  # Red for closed eyes
+        radius = max(int(round(2 * scale)), 1)
+        thickness = max(int(round(2 * scale)), 1)
+
+        # Left eye rows come first, then the right eye
+        for points, ear, threshold_key in (
+            (eye_points[:6], ears[0], "adaptive_threshold_left"),
+            (eye_points[6:], ears[1], "adaptive_threshold_right"),
+        ):
+            closed = detector_status["calibrated"] and ear < detector_status.get(threshold_key, 0.25)
+            color = closed_color if closed else open_color
+            for x, y in points.tolist():
+                cv2.circle(frame, (x, y), radius, color, -1)
+            cv2.rectangle(frame, cv2.boundingRect(points), color, thickness)
+
+    def _draw_eye_state_text(self, frame: np.ndarray, eye_points: np.ndarray, scale: float):
         """Draw eye state text on the frame."""
-        detector_status = self.blink_detector.get_status()
+        detector_status = self.detector_snapshot.status
+        thickness = max(int(round(2 * scale)), 1)
 
         if detector_status["calibrated"]:
             # Draw L and R labels for eyes
-            left_center = np.mean(
-                [
-                    (face_landmarks.landmark[idx].x * w, face_landmarks.landmark[idx].y * h)
-                    for idx in self.blink_detector.LEFT_EYE_KEY
-                ],
-                axis=0,
-            )
-            right_center = np.mean(
-                [
-                    (face_landmarks.landmark[idx].x * w, face_landmarks.landmark[idx].y * h)
-                    for idx in self.blink_detector.RIGHT_EYE_KEY
-                ],
-                axis=0,
-            )
-
-            # Draw labels
-            cv2.putText(
-                frame,
-                "L",
-                (int(left_center[0]) - 10, int(left_center[1]) - 20),
-                cv2.FONT_HERSHEY_SIMPLEX,
-                0.6,
-                (255, 255, 255),
-                2,
-            )
-            cv2.putText(
-                frame,
-                "R",
-                (int(right_center[0]) - 10, int(right_center[1]) - 20),
-                cv2.FONT_HERSHEY_SIMPLEX,
-                0.6,
-                (255, 255, 255),
-                2,
-            )
+            for label, points in (("L", eye_points[:6]), ("R", eye_points[6:])):
+                center = points.mean(axis=0)
+                cv2.putText(
+                    frame,
+                    label,
+                    (int(center[0] - 10 * scale), int(center[1] - 20 * scale)),
+                    cv2.FONT_HERSHEY_SIMPLEX,
+                    0.6 * scale,
+                    (255, 255, 255),
+                    thickness,
+                    cv2.LINE_AA,
+                )
 
             # Draw glasses indicator if detected
             if detector_status.get("glasses_mode", False):
-                cv2.putText(frame, "GLASSES", (10, 30), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 255, 255), 2)
+                cv2.putText(
+                    frame,
+                    "GLASSES",
+                    (int(10 * scale), int(30 * scale)),
+                    cv2.FONT_HERSHEY_SIMPLEX,
+                    0.5 * scale,
+                    (255, 255, 0),
+                    thickness,
+                    cv2.LINE_AA,
+                )
         else:
             # Show calibration status
             progress = detector_status.get("calibration_progress", 0)
-            cv2.putText(frame, f"CALIBRATING {progress:.0%}", (10, 30), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 0), 2)
+            cv2.putText(
+                frame,
+                f"CALIBRATING {progress:.0%}",
+                (int(10 * scale), int(30 * scale)),
+                cv2.FONT_HERSHEY_SIMPLEX,
+                0.5 * scale,
+                (0, 255, 255),
+                thickness,
+                cv2.LINE_AA,
+            )
 
     def _draw_blink_feedback(self):
         """Draw visual feedback when blinks are detected."""
@@ -559,6 +576,24 @@ class BlinkyBirdScreen(BaseScreen):
             f"Glasses Mode: {detector_status.get('glasses_mode', False)}",
         ]
 
+        # Eye aspect ratios from blink detection's last Face Mesh pass
+        cached = self.detector_snapshot.get_cached_eyes(self.current_frame_sequence, max_age=1)
+        if cached is not None:
+            left_ear, right_ear = cached[1]
+            debug_texts.append(f"EAR L/R: {left_ear:.3f} / {right_ear:.3f}")
+
+        # Blink input latency (capture to handled), against the previous draw-then-update path
+        if self.blink_latency_ms:
+            latency = np.median(self.blink_latency_ms)
+            draw_path_latency = np.median(self.draw_path_latency_ms)
+            debug_texts.extend(
+                [
+                    f"Blink Latency: {latency:.0f}ms (was {draw_path_latency:.0f}ms)",
+                    f"Latency Saved: {draw_path_latency - latency:.0f}ms",
+                    f"Detection: {np.median(self.detection_ms):.1f}ms/frame",
+                ]
+            )
+
         # Next pipe info
         if "next_pipe" in game_info:
             pipe_info = game_info["next_pipe"]
@@ -623,7 +658,6 @@ class BlinkyBirdScreen(BaseScreen):
     def reset_game(self):
         """Reset the game to initial state."""
         self.game.reset_game()
-        self.blink_detector.reset_counters()
-        self.blink_detector.reset_tracking()  # Clear any stuck tracking state!
+        self.blink_worker.reset_detector()  # Clears counters and any stuck tracking state
         self.calibration_start_time = None
         self.paused = False
@@ -108,7 +108,7 @@ class CapybaraHuntScreen(BaseScreen):
 
     def _reset_crosshair_pos(self):
         """Callback to reset crosshair position"""
-        self.crosshair_pos = None
+        self._clear_crosshair()
 
     def update(self, dt: float, current_time: int) -> Optional[str]:
         """Update game state"""
@@ -161,7 +161,7 @@ class CapybaraHuntScreen(BaseScreen):
                 self.capybara_manager.start_next_round()
                 self.hand_tracker.reset_tracking_state()
                 self.shoot_pos = None
-                self.crosshair_pos = None
+                self._clear_crosshair()
                 self.ui_manager.reset_buttons()
                 return None
             elif action == "retry":
@@ -170,7 +170,7 @@ class CapybaraHuntScreen(BaseScreen):
                 self.capybara_manager.reset_game()
                 self.hand_tracker.reset_tracking_state()
                 self.shoot_pos = None
-                self.crosshair_pos = None
+                self._clear_crosshair()
                 self.ui_manager.reset_buttons()
                 return None
             elif action == "menu":
@@ -364,8 +364,8 @@ class CapybaraHuntScreen(BaseScreen):
             self.ui_manager.draw_game_over_buttons(self.screen, self.crosshair_pos)
 
             # Draw crosshair for button shooting
-            if self.crosshair_pos:
-                self.renderer.draw_crosshair(self.screen, self.crosshair_pos, self.crosshair_color)
+            if self.crosshair_draw_pos:
+                self.renderer.draw_crosshair(self.screen, self.crosshair_draw_pos, self.crosshair_color)
             self.draw_camera_with_tracking(CAMERA_X, CAMERA_Y, CAMERA_WIDTH, CAMERA_HEIGHT)
             return
 
@@ -388,14 +388,14 @@ class CapybaraHuntScreen(BaseScreen):
             self.ui_manager.draw_continue_button(self.screen, self.crosshair_pos)
 
             # Draw crosshair for button shooting
-            if self.crosshair_pos:
-                self.renderer.draw_crosshair(self.screen, self.crosshair_pos, self.crosshair_color)
+            if self.crosshair_draw_pos:
+                self.renderer.draw_crosshair(self.screen, self.crosshair_draw_pos, self.crosshair_color)
             self.draw_camera_with_tracking(CAMERA_X, CAMERA_Y, CAMERA_WIDTH, CAMERA_HEIGHT)
             return
 
         # Draw crosshair
-        if self.crosshair_pos:
-            self.renderer.draw_crosshair(self.screen, self.crosshair_pos, self.crosshair_color)
+        if self.crosshair_draw_pos:
+            self.renderer.draw_crosshair(self.screen, self.crosshair_draw_pos, self.crosshair_color)
 
         # Draw shooting animation
         current_time = pygame.time.get_ticks()
@@ -244,7 +244,7 @@ class DoomsdayScreen(BaseScreen):
             self.stage_manager,
             self.enemy_manager,
             self,
-            self.crosshair_pos,
+            self.crosshair_draw_pos,
             self.crosshair_color,
             self.shoot_pos,
             self.shoot_animation_time,
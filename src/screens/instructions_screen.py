@@ -118,8 +118,8 @@ class InstructionsScreen(BaseScreen):
         self.back_button.draw(self.screen)
 
         # Draw crosshair if aiming
-        if self.crosshair_pos:
-            self.draw_crosshair(self.crosshair_pos, self.crosshair_color)
+        if self.crosshair_draw_pos:
+            self.draw_crosshair(self.crosshair_draw_pos, self.crosshair_color)
 
         # Draw shooting animation (using base class method)
         self.draw_shoot_animation()
@@ -390,8 +390,8 @@ class MenuScreen(BaseScreen):
         self._draw_pond_buddy()
 
         # Draw crosshair if aiming
-        if self.crosshair_pos:
-            self.draw_crosshair(self.crosshair_pos, self.crosshair_color)
+        if self.crosshair_draw_pos:
+            self.draw_crosshair(self.crosshair_draw_pos, self.crosshair_color)
 
         # Draw shooting animation
         self.draw_shoot_animation()
@@ -83,7 +83,25 @@ class SettingsScreen(BaseScreen):
             self.button_font,
         )
 
-        # Camera selection buttons
+        button_height = 40
+        start_x = 300
+        start_y = 300
+
+        # Test camera button
+        self.test_button = Button(start_x + 150, start_y + 150, 150, button_height, "TEST CAMERA", self.button_font)
+
+        self.apply_button = Button(start_x, start_y + 150, 100, button_height, "APPLY", self.button_font)
+
+        # Rescan cameras button
+        self.refresh_button = Button(start_x + 320, start_y + 150, 130, button_height, "REFRESH", self.button_font)
+
+        # Debug mode toggle button
+        self.debug_button = Button(start_x, start_y + 220, 200, button_height, "DEBUG MODE", self.button_font)
+
+        self._create_camera_buttons()
+
+    def _create_camera_buttons(self) -> None:
+        """Create one button per available camera"""
         button_width = 80
         button_height = 40
         start_x = 300
@@ -92,6 +110,7 @@ class SettingsScreen(BaseScreen):
 
         self.camera_buttons = []
         available_cameras = self.camera_manager.get_available_cameras()
+        self.camera_scan_generation = self.camera_manager.scan_generation
 
         for i, camera_id in enumerate(available_cameras):
             x = start_x + (i % 5) * spacing
@@ -101,18 +120,10 @@ class SettingsScreen(BaseScreen):
             button.camera_id = camera_id
             self.camera_buttons.append(button)
 
-        # Test camera button
-        self.test_button = Button(start_x + 150, start_y + 150, 150, button_height, "TEST CAMERA", self.button_font)
-
-        self.apply_button = Button(start_x, start_y + 150, 100, button_height, "APPLY", self.button_font)
-
-        # Debug mode toggle button
-        self.debug_button = Button(start_x, start_y + 220, 200, button_height, "DEBUG MODE", self.button_font)
-
         self.all_buttons = (
             [self.back_button, self.camera_view_button, self.volume_view_button, self.credits_button]
             + self.camera_buttons
-            + [self.test_button, self.apply_button, self.debug_button]
+            + [self.test_button, self.apply_button, self.refresh_button, self.debug_button]
         )
 
     def handle_event(self, event: pygame.event.Event) -> Optional[str]:
@@ -130,6 +141,8 @@ class SettingsScreen(BaseScreen):
                     self._test_camera()
                 elif button == self.apply_button:
                     self._apply_settings()
+                elif button == self.refresh_button:
+                    self._refresh_cameras()
                 elif button == self.debug_button:
                     self._toggle_debug_mode()
                 elif button == self.volume_view_button:
@@ -147,6 +160,11 @@ class SettingsScreen(BaseScreen):
 
         return None
 
+    def _refresh_cameras(self) -> None:
+        """Rescan for cameras; the buttons are rebuilt when the scan finishes"""
+        print("Rescanning cameras...")
+        self.camera_manager.refresh_cameras()
+
     def _test_camera(self) -> None:
         """Test the selected camera"""
         if self.selected_camera != self.camera_manager.camera_id:
@@ -228,6 +246,10 @@ class SettingsScreen(BaseScreen):
         # Process hand tracking
         self.process_finger_gun_tracking()
 
+        # Pick up the result of a background camera scan
+        if self.camera_manager.scan_generation != self.camera_scan_generation:
+            self._create_camera_buttons()
+
         buttons_to_check = self.all_buttons.copy()
         if self.current_view == "volume":
             buttons_to_check.extend(self.volume_bar)
@@ -245,6 +267,8 @@ class SettingsScreen(BaseScreen):
                 self._test_camera()
             elif shot_button == self.apply_button:
                 self._apply_settings()
+            elif shot_button == self.refresh_button:
+                self._refresh_cameras()
             elif shot_button == self.debug_button:
                 self._toggle_debug_mode()
             elif shot_button == self.volume_view_button:
@@ -292,6 +316,13 @@ class SettingsScreen(BaseScreen):
         selected_surface = self.info_font.render(selected_text, True, selected_color)
         self.screen.blit(selected_surface, (200, 260))
 
+        capture_surface = self.info_font.render(self._format_capture_info(camera_info), True, GRAY)
+        self.screen.blit(capture_surface, (200, 280))
+
+        if self.camera_manager.is_scanning():
+            scanning_surface = self.info_font.render("Scanning for cameras...", True, VAPORWAVE_CYAN)
+            self.screen.blit(scanning_surface, (450, 260))
+
         # Draw view switcher buttons first
         view_buttons = [self.camera_view_button, self.volume_view_button, self.credits_button]
         self.update_button_finger_states(view_buttons)
@@ -307,7 +338,11 @@ class SettingsScreen(BaseScreen):
             button.draw(self.screen)
 
         # Draw camera-specific buttons
-        buttons_to_show = [self.back_button] + self.camera_buttons + [self.test_button, self.apply_button, self.debug_button]
+        buttons_to_show = (
+            [self.back_button]
+            + self.camera_buttons
+            + [self.test_button, self.apply_button, self.refresh_button, self.debug_button]
+        )
         self.update_button_finger_states(buttons_to_show)
 
         for button in buttons_to_show:
@@ -332,9 +367,14 @@ class SettingsScreen(BaseScreen):
         status_text = self.button_font.render(f"Debug: {debug_status}", True, debug_color)
         self.screen.blit(status_text, (self.debug_button.rect.x + 220, self.debug_button.rect.y + 5))
 
+        for i, model_line in enumerate(self._format_model_info()):
+            model_surface = self.info_font.render(model_line, True, GRAY)
+            self.screen.blit(model_surface, (200, self.debug_button.rect.bottom + 20 + i * 20))
+
         # Draw instructions
         instructions = [
             "Select a camera and click TEST to preview",
+            "Click REFRESH to rescan for cameras",
             "Click APPLY to save changes",
             "Press ESC or BACK to return to menu",
         ]
@@ -343,6 +383,40 @@ class SettingsScreen(BaseScreen):
             text_surface = self.info_font.render(instruction, True, GRAY)
             self.screen.blit(text_surface, (200, SCREEN_HEIGHT - 100 + i * 25))
 
+    def _format_capture_info(self, camera_info: dict) -> str:
+        """Describe the negotiated capture profile and the frame rate actually delivered"""
+        profile = camera_info.get("capture_profile")
+        delivered = f"{camera_info['delivered_fps']:.0f} fps, jitter {camera_info['frame_jitter_ms']:.1f} ms"
+        if profile is None:
+            return f"Source: {camera_info['source']} - {delivered}"
+        return (
+            f"Capture: {profile['profile']} ({profile.get('fourcc', '?')}, buffer {profile.get('buffer_size', '?')}) - "
+            f"measured {profile['measured_fps']:.0f} fps, now {delivered}"
+        )
+
+    def _format_model_info(self) -> list:
+        """Describe the hand model in use, how it was chosen, and its live inference time"""
+        model_info = self.vision_service.get_model_info()
+        if model_info is None:
+            return ["Hand model: calibrating..."] if self.vision_service.inference_worker else []
+
+        calibration = model_info["calibration"]
+        if calibration is None:
+            lines = [f"Hand model: {model_info['name']} (fixed)"]
+        else:
+            timings = ", ".join(f"{name} {ms:.1f}ms" for name, ms in calibration["timings_ms"].items())
+            lines = [f"Hand model: {model_info['name']} (calibrated {timings}; budget {calibration['budget_ms']:.0f}ms)"]
+
+        live_text = ""
+        stats = getattr(self, "last_tracking_stats", None)
+        if stats and stats.get("detection_ms"):
+            live_text = f"Live inference: {stats['detection_ms']:.1f}ms"
+        if calibration and "downgraded_from" in calibration:
+            live_text += f" - downgraded after averaging {calibration['live_ms']:.1f}ms"
+        if live_text:
+            lines.append(live_text.lstrip(" -"))
+        return lines
+
     def _draw_volume_view(self) -> None:
         """Draw the volume configuration view"""
         # Draw view switcher buttons first
@@ -414,8 +488,8 @@ class SettingsScreen(BaseScreen):
 
     def _draw_common_elements(self) -> None:
         """Draw elements common to all views"""
-        if self.crosshair_pos:
-            self.draw_crosshair(self.crosshair_pos, self.crosshair_color)
+        if self.crosshair_draw_pos:
+            self.draw_crosshair(self.crosshair_draw_pos, self.crosshair_color)
 
         # Draw shooting animation
         self.draw_shoot_animation()
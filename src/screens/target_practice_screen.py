@@ -80,7 +80,7 @@ class TargetPracticeScreen(BaseScreen):
         self.target_manager.clear_all_targets()
         self.hand_tracker.reset_tracking_state()
         self.shoot_pos = None
-        self.crosshair_pos = None
+        self._clear_crosshair()
 
     def update(self, dt: float, current_time: int) -> Optional[str]:
         """Update game state"""
@@ -136,8 +136,8 @@ class TargetPracticeScreen(BaseScreen):
 
         self.target_manager.draw(self.screen)
 
-        if self.crosshair_pos:
-            self.draw_crosshair(self.crosshair_pos, self.crosshair_color)
+        if self.crosshair_draw_pos:
+            self.draw_crosshair(self.crosshair_draw_pos, self.crosshair_color)
 
         current_time = pygame.time.get_ticks()
         if self.shoot_pos and current_time - self.shoot_animation_time < self.shoot_animation_duration:
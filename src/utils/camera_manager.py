@@ -3,55 +3,233 @@ Camera management utilities
 """
 
 # Standard library imports
-from typing import List, Optional, Tuple
+import glob
+import os
+import re
+import struct
+import sys
+import threading
+import time
+from collections import deque
+from typing import Callable, List, Optional, Tuple
 
 # Third-party imports
 import cv2
 import numpy as np
 import pygame
 
+# Local application imports
+from utils.capture_negotiation import negotiate_capture_profile, summarize_frame_intervals
+from utils.disk_cache import load_cache, save_cache
+from utils.frame_sources import create_frame_source, get_frame_source_config
+from utils.preview_renderer import PreviewRenderer
+
+CAMERA_CACHE_NAME = "cameras"
+CAPTURE_STOP_TIMEOUT = 1.0  # Seconds to wait for the capture thread to leave grab() and exit
+
+# V4L2 VIDIOC_QUERYCAP ioctl: _IOR('V', 0, struct v4l2_capability), a 104 byte struct of
+# driver[16], card[32], bus_info[32], version, capabilities, device_caps, reserved[3]
+VIDIOC_QUERYCAP = 0x80685600
+V4L2_CAPABILITY_SIZE = 104
+V4L2_CAP_VIDEO_CAPTURE = 0x00000001
+V4L2_CAP_VIDEO_CAPTURE_MPLANE = 0x00001000
+V4L2_CAP_DEVICE_CAPS = 0x80000000
+
+
+def _is_v4l2_capture_device(index: int) -> bool:
+    """Check whether /dev/video<index> can capture video (metadata nodes cannot)"""
+    try:
+        # Standard library imports
+        import fcntl
+
+        fd = os.open(f"/dev/video{index}", os.O_RDONLY | os.O_NONBLOCK)
+        try:
+            buffer = bytearray(V4L2_CAPABILITY_SIZE)
+            fcntl.ioctl(fd, VIDIOC_QUERYCAP, buffer)
+        finally:
+            os.close(fd)
+    except (ImportError, OSError):
+        # No access to the device node: fall back to sysfs, where index 0 is the
+        # capture interface of a device and higher indices are metadata nodes
+        try:
+            with open(f"/sys/class/video4linux/video{index}/index", "r") as f:
+                return f.read().strip() == "0"
+        except OSError:
+            return True
+
+    capabilities, device_caps = struct.unpack_from("=II", buffer, 84)
+    if capabilities & V4L2_CAP_DEVICE_CAPS:
+        capabilities = device_caps
+    return bool(capabilities & (V4L2_CAP_VIDEO_CAPTURE | V4L2_CAP_VIDEO_CAPTURE_MPLANE))
+
+
+def list_camera_candidates() -> Optional[List[int]]:
+    """List camera indices worth probing, or None if the platform cannot enumerate devices
+
+    On Linux this lists /dev/video* nodes from sysfs that report V4L2 capture capability.
+    """
+    if not sys.platform.startswith("linux"):
+        return None
+
+    indices = []
+    for path in glob.glob("/sys/class/video4linux/video*"):
+        match = re.fullmatch(r"video(\d+)", os.path.basename(path))
+        if match:
+            indices.append(int(match.group(1)))
+    return [index for index in sorted(indices) if _is_v4l2_capture_device(index)]
+
 
 class CameraManager:
     """Manages camera operations and device detection"""
 
-    def __init__(self):
+    def __init__(self, threaded_capture: bool = False, source: Optional[str] = None, source_speed: Optional[str] = None):
+        """
+        Args:
+            threaded_capture: Capture on a background thread (see read_rgb_frame)
+            source: "camera", "synthetic", "synthetic_face" or a video file path; defaults to the configured
+                frame source (ARCVDE_FRAME_SOURCE or FRAME_SOURCE)
+            source_speed: "native" or "max" playback for non-camera sources
+        """
+        configured_source, configured_speed = get_frame_source_config()
+        self.source = source or configured_source
+        self.source_speed = source_speed or configured_speed
+
         self.current_camera = None
         self.camera_id = 0
         self.available_cameras = []
         self.frame_width = 640
         self.frame_height = 480
-        self._scan_cameras()
+
+        # Background capture: a dedicated thread keeps the newest frame in a
+        # lock-protected slot so read_rgb_frame() never blocks the render loop
+        self.threaded_capture = threaded_capture
+        self._capture_thread = None
+        self._capture_running = False
+        self._frame_lock = threading.Lock()
+        self._frame_ready = threading.Condition(self._frame_lock)  # Notified for every published frame
+        self._latest_frame = None
+        self._latest_sequence = 0
+        self._latest_timestamp = 0.0
+        self._latest_consumed = True
+
+        # Sequence number and capture timestamp of the frame last returned by read_rgb_frame()
+        self.last_read_sequence = 0
+        self.last_read_timestamp = 0.0
+
+        # Frame delivery counters
+        self.frames_captured = 0
+        self.frames_dropped = 0  # Captured but overwritten before anyone read them
+        self.frames_duplicated = 0  # Reads that returned a frame the same consumer already had
+        self._consumer_sequences = {}  # Sequence last returned to each read_rgb_frame consumer
+        self._capture_timestamps = deque(maxlen=90)  # For the live delivered FPS and jitter
+
+        # Capture profile chosen for the current camera (pixel format, FPS, buffer size
+        # and its measured frame rate and jitter); None for non-camera sources
+        self.capture_profile = None
+
+        # Optional shared-memory ring that every captured frame is also written to
+        # (used to feed the out-of-process inference worker)
+        self.frame_ring = None
+        self._ring_lock = threading.Lock()
+
+        # Preview renderers keyed by output size (preallocated buffers and surface)
+        self._preview_renderers = {}
+
+        # Camera enumeration runs in the background; the result is cached on disk so
+        # later launches start with the previous list and skip probing entirely
+        self._scan_thread = None
+        self._device_lock = threading.Lock()  # Keeps probes from racing initialize_camera
+        self.scan_finished = threading.Event()  # Set whenever a scan completes
+        self.scan_generation = 0  # Incremented each time available_cameras is replaced
+
+        cache = load_cache(CAMERA_CACHE_NAME)
+        if self.source != "camera":
+            # Recordings and synthetic frames have nothing to enumerate
+            self.available_cameras = [0]
+            self.scan_finished.set()
+        elif cache and cache.get("candidates") == list_camera_candidates() and cache.get("available_cameras"):
+            self.available_cameras = cache["available_cameras"]
+            self.scan_finished.set()
+        else:
+            self.available_cameras = [0]  # Fallback until the scan finishes
+            self.refresh_cameras()
+
+    def refresh_cameras(self) -> None:
+        """Rescan for cameras in the background (scan_finished is set when done)"""
+        if self.source != "camera":
+            return
+        if self._scan_thread is not None and self._scan_thread.is_alive():
+            return
+        self.scan_finished.clear()
+        self._scan_thread = threading.Thread(target=self._scan_cameras, name="CameraScan", daemon=True)
+        self._scan_thread.start()
+
+    def is_scanning(self) -> bool:
+        """Whether a camera scan is in progress"""
+        return not self.scan_finished.is_set()
 
     def _scan_cameras(self) -> None:
         """Scan for available cameras"""
-        self.available_cameras = []
+        start_time = time.time()
+        candidates = list_camera_candidates()
+        available_cameras = []
 
-        # Test up to 10 camera indices
-        for i in range(10):
-            cap = cv2.VideoCapture(i)
-            if cap.isOpened():
-                ret, _ = cap.read()
-                if ret:
-                    self.available_cameras.append(i)
-                cap.release()
-            else:
-                # If we can't open the camera, we've likely reached the end
-                if i > 2:  # Allow for some gaps in low indices
+        if candidates is None:
+            # Test up to 10 camera indices
+            for i in range(10):
+                if self._probe_camera(i):
+                    available_cameras.append(i)
+                elif i > 2:  # Allow for some gaps in low indices
+                    # If we can't open the camera, we've likely reached the end
                     break
+        else:
+            available_cameras = [i for i in candidates if self._probe_camera(i)]
+
+        if not available_cameras:
+            available_cameras = [0]  # Fallback
+        else:
+            save_cache(CAMERA_CACHE_NAME, {"candidates": candidates, "available_cameras": available_cameras})
+
+        self.available_cameras = available_cameras
+        self.scan_generation += 1
+        self.scan_finished.set()
+        print(f"Camera scan found {available_cameras} in {time.time() - start_time:.2f}s")
 
-        if not self.available_cameras:
-            self.available_cameras = [0]  # Fallback
+    def _probe_camera(self, camera_id: int) -> bool:
+        """Check that a camera opens and delivers a frame"""
+        with self._device_lock:
+            if camera_id == self.camera_id and self.current_camera is not None and self.current_camera.isOpened():
+                return True  # Already in use by us; opening it again may fail
+
+            cap = cv2.VideoCapture(camera_id)
+            try:
+                if not cap.isOpened():
+                    return False
+                ret, _ = cap.read()
+                return ret
+            finally:
+                cap.release()
 
     def get_available_cameras(self) -> List[int]:
-        """Get list of available camera IDs"""
-        return self.available_cameras.copy()
+        """Get list of available camera IDs (cached; see scan_finished for fresh results)"""
+        return list(self.available_cameras)
 
     def initialize_camera(self, camera_id: int = 0) -> bool:
         """Initialize camera with given ID"""
+        with self._device_lock:
+            return self._open_camera(camera_id)
+
+    def _open_camera(self, camera_id: int) -> bool:
+        """Open the camera and start capturing (caller holds the device lock)"""
+        if not self._stop_capture_thread():
+            # Releasing the source under a grab() in progress can crash the driver; the
+            # thread exits once grab() returns, and the next open can go ahead then
+            print("Camera capture thread is still blocked in grab(); not reopening the camera")
+            return False
         if self.current_camera:
             self.current_camera.release()
 
-        self.current_camera = cv2.VideoCapture(camera_id)
+        self.current_camera = create_frame_source(camera_id, self.source, self.source_speed)
 
         if not self.current_camera.isOpened():
             return False
@@ -60,40 +238,201 @@ class CameraManager:
         self.current_camera.set(cv2.CAP_PROP_FRAME_WIDTH, self.frame_width)
         self.current_camera.set(cv2.CAP_PROP_FRAME_HEIGHT, self.frame_height)
 
+        # Pick the lowest-latency pixel format, frame rate and buffer size for webcams
+        self.capture_profile = None
+        if self.current_camera.kind == "camera":
+            self.capture_profile = negotiate_capture_profile(
+                self.current_camera,
+                self.frame_width,
+                self.frame_height,
+                cache_key=f"camera{camera_id}@{self.frame_width}x{self.frame_height}",
+            )
+
         # Update actual dimensions
         self.frame_width = int(self.current_camera.get(cv2.CAP_PROP_FRAME_WIDTH))
         self.frame_height = int(self.current_camera.get(cv2.CAP_PROP_FRAME_HEIGHT))
 
         self.camera_id = camera_id
+        self._reset_frame_slot()
+
+        if self.threaded_capture:
+            self._start_capture_thread()
         return True
 
-    def read_frame(self) -> Tuple[bool, Optional[np.ndarray]]:
-        """Read a frame from the current camera"""
+    def _reset_frame_slot(self) -> None:
+        """Clear the latest-frame slot and delivery counters (sequence numbers keep counting)"""
+        with self._frame_lock:
+            self._latest_frame = None
+            self._latest_consumed = True
+            self.frames_captured = 0
+            self.frames_dropped = 0
+            self.frames_duplicated = 0
+            self._consumer_sequences.clear()
+            self._capture_timestamps.clear()
+
+    def _start_capture_thread(self) -> None:
+        """Start the background capture thread for the current camera"""
+        self._capture_running = True
+        self._capture_thread = threading.Thread(target=self._capture_loop, name="CameraCapture", daemon=True)
+        self._capture_thread.start()
+
+    def _stop_capture_thread(self) -> bool:
+        """Stop the background capture thread and wait for it to exit
+
+        Returns False if it is still running after CAPTURE_STOP_TIMEOUT (blocked in grab());
+        it keeps its reference so a later call can wait for it again, and the camera must
+        not be released or the frame slot reset until it has exited.
+        """
+        self._capture_running = False
+        if self._capture_thread is not None:
+            self._capture_thread.join(timeout=CAPTURE_STOP_TIMEOUT)
+            if self._capture_thread.is_alive():
+                return False
+            self._capture_thread = None
+        return True
+
+    def _capture_loop(self) -> None:
+        """Continuously grab, convert and publish the newest camera frame"""
+        camera = self.current_camera
+        while self._capture_running and camera is not None:
+            # grab() returns as soon as the driver hands over a frame, so timestamp
+            # before the (comparatively slow) decode in retrieve()
+            if not camera.grab():
+                time.sleep(0.005)
+                continue
+            timestamp = time.perf_counter()
+            ret, frame = camera.retrieve()
+            if not ret or frame is None:
+                continue
+
+            self._publish_frame(self._to_shared_rgb(frame), timestamp)
+
+    @staticmethod
+    def _to_shared_rgb(frame: np.ndarray) -> np.ndarray:
+        """Convert a freshly decoded BGR frame to RGB in place and make it read-only
+
+        This is the only colour conversion a frame goes through: MediaPipe and the preview
+        both consume the RGB frame. The image is not mirrored; trackers mirror landmark x
+        coordinates instead, and the preview mirrors the copy it draws overlays on.
+        """
+        cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=frame)
+        frame.flags.writeable = False  # Shared with the tracker, worker ring and preview
+        return frame
+
+    def _publish_frame(self, frame: np.ndarray, timestamp: float) -> None:
+        """Store a new frame in the latest-frame slot"""
+        with self._frame_lock:
+            if not self._latest_consumed:
+                self.frames_dropped += 1
+            self._latest_frame = frame
+            self._latest_sequence += 1
+            self._latest_timestamp = timestamp
+            self._latest_consumed = False
+            self.frames_captured += 1
+            self._capture_timestamps.append(timestamp)
+            sequence = self._latest_sequence
+            self._frame_ready.notify_all()
+
+        with self._ring_lock:
+            if self.frame_ring is not None:
+                self.frame_ring.write(frame, sequence, timestamp)
+
+    def attach_frame_ring(self, frame_ring) -> None:
+        """Also publish every captured frame to a shared-memory frame ring (None to detach)
+
+        Once this returns with None, no write to the previous ring is in progress and it
+        can safely be closed.
+        """
+        with self._ring_lock:
+            self.frame_ring = frame_ring
+
+    def read_rgb_frame(self, consumer: str = "default") -> Tuple[bool, Optional[np.ndarray]]:
+        """Read the newest frame as a read-only, unmirrored RGB array
+
+        In threaded mode this returns the newest captured frame immediately; check
+        last_read_sequence to tell whether it is the same frame as the previous read.
+        The array is shared with every other reader, so copy it before drawing on it.
+
+        Args:
+            consumer: Name of the reader; a read only counts as duplicated when the same
+                consumer already had this frame, so several readers of one frame do not
+        """
         if not self.current_camera:
             return False, None
 
+        if self._capture_thread is not None:
+            with self._frame_lock:
+                if self._latest_frame is None:
+                    return False, None
+                if self._consumer_sequences.get(consumer) == self._latest_sequence:
+                    self.frames_duplicated += 1
+                self._consumer_sequences[consumer] = self._latest_sequence
+                self._latest_consumed = True
+                self.last_read_sequence = self._latest_sequence
+                self.last_read_timestamp = self._latest_timestamp
+                return True, self._latest_frame
+
         ret, frame = self.current_camera.read()
-        if ret:
-            frame = cv2.flip(frame, 1)  # Mirror the image
+        if not ret or frame is None:
+            return False, None
+        frame = self._to_shared_rgb(frame)
+        self._publish_frame(frame, time.perf_counter())
+        self._latest_consumed = True
+        self.last_read_sequence = self._latest_sequence
+        self.last_read_timestamp = self._latest_timestamp
+        return True, frame
 
-        return ret, frame
+    def wait_for_frame(self, after_sequence: int, timeout: float = 0.1) -> Optional[Tuple[int, float, np.ndarray]]:
+        """Block until a frame newer than after_sequence is captured (threaded capture only)
 
-    def frame_to_pygame_surface(self, frame: np.ndarray, size: Tuple[int, int]) -> pygame.Surface:
-        """Convert OpenCV frame to pygame surface"""
-        if frame is None:
-            # Create a black surface if no frame
-            surface = pygame.Surface(size)
-            surface.fill((0, 0, 0))
-            return surface
+        For consumer threads that process every frame as it arrives. Unlike read_rgb_frame
+        this leaves the render loop's read bookkeeping (last_read_sequence, dropped and
+        duplicated counts) alone. The frame is the same read-only, unmirrored RGB array.
 
-        # Resize frame
-        resized_frame = cv2.resize(frame, size)
+        Returns:
+            (sequence, capture_timestamp, frame), or None on timeout
+        """
+        with self._frame_ready:
+            if not self._frame_ready.wait_for(
+                lambda: self._latest_frame is not None and self._latest_sequence > after_sequence, timeout
+            ):
+                return None
+            return self._latest_sequence, self._latest_timestamp, self._latest_frame
+
+    def read_frame(self, consumer: str = "default") -> Tuple[bool, Optional[np.ndarray]]:
+        """Read the newest frame as a mirrored BGR image the caller may modify
+
+        Costs a colour conversion and a flip per call; hand tracking uses read_rgb_frame.
+        consumer is passed on to read_rgb_frame.
+        """
+        ret, frame = self.read_rgb_frame(consumer)
+        if not ret:
+            return False, None
+        frame = cv2.cvtColor(frame, cv2.COLOR_RGB2BGR)
+        cv2.flip(frame, 1, dst=frame)  # Mirror the image
+        return True, frame
 
-        # Convert BGR to RGB and create pygame surface
-        rgb_frame = cv2.cvtColor(resized_frame, cv2.COLOR_BGR2RGB)
-        surface = pygame.surfarray.make_surface(rgb_frame.swapaxes(0, 1))
+    def frame_to_pygame_surface(
+        self,
+        frame: np.ndarray,
+        size: Tuple[int, int],
+        rgb: bool = False,
+        mirror: bool = False,
+        overlay: Optional[Callable[[np.ndarray], None]] = None,
+    ) -> pygame.Surface:
+        """Convert OpenCV frame to pygame surface
 
-        return surface
+        The surface is owned by a per-size PreviewRenderer and reused by the next call with
+        the same size, so blit it before converting another frame. Pass rgb=True for frames
+        that are already RGB (the hand tracking preview) to skip the colour conversion, and
+        mirror=True to flip an unmirrored frame at preview size. overlay is called with the
+        preview pixels after the resize to draw tracking overlays at preview resolution.
+        """
+        renderer = self._preview_renderers.get(size)
+        if renderer is None:
+            renderer = PreviewRenderer(size)
+            self._preview_renderers[size] = renderer
+        return renderer.render(frame, rgb, mirror, overlay)
 
     def switch_camera(self, camera_id: int) -> bool:
         """Switch to a different camera"""
@@ -103,15 +442,31 @@ class CameraManager:
 
     def get_camera_info(self) -> dict:
         """Get current camera information"""
+        with self._frame_lock:
+            delivery = summarize_frame_intervals(list(self._capture_timestamps))
         return {
             "current_id": self.camera_id,
             "available_cameras": self.available_cameras,
+            "scanning": self.is_scanning(),
             "resolution": (self.frame_width, self.frame_height),
             "is_open": self.current_camera.isOpened() if self.current_camera else False,
+            "source": self.current_camera.describe() if self.current_camera else self.source,
+            "capture_mode": "threaded" if self._capture_thread is not None else "synchronous",
+            "frame_sequence": self._latest_sequence,
+            "frames_captured": self.frames_captured,
+            "frames_dropped": self.frames_dropped,
+            "frames_duplicated": self.frames_duplicated,
+            "capture_profile": self.capture_profile,
+            "delivered_fps": delivery["measured_fps"],  # Over the last few seconds of capture
+            "frame_jitter_ms": delivery["jitter_ms"],
         }
 
     def release(self) -> None:
         """Release camera resources"""
+        if not self._stop_capture_thread():
+            # Left open rather than released under a grab() in progress
+            print("Camera capture thread is still blocked in grab(); not releasing the camera")
+            return
         if self.current_camera:
             self.current_camera.release()
             self.current_camera = None
@@ -0,0 +1,145 @@
+"""
+Capture profile negotiation for webcams
+
+Many UVC webcams default to uncompressed YUYV at 15-30 FPS with a multi-frame driver
+queue, which adds tens of milliseconds of input lag. The negotiator tries compressed
+MJPG at higher frame rates with the smallest buffer, measures the frame rate and jitter
+each profile really delivers, and keeps the best one.
+"""
+
+# Standard library imports
+import time
+from typing import List, Optional
+
+# Third-party imports
+import cv2
+import numpy as np
+
+# Local application imports
+from utils.disk_cache import load_cache, save_cache
+
+CAPTURE_PROFILE_CACHE_NAME = "capture_profiles"
+
+# Profiles to try, best first. fourcc None leaves the driver's default pixel format.
+CAPTURE_PROFILES = [
+    {"name": "MJPG 60fps", "fourcc": "MJPG", "fps": 60},
+    {"name": "MJPG 30fps", "fourcc": "MJPG", "fps": 30},
+    {"name": "Default 30fps", "fourcc": None, "fps": 30},
+]
+
+MEASURE_WARMUP_FRAMES = 3  # Frames discarded after switching profile
+MEASURE_FRAMES = 15  # Frame intervals measured per profile
+MEASURE_TIMEOUT = 1.0  # Seconds spent measuring a profile at most
+
+
+def _decode_fourcc(value: float) -> str:
+    """Turn a CAP_PROP_FOURCC value into its four-character code"""
+    code = int(value)
+    chars = "".join(chr((code >> (8 * i)) & 0xFF) for i in range(4))
+    return chars if chars.isprintable() and chars.strip() else "?"
+
+
+def apply_capture_profile(capture, profile: dict, width: int, height: int, default_fourcc: float = 0) -> dict:
+    """Configure a capture device for a profile and report what the driver accepted
+
+    default_fourcc is the device's original pixel format, restored for profiles that
+    leave the format to the driver.
+    """
+    if profile["fourcc"]:
+        capture.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*profile["fourcc"]))
+    elif default_fourcc:
+        capture.set(cv2.CAP_PROP_FOURCC, default_fourcc)
+    # Some drivers reset the resolution when the pixel format changes
+    capture.set(cv2.CAP_PROP_FRAME_WIDTH, width)
+    capture.set(cv2.CAP_PROP_FRAME_HEIGHT, height)
+    capture.set(cv2.CAP_PROP_FPS, profile["fps"])
+    capture.set(cv2.CAP_PROP_BUFFERSIZE, 1)  # Keep at most one frame queued in the driver
+
+    return {
+        "profile": profile["name"],
+        "fourcc": _decode_fourcc(capture.get(cv2.CAP_PROP_FOURCC)),
+        "requested_fps": profile["fps"],
+        "reported_fps": capture.get(cv2.CAP_PROP_FPS),
+        "buffer_size": int(capture.get(cv2.CAP_PROP_BUFFERSIZE)),
+    }
+
+
+def measure_capture(capture, frames: int = MEASURE_FRAMES, timeout: float = MEASURE_TIMEOUT) -> dict:
+    """Measure the delivered frame rate and inter-frame jitter of a capture device"""
+    deadline = time.perf_counter() + timeout
+    for _ in range(MEASURE_WARMUP_FRAMES):
+        if not capture.grab() or time.perf_counter() > deadline:
+            break
+
+    timestamps = []
+    while len(timestamps) <= frames and time.perf_counter() < deadline:
+        if capture.grab():
+            timestamps.append(time.perf_counter())
+
+    return summarize_frame_intervals(timestamps)
+
+
+def summarize_frame_intervals(timestamps: List[float]) -> dict:
+    """Compute frame rate and jitter (std of frame intervals) from capture timestamps"""
+    if len(timestamps) < 2:
+        return {"measured_fps": 0.0, "jitter_ms": 0.0}
+    intervals = np.diff(np.asarray(timestamps)) * 1000
+    return {"measured_fps": 1000.0 / intervals.mean(), "jitter_ms": float(intervals.std())}
+
+
+def _is_better(candidate: dict, best: Optional[dict]) -> bool:
+    """Prefer the higher frame rate; within 10% of each other prefer lower jitter"""
+    if best is None:
+        return True
+    if candidate["measured_fps"] > best["measured_fps"] * 1.1:
+        return True
+    if candidate["measured_fps"] < best["measured_fps"] * 0.9:
+        return False
+    return candidate["jitter_ms"] < best["jitter_ms"]
+
+
+def negotiate_capture_profile(capture, width: int, height: int, cache_key: Optional[str] = None) -> dict:
+    """Pick the capture profile that delivers frames fastest and most evenly
+
+    The winner is cached under cache_key; later calls re-apply it and only re-measure
+    it, negotiating from scratch if it no longer delivers what it did before.
+    """
+    cache = load_cache(CAPTURE_PROFILE_CACHE_NAME) or {}
+    cached = cache.get(cache_key) if cache_key else None
+    profiles_by_name = {profile["name"]: profile for profile in CAPTURE_PROFILES}
+    default_fourcc = capture.get(cv2.CAP_PROP_FOURCC)
+
+    if cached and cached.get("profile") in profiles_by_name:
+        result = apply_capture_profile(capture, profiles_by_name[cached["profile"]], width, height, default_fourcc)
+        result.update(measure_capture(capture, frames=8))
+        if result["measured_fps"] >= cached["measured_fps"] * 0.7:
+            result["negotiated"] = False  # Reused from cache
+            return result
+
+    best = None
+    applied = None
+    for profile in CAPTURE_PROFILES:
+        result = apply_capture_profile(capture, profile, width, height, default_fourcc)
+        applied = profile["name"]
+        if profile["fourcc"] and result["fourcc"] != profile["fourcc"]:
+            continue  # Driver refused the pixel format
+        result.update(measure_capture(capture))
+        print(
+            f"Capture profile {profile['name']}: {result['measured_fps']:.1f} fps measured, "
+            f"jitter {result['jitter_ms']:.1f} ms, buffer {result['buffer_size']}"
+        )
+        if _is_better(result, best):
+            best = result
+
+    if best is None:
+        return {"profile": "unknown", "measured_fps": 0.0, "jitter_ms": 0.0, "negotiated": True}
+
+    # Leave the device in the winning profile
+    if best["profile"] != applied:
+        apply_capture_profile(capture, profiles_by_name[best["profile"]], width, height, default_fourcc)
+    best["negotiated"] = True
+
+    if cache_key:
+        cache[cache_key] = {"profile": best["profile"], "measured_fps": best["measured_fps"]}
+        save_cache(CAPTURE_PROFILE_CACHE_NAME, cache)
+    return best
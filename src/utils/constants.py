@@ -13,6 +13,9 @@ CAMERA_HEIGHT = 240
 CAMERA_X = SCREEN_WIDTH - CAMERA_WIDTH - 20
 CAMERA_Y = 20
 DEFAULT_CAMERA_ID = 0
+FRAME_SOURCE = "camera"  # "camera", "synthetic", "synthetic_face" or a video file path (see utils/frame_sources.py)
+FRAME_SOURCE_SPEED = "native"  # "native" or "max" playback for video and synthetic sources
+USE_INFERENCE_WORKER = True  # Run MediaPipe hand inference in a separate process
 
 # Colors
 WHITE = (255, 255, 255)
@@ -59,6 +62,32 @@ SHOOT_VELOCITY_THRESHOLD = 0.1
 SHOOT_DISTANCE_THRESHOLD = 0.1
 COOLDOWN_DURATION = 0.1  # Reduced - now using thumb reset mechanism instead
 
+# Hand tracking preprocessing
+PREPROCESS_ROI_ONLY = True  # Enhance only around the tracked hand; full frame while searching for it
+PREPROCESS_ROI_MARGIN = 24  # Pixels added around the padded hand box for ROI-only preprocessing
+PREPROCESS_ADAPTIVE = True  # Pick none/gamma/clahe/full preprocessing per frame from scene brightness and contrast
+PREPROCESS_BUDGET_MS = 10.0  # Preprocessing time per frame above which cheaper tiers are forced (None: no budget)
+DETECTION_WIDTH = 480  # Width frames are downscaled to for preprocessing and MediaPipe (None: camera resolution)
+MODEL_COMPLEXITY = None  # MediaPipe Hands model: 0 (lite), 1 (full), or None to calibrate per machine
+MODEL_COMPLEXITY_BUDGET_MS = 22.0  # MediaPipe time per frame the calibrated model must fit (with preprocessing, 30 FPS)
+
+# Inference frame skipping (runs MediaPipe on every Nth frame while the hand is steady)
+INFERENCE_SKIP = True  # Fill frames between inferences with Kalman predictions while tracking is stable
+INFERENCE_SKIP_STRIDE = 3  # Infer every Nth frame while the hand is steady (1: every frame)
+INFERENCE_SKIP_MIN_CONFIDENCE = 0.7  # Kalman tracking confidence needed before frames are skipped
+INFERENCE_SKIP_MAX_THUMB_SPEED = SHOOT_VELOCITY_THRESHOLD * 0.5  # Faster vertical thumb motion: infer every frame
+INFERENCE_SKIP_MAX_HAND_SPEED = 0.15  # Fastest landmark speed (frame sizes per second) that counts as steady
+INFERENCE_SKIP_MOTION_THRESHOLD = 12.0  # Luma change in the hand region that ends a skip early
+
+# Crosshair prediction (compensates motion-to-photon latency)
+CROSSHAIR_PREDICTION = True  # Extrapolate the crosshair to the expected display time every render frame
+CROSSHAIR_LOOKAHEAD_MS = 16.0  # Time from the tracking update to the flip that shows it (one frame at 60 FPS)
+CROSSHAIR_MAX_EXTRAPOLATION_MS = 150.0  # Never extrapolate further than this past a vision sample
+CROSSHAIR_MAX_LEAD_PX = 60  # Overshoot clamp: furthest the prediction may lead the last sample
+
+# Blink detection (Blinky Bird)
+BLINK_REFINE_LANDMARKS = False  # Face Mesh's iris/attention model; EAR only reads the eyelid contour
+
 # Game states
 GAME_STATE_LOADING = "loading"
 GAME_STATE_MENU = "menu"
@@ -0,0 +1,121 @@
+"""
+Latency-compensated crosshair prediction
+
+Vision samples arrive at camera rate and describe where the fingertip was when the frame
+was captured, tens of milliseconds before the display flip that shows them. Each sample
+comes with the fingertip velocity from the hand tracker's Kalman filter state, and every
+render frame the predictor extrapolates the newest sample to the expected flip time, so
+the crosshair moves at render rate instead of stepping at camera rate. The lead is
+clamped so a hand that stops suddenly does not overshoot far.
+
+When a new sample arrives, the prediction from it rarely lands where the crosshair was
+drawn. Instead of jumping, the drawn position blends from the last drawn position to the
+new prediction over one sample interval.
+
+The predicted position is for drawing only; shots and button hit-tests use the measured
+sample position.
+"""
+
+# Standard library imports
+import math
+import time
+from typing import Optional, Tuple
+
+# Local application imports
+from utils.constants import (
+    CROSSHAIR_LOOKAHEAD_MS,
+    CROSSHAIR_MAX_EXTRAPOLATION_MS,
+    CROSSHAIR_MAX_LEAD_PX,
+    SCREEN_HEIGHT,
+    SCREEN_WIDTH,
+)
+
+MAX_SAMPLE_GAP = 0.2  # Seconds between samples beyond which the velocity is not trusted
+DEFAULT_SAMPLE_INTERVAL = 1.0 / 30  # Blend duration until two samples give the camera's interval
+
+
+class CrosshairPredictor:
+    """Extrapolates the crosshair from the newest vision sample to the display time"""
+
+    def __init__(
+        self,
+        lookahead_ms: float = CROSSHAIR_LOOKAHEAD_MS,
+        max_extrapolation_ms: float = CROSSHAIR_MAX_EXTRAPOLATION_MS,
+        max_lead_px: float = CROSSHAIR_MAX_LEAD_PX,
+        bounds: Tuple[int, int] = (SCREEN_WIDTH, SCREEN_HEIGHT),
+    ):
+        self.lookahead = lookahead_ms / 1000.0
+        self.max_extrapolation = max_extrapolation_ms / 1000.0
+        self.max_lead_px = max_lead_px
+        self.bounds = bounds
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget all samples (hand lost); the next sample is shown where it is"""
+        self._sample: Optional[Tuple[float, float]] = None
+        self._sample_time = 0.0
+        self._velocity = (0.0, 0.0)
+        self._sample_interval = DEFAULT_SAMPLE_INTERVAL
+        self._drawn: Optional[Tuple[float, float]] = None  # Last position predict() returned
+        self._blend_pending = False  # A new sample arrived; the next predict() starts a blend
+        self._blend_offset = (0.0, 0.0)  # Drawn minus predicted position when the blend started
+        self._blend_start = 0.0
+        self.lead_px = 0.0  # Distance the last prediction led its sample, for the debug overlay
+
+    def add_sample(
+        self, position: Tuple[float, float], capture_timestamp: float, velocity: Optional[Tuple[float, float]] = None
+    ) -> None:
+        """Feed a new vision sample
+
+        Args:
+            position: Screen position of the fingertip in the captured frame
+            capture_timestamp: time.perf_counter() when the frame was captured
+            velocity: Fingertip velocity in screen pixels per second from the Kalman filter
+                state; None (no filter) shows the sample without extrapolating
+        """
+        gap = capture_timestamp - self._sample_time
+        if self._sample is not None and 0 < gap < MAX_SAMPLE_GAP:
+            self._sample_interval = gap
+        self._sample = (float(position[0]), float(position[1]))
+        self._sample_time = capture_timestamp
+        self._velocity = (float(velocity[0]), float(velocity[1])) if velocity is not None else (0.0, 0.0)
+        self._blend_pending = self._drawn is not None
+
+    def _extrapolate(self, now: float) -> Tuple[float, float]:
+        """Newest sample moved on to the flip after now, with the lead clamped"""
+        horizon = min(max(now + self.lookahead - self._sample_time, 0.0), self.max_extrapolation)
+        lead_x = self._velocity[0] * horizon
+        lead_y = self._velocity[1] * horizon
+        lead = math.hypot(lead_x, lead_y)
+        if lead > self.max_lead_px:
+            lead_x *= self.max_lead_px / lead
+            lead_y *= self.max_lead_px / lead
+            lead = self.max_lead_px
+        self.lead_px = lead
+        return self._sample[0] + lead_x, self._sample[1] + lead_y
+
+    def predict(self, now: Optional[float] = None) -> Optional[Tuple[int, int]]:
+        """Crosshair position to draw at the next display flip, or None without a sample
+
+        Args:
+            now: Current time.perf_counter(); taken from the clock when None
+        """
+        if self._sample is None:
+            return None
+        if now is None:
+            now = time.perf_counter()
+
+        x, y = self._extrapolate(now)
+        if self._blend_pending:
+            # Start from where the crosshair was drawn and close the gap over one sample interval
+            self._blend_offset = (self._drawn[0] - x, self._drawn[1] - y)
+            self._blend_start = now
+            self._blend_pending = False
+        remaining = 1.0 - min((now - self._blend_start) / self._sample_interval, 1.0)
+        x += self._blend_offset[0] * remaining
+        y += self._blend_offset[1] * remaining
+
+        x = min(max(x, 0.0), self.bounds[0] - 1)
+        y = min(max(y, 0.0), self.bounds[1] - 1)
+        self._drawn = (x, y)
+        return int(x), int(y)
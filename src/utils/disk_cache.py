@@ -0,0 +1,49 @@
+"""
+Small JSON cache on disk for results that are slow to compute at startup
+"""
+
+# Standard library imports
+import json
+import os
+from typing import Any, Optional
+
+CACHE_DIR_NAME = "arcvde"
+
+
+def get_cache_dir() -> str:
+    """Get the per-user cache directory for the game"""
+    if os.name == "nt":
+        base = os.environ.get("LOCALAPPDATA") or os.path.expanduser("~")
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, CACHE_DIR_NAME)
+
+
+def load_cache(name: str) -> Optional[Any]:
+    """Load a cached value, or None if it is missing or unreadable"""
+    path = os.path.join(get_cache_dir(), f"{name}.json")
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        print(f"Ignoring unreadable cache {path}: {e}")
+        return None
+
+
+def save_cache(name: str, data: Any) -> bool:
+    """Store a JSON-serialisable value in the cache; returns False if it could not be written"""
+    cache_dir = get_cache_dir()
+    path = os.path.join(cache_dir, f"{name}.json")
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        # Write to a temporary file first so a crash never leaves a half-written cache
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, path)
+        return True
+    except OSError as e:
+        print(f"Could not write cache {path}: {e}")
+        return False
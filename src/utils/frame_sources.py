@@ -0,0 +1,365 @@
+"""
+Frame sources: live cameras, recorded video files and procedurally generated frames
+
+Every source exposes the subset of the cv2.VideoCapture interface that CameraManager
+uses (isOpened, grab, retrieve, read, set, get, release), so the rest of the game runs
+unchanged on a recording or on synthetic frames, e.g. on a headless build machine.
+
+The source is selected with the ARCVDE_FRAME_SOURCE environment variable, falling back to
+FRAME_SOURCE in utils.constants:
+    camera            live camera (default)
+    synthetic         procedurally generated frames (a hand)
+    synthetic_face    procedurally generated frames (a blinking face)
+    <path to video>   recorded video file
+ARCVDE_FRAME_SOURCE_SPEED (or FRAME_SOURCE_SPEED) chooses "native" playback at the
+recording's frame rate or "max" to deliver frames as fast as they are read.
+"""
+
+# Standard library imports
+import bisect
+import math
+import os
+import time
+from typing import List, Optional, Tuple
+
+# Third-party imports
+import cv2
+import numpy as np
+
+# Local application imports
+from utils.constants import FRAME_SOURCE, FRAME_SOURCE_SPEED
+
+FRAME_SOURCE_ENV = "ARCVDE_FRAME_SOURCE"
+FRAME_SOURCE_SPEED_ENV = "ARCVDE_FRAME_SOURCE_SPEED"
+
+SPEED_NATIVE = "native"
+SPEED_MAX = "max"
+
+
+class FrameSource:
+    """Base class for anything CameraManager can capture frames from"""
+
+    kind = "unknown"  # "camera", "video" or "synthetic"
+
+    def isOpened(self) -> bool:
+        raise NotImplementedError
+
+    def grab(self) -> bool:
+        """Advance to the next frame (blocks until it is due for paced sources)"""
+        raise NotImplementedError
+
+    def retrieve(self) -> Tuple[bool, Optional[np.ndarray]]:
+        """Decode the frame selected by the last grab()"""
+        raise NotImplementedError
+
+    def read(self) -> Tuple[bool, Optional[np.ndarray]]:
+        """grab() followed by retrieve()"""
+        if not self.grab():
+            return False, None
+        return self.retrieve()
+
+    def set(self, prop_id: int, value: float) -> bool:
+        return False
+
+    def get(self, prop_id: int) -> float:
+        return 0.0
+
+    def release(self) -> None:
+        pass
+
+    def describe(self) -> str:
+        """Short human-readable description for debug output"""
+        return self.kind
+
+
+class CameraSource(FrameSource):
+    """A live camera device"""
+
+    kind = "camera"
+
+    def __init__(self, camera_id: int):
+        self.camera_id = camera_id
+        self.capture = cv2.VideoCapture(camera_id)
+
+    def isOpened(self) -> bool:
+        return self.capture.isOpened()
+
+    def grab(self) -> bool:
+        return self.capture.grab()
+
+    def retrieve(self) -> Tuple[bool, Optional[np.ndarray]]:
+        return self.capture.retrieve()
+
+    def read(self) -> Tuple[bool, Optional[np.ndarray]]:
+        return self.capture.read()
+
+    def set(self, prop_id: int, value: float) -> bool:
+        return self.capture.set(prop_id, value)
+
+    def get(self, prop_id: int) -> float:
+        return self.capture.get(prop_id)
+
+    def release(self) -> None:
+        self.capture.release()
+
+    def describe(self) -> str:
+        return f"camera {self.camera_id}"
+
+
+class _PacedSource(FrameSource):
+    """Shared frame pacing for sources that are not driven by hardware"""
+
+    def __init__(self, fps: float, speed: str):
+        self.fps = fps if fps and fps > 0 else 30.0
+        self.speed = speed
+        self._next_frame_time = None
+
+    def _wait_for_next_frame(self) -> None:
+        """Sleep until the next frame is due when playing at native speed"""
+        if self.speed != SPEED_NATIVE:
+            return
+        now = time.perf_counter()
+        if self._next_frame_time is None or now - self._next_frame_time > 1.0:
+            self._next_frame_time = now  # First frame, or we fell far behind: resync
+        elif self._next_frame_time > now:
+            time.sleep(self._next_frame_time - now)
+        self._next_frame_time += 1.0 / self.fps
+
+
+class VideoFileSource(_PacedSource):
+    """A recorded video file, looped, played at its native frame rate or as fast as possible"""
+
+    kind = "video"
+
+    def __init__(self, path: str, speed: str = SPEED_NATIVE, loop: bool = True):
+        self.path = path
+        self.loop = loop
+        self.capture = cv2.VideoCapture(path)
+        super().__init__(self.capture.get(cv2.CAP_PROP_FPS), speed)
+
+    def isOpened(self) -> bool:
+        return self.capture.isOpened()
+
+    def grab(self) -> bool:
+        self._wait_for_next_frame()
+        if self.capture.grab():
+            return True
+        if not self.loop:
+            return False
+        # End of file: rewind and carry on
+        self.capture.set(cv2.CAP_PROP_POS_FRAMES, 0)
+        return self.capture.grab()
+
+    def retrieve(self) -> Tuple[bool, Optional[np.ndarray]]:
+        return self.capture.retrieve()
+
+    def get(self, prop_id: int) -> float:
+        return self.capture.get(prop_id)
+
+    def release(self) -> None:
+        self.capture.release()
+
+    def describe(self) -> str:
+        return f"video {os.path.basename(self.path)} ({self.speed})"
+
+
+class SyntheticSource(_PacedSource):
+    """Deterministic procedurally generated frames
+
+    Draws a skin-toned hand shape moving along a Lissajous path over a fixed noisy
+    background. Frame n is always identical for a given size, so runs are repeatable.
+    """
+
+    kind = "synthetic"
+
+    def __init__(self, width: int = 640, height: int = 480, fps: float = 30.0, speed: str = SPEED_NATIVE, seed: int = 0):
+        super().__init__(fps, speed)
+        self.width = width
+        self.height = height
+        self.seed = seed
+        self.frame_index = -1
+        self._opened = True
+        self._build_background()
+
+    def _build_background(self) -> None:
+        """Render the static background once (vertical gradient plus sensor-like noise)"""
+        rng = np.random.default_rng(self.seed)
+        gradient = np.linspace(60, 140, self.height, dtype=np.float32)[:, None, None]
+        background = np.repeat(np.repeat(gradient, self.width, axis=1), 3, axis=2)
+        background += rng.normal(0, 6, background.shape).astype(np.float32)
+        self._background = np.clip(background, 0, 255).astype(np.uint8)
+
+    def isOpened(self) -> bool:
+        return self._opened
+
+    def grab(self) -> bool:
+        if not self._opened:
+            return False
+        self._wait_for_next_frame()
+        self.frame_index += 1
+        return True
+
+    def retrieve(self) -> Tuple[bool, Optional[np.ndarray]]:
+        if not self._opened or self.frame_index < 0:
+            return False, None
+        return True, self.render_frame(self.frame_index)
+
+    def render_frame(self, index: int) -> np.ndarray:
+        """Render frame number index"""
+        frame = self._background.copy()
+        t = index / self.fps
+        scale = min(self.width, self.height) / 480.0
+        center_x = int(self.width * (0.5 + 0.3 * math.sin(t * 0.9)))
+        center_y = int(self.height * (0.55 + 0.2 * math.sin(t * 1.3)))
+        skin = (120, 160, 210)  # BGR
+
+        # Palm, pointing index finger and raised thumb
+        palm_w, palm_h = int(55 * scale), int(70 * scale)
+        cv2.ellipse(frame, (center_x, center_y), (palm_w, palm_h), 0, 0, 360, skin, -1)
+        finger_len, finger_w = int(110 * scale), int(14 * scale)
+        cv2.line(frame, (center_x, center_y - palm_h // 2), (center_x, center_y - palm_h // 2 - finger_len), skin, finger_w)
+        thumb_angle = 0.4 + 0.3 * max(0.0, math.sin(t * 4.0))  # Periodic flick
+        thumb_len = int(70 * scale)
+        thumb_tip = (
+            int(center_x - palm_w - thumb_len * math.cos(thumb_angle)),
+            int(center_y - thumb_len * math.sin(thumb_angle)),
+        )
+        cv2.line(frame, (center_x - palm_w // 2, center_y), thumb_tip, skin, finger_w)
+        return frame
+
+    def set(self, prop_id: int, value: float) -> bool:
+        # Accept resolution requests so the stream matches what the game asks for
+        if prop_id == cv2.CAP_PROP_FRAME_WIDTH and int(value) > 0:
+            self.width = int(value)
+        elif prop_id == cv2.CAP_PROP_FRAME_HEIGHT and int(value) > 0:
+            self.height = int(value)
+        else:
+            return False
+        self._build_background()
+        return True
+
+    def get(self, prop_id: int) -> float:
+        if prop_id == cv2.CAP_PROP_FRAME_WIDTH:
+            return float(self.width)
+        if prop_id == cv2.CAP_PROP_FRAME_HEIGHT:
+            return float(self.height)
+        if prop_id == cv2.CAP_PROP_FPS:
+            return float(self.fps)
+        if prop_id == cv2.CAP_PROP_POS_FRAMES:
+            return float(self.frame_index + 1)
+        return 0.0
+
+    def release(self) -> None:
+        self._opened = False
+
+    def describe(self) -> str:
+        return f"synthetic {self.width}x{self.height} ({self.speed})"
+
+
+class SyntheticFaceSource(SyntheticSource):
+    """Deterministic procedurally generated face that blinks
+
+    Draws a cartoon face that Face Mesh tracks, drifting and changing size over the
+    background and blinking at irregular (seeded) intervals, so blink detection can run
+    without a camera. blink_start_frames() gives the frames each blink starts on.
+    """
+
+    BLINK_PROFILE = (0.5, 0.15, 0.15, 0.15, 0.5)  # Eye openness over the frames of a blink
+    BLINK_GAP_RANGE = (30, 76)  # Frames from one blink start to the next (upper bound exclusive)
+    FIRST_BLINK_FRAME = 90  # Leaves the detectors time to calibrate on open eyes
+
+    def __init__(self, width: int = 640, height: int = 480, fps: float = 30.0, speed: str = SPEED_NATIVE, seed: int = 0):
+        super().__init__(width, height, fps, speed, seed)
+        self._blink_gaps = np.random.default_rng(seed).integers(*self.BLINK_GAP_RANGE, 64).tolist()
+        self._blink_starts = [self.FIRST_BLINK_FRAME]
+
+    def blink_start_frames(self, frame_count: int) -> List[int]:
+        """Frames (below frame_count) on which a blink starts"""
+        self._extend_blinks(frame_count)
+        return self._blink_starts[: bisect.bisect_left(self._blink_starts, frame_count)]
+
+    def _extend_blinks(self, frame_count: int) -> None:
+        while self._blink_starts[-1] < frame_count:
+            gap = self._blink_gaps[len(self._blink_starts) % len(self._blink_gaps)]
+            self._blink_starts.append(self._blink_starts[-1] + gap)
+
+    def eye_openness(self, index: int) -> float:
+        """Eye openness on frame index, 1.0 when fully open"""
+        self._extend_blinks(index + 1)
+        start = self._blink_starts[bisect.bisect_right(self._blink_starts, index) - 1]
+        if start <= index < start + len(self.BLINK_PROFILE):
+            return self.BLINK_PROFILE[index - start]
+        return 1.0
+
+    def render_frame(self, index: int) -> np.ndarray:
+        """Render frame number index"""
+        frame = self._background.copy()
+        t = index / self.fps
+        scale = min(self.width, self.height) / 480.0 * (0.9 + 0.1 * math.sin(t * 0.4))
+        center_x = int(self.width * (0.5 + 0.15 * math.sin(t * 0.7)))
+        center_y = int(self.height * (0.5 + 0.06 * math.sin(t * 1.1)))
+        openness = self.eye_openness(index)
+
+        def size(value: float) -> int:
+            return max(int(value * scale), 1)
+
+        # Head and hair (BGR)
+        cv2.ellipse(frame, (center_x, center_y - size(10)), (size(95), size(125)), 0, 0, 360, (140, 170, 215), -1)
+        cv2.ellipse(frame, (center_x, center_y - size(120)), (size(100), size(50)), 0, 180, 360, (30, 30, 40), -1)
+
+        # Brows and eyes
+        for offset in (-40, 40):
+            eye_center = (center_x + int(offset * scale), center_y - size(30))
+            eye_axes = (size(20), size(10 * openness))
+            cv2.ellipse(frame, (eye_center[0], eye_center[1] - size(22)), (size(24), size(6)), 0, 180, 360, (40, 40, 50), -1)
+            cv2.ellipse(frame, eye_center, eye_axes, 0, 0, 360, (245, 245, 245), -1)
+            if openness > 0.3:
+                cv2.circle(frame, eye_center, size(7 * min(openness, 1.0)), (50, 40, 30), -1)
+            cv2.ellipse(frame, eye_center, eye_axes, 0, 0, 360, (60, 60, 80), 1)
+
+        # Nose and mouth
+        nose = np.array(
+            [
+                [center_x, center_y - size(20)],
+                [center_x - size(12), center_y + size(25)],
+                [center_x + size(12), center_y + size(25)],
+            ],
+            dtype=np.int32,
+        )
+        cv2.polylines(frame, [nose], False, (100, 120, 170), 2)
+        cv2.ellipse(frame, (center_x, center_y + size(60)), (size(32), size(10)), 0, 0, 180, (70, 70, 170), -1)
+        return cv2.GaussianBlur(frame, (5, 5), 0)
+
+    def describe(self) -> str:
+        return f"synthetic face {self.width}x{self.height} ({self.speed})"
+
+
+def get_frame_source_config() -> Tuple[str, str]:
+    """Get the configured (source, speed), environment variables taking precedence"""
+    source = os.environ.get(FRAME_SOURCE_ENV) or FRAME_SOURCE
+    speed = (os.environ.get(FRAME_SOURCE_SPEED_ENV) or FRAME_SOURCE_SPEED).lower()
+    if speed not in (SPEED_NATIVE, SPEED_MAX):
+        print(f"Unknown frame source speed '{speed}', using '{SPEED_NATIVE}'")
+        speed = SPEED_NATIVE
+    return source, speed
+
+
+def create_frame_source(camera_id: int = 0, source: Optional[str] = None, speed: Optional[str] = None) -> FrameSource:
+    """Create the configured frame source
+
+    Args:
+        camera_id: Device index used when the source is a live camera
+        source: "camera", "synthetic", "synthetic_face" or a video file path (default: configuration)
+        speed: "native" or "max" for video and synthetic sources (default: configuration)
+    """
+    configured_source, configured_speed = get_frame_source_config()
+    source = source or configured_source
+    speed = speed or configured_speed
+
+    if source == "camera":
+        return CameraSource(camera_id)
+    if source == "synthetic":
+        return SyntheticSource(speed=speed)
+    if source == "synthetic_face":
+        return SyntheticFaceSource(speed=speed)
+    return VideoFileSource(source, speed=speed)
@@ -0,0 +1,119 @@
+"""
+Motion-to-photon latency tracking
+
+Every camera frame carries its capture timestamp (time.perf_counter, taken when the
+driver hands over the frame). As the frame moves through the pipeline each stage records
+how long after capture it finished, so the numbers are cumulative: "display" is the full
+time from the sensor to the frame that shows the result being flipped to the screen.
+"""
+
+# Standard library imports
+import csv
+import time
+from collections import deque
+from typing import Dict, Optional, Tuple
+
+# Third-party imports
+import numpy as np
+
+# Pipeline stages in the order a frame passes through them
+LATENCY_STAGES = (
+    "preprocess",  # Frame preprocessing finished
+    "detect",  # MediaPipe landmarks available
+    "kalman",  # Kalman smoothing applied (landmarks reach the game process)
+    "gesture",  # detect_shooting_gesture evaluated
+    "shot",  # BaseScreen.shoot_detected handed to the game screen
+    "display",  # pygame.display.flip() of the first frame drawn with these landmarks
+    "shot_display",  # pygame.display.flip() of the first frame drawn after a shot
+)
+
+LATENCY_WINDOW = 300  # Samples per stage used for the rolling percentiles
+LATENCY_LOG_SIZE = 50000  # Raw samples kept for CSV export
+
+
+class LatencyTracker:
+    """Collects per-stage latencies relative to each frame's capture timestamp"""
+
+    def __init__(self, window: int = LATENCY_WINDOW, log_size: int = LATENCY_LOG_SIZE):
+        self.samples = {stage: deque(maxlen=window) for stage in LATENCY_STAGES}
+        self.log = deque(maxlen=log_size)  # (capture_timestamp, stage, latency_ms)
+
+        # Frame shown by the screen since the last flip: (capture_timestamp, shot)
+        self._pending_display: Optional[Tuple[float, bool]] = None
+        self._last_displayed_capture = 0.0
+
+    def record(self, stage: str, capture_timestamp: float, finished_at: Optional[float] = None) -> None:
+        """Record that stage finished for the frame captured at capture_timestamp"""
+        if capture_timestamp <= 0:
+            return
+        if finished_at is None:
+            finished_at = time.perf_counter()
+        latency_ms = (finished_at - capture_timestamp) * 1000
+        self.samples[stage].append(latency_ms)
+        self.log.append((capture_timestamp, stage, latency_ms))
+
+    def mark_presented(self, capture_timestamp: float, shot: bool = False) -> None:
+        """Note that the frame being drawn shows results for this capture (see on_display_flip)"""
+        if capture_timestamp <= self._last_displayed_capture:
+            return  # Already on screen; only the first flip showing a frame counts
+        pending_shot = shot or (self._pending_display is not None and self._pending_display[1])
+        self._pending_display = (capture_timestamp, pending_shot)
+
+    def on_display_flip(self) -> None:
+        """Record display latency for the frame presented since the last flip"""
+        if self._pending_display is None:
+            return
+        now = time.perf_counter()
+        capture_timestamp, shot = self._pending_display
+        self.record("display", capture_timestamp, now)
+        if shot:
+            self.record("shot_display", capture_timestamp, now)
+        self._last_displayed_capture = capture_timestamp
+        self._pending_display = None
+
+    def percentiles(self, stage: str) -> Optional[Tuple[float, float, float]]:
+        """Rolling (p50, p95, p99) latency in ms for a stage, or None without samples"""
+        samples = self.samples[stage]
+        if not samples:
+            return None
+        p50, p95, p99 = np.percentile(np.fromiter(samples, dtype=np.float64), [50, 95, 99])
+        return p50, p95, p99
+
+    def summary(self) -> Dict[str, Tuple[float, float, float]]:
+        """Rolling percentiles for every stage that has samples, in pipeline order"""
+        summary = {}
+        for stage in LATENCY_STAGES:
+            values = self.percentiles(stage)
+            if values is not None:
+                summary[stage] = values
+        return summary
+
+    def export_csv(self, path: Optional[str] = None) -> str:
+        """Write every logged sample to a CSV file and return its path"""
+        if path is None:
+            path = time.strftime("latency_%Y%m%d_%H%M%S.csv")
+        with open(path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["capture_timestamp", "stage", "latency_ms"])
+            for capture_timestamp, stage, latency_ms in list(self.log):
+                writer.writerow([f"{capture_timestamp:.6f}", stage, f"{latency_ms:.3f}"])
+        return path
+
+    def reset(self) -> None:
+        """Drop all samples"""
+        for samples in self.samples.values():
+            samples.clear()
+        self.log.clear()
+        self._pending_display = None
+
+
+# Global latency tracker instance
+_latency_tracker = None
+
+
+def get_latency_tracker() -> LatencyTracker:
+    """Get the global latency tracker instance"""
+    global _latency_tracker
+    if _latency_tracker is None:
+        _latency_tracker = LatencyTracker()
+    return _latency_tracker
@@ -0,0 +1,72 @@
+"""
+Allocation-free conversion of camera frames into a pygame surface for the preview
+"""
+
+# Standard library imports
+from typing import Callable, Optional, Tuple
+
+# Third-party imports
+import cv2
+import numpy as np
+import pygame
+
+
+class PreviewRenderer:
+    """Renders camera frames into one persistent pygame surface
+
+    The resize and colour-conversion buffers and the surface are allocated once per
+    preview size; every frame is written into them in place, so the per-frame preview
+    path allocates nothing. The returned surface is overwritten by the next render.
+    """
+
+    def __init__(self, size: Tuple[int, int]):
+        self.size = size
+        width, height = size
+        self._resized = np.empty((height, width, 3), dtype=np.uint8)
+        self._rgb = np.empty((height, width, 3), dtype=np.uint8)
+        # The surface shares its pixels with the RGB buffer, so converting a frame into
+        # the buffer updates the surface without any further copy
+        self.surface = pygame.image.frombuffer(self._rgb, size, "RGB")
+
+    def render(
+        self,
+        frame: Optional[np.ndarray],
+        rgb: bool = False,
+        mirror: bool = False,
+        overlay: Optional[Callable[[np.ndarray], None]] = None,
+    ) -> pygame.Surface:
+        """Draw a BGR frame (RGB with rgb=True; black if frame is None) into the persistent surface
+
+        Args:
+            frame: Camera frame at any resolution
+            rgb: The frame is already RGB
+            mirror: Flip the frame horizontally, after the resize so only preview pixels are touched
+            overlay: Called with the preview's RGB pixels (height, width, 3) to draw on them in
+                place at preview resolution
+        """
+        if frame is None:
+            self._rgb.fill(0)
+        elif rgb and not mirror:
+            # Already in surface order: resize (or copy) straight into the surface buffer
+            if frame.shape[:2] == self._rgb.shape[:2]:
+                np.copyto(self._rgb, frame)
+            else:
+                cv2.resize(frame, self.size, dst=self._rgb)
+        else:
+            if frame.shape[:2] == self._rgb.shape[:2]:
+                source = frame
+            else:
+                cv2.resize(frame, self.size, dst=self._resized)
+                source = self._resized
+
+            if rgb:
+                cv2.flip(source, 1, dst=self._rgb)
+            else:
+                cv2.cvtColor(source, cv2.COLOR_BGR2RGB, dst=self._rgb)
+                if mirror:
+                    cv2.flip(self._rgb, 1, dst=self._resized)
+                    np.copyto(self._rgb, self._resized)
+
+        if overlay is not None:
+            overlay(self._rgb)
+        return self.surface
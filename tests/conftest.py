@@ -0,0 +1,9 @@
+"""
+pytest configuration: makes the game packages under src/ importable from the tests
+"""
+
+# Standard library imports
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(__file__)), "src"))
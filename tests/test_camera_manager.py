@@ -0,0 +1,75 @@
+"""
+Tests for CameraManager's capture thread shutdown (no camera needed)
+"""
+
+# Standard library imports
+import threading
+
+# Third-party imports
+import numpy as np
+
+# Local application imports
+from utils import camera_manager
+from utils.camera_manager import CameraManager
+from utils.frame_sources import FrameSource
+
+
+class BlockingSource(FrameSource):
+    """Frame source whose grab() blocks until unblock is set, like a stalled camera driver"""
+
+    kind = "synthetic"
+
+    def __init__(self):
+        self.unblock = threading.Event()
+        self.in_grab = threading.Event()
+        self.released = False
+
+    def isOpened(self) -> bool:
+        return True
+
+    def grab(self) -> bool:
+        self.in_grab.set()
+        self.unblock.wait()
+        return True
+
+    def retrieve(self):
+        return True, np.zeros((4, 4, 3), dtype=np.uint8)
+
+    def release(self) -> None:
+        self.released = True
+
+
+def test_camera_stays_open_while_capture_thread_is_blocked(monkeypatch):
+    sources = []
+
+    def create_source(*args):
+        sources.append(BlockingSource())
+        return sources[-1]
+
+    monkeypatch.setattr(camera_manager, "create_frame_source", create_source)
+    monkeypatch.setattr(camera_manager, "CAPTURE_STOP_TIMEOUT", 0.05)
+    manager = CameraManager(threaded_capture=True, source="synthetic")
+
+    assert manager.initialize_camera(0)
+    first = sources[0]
+    assert first.in_grab.wait(1.0)
+    blocked_thread = manager._capture_thread
+
+    # Still blocked in grab(): neither the reopen nor release() may pull the source from under it
+    assert not manager.initialize_camera(0)
+    manager.release()
+    assert len(sources) == 1
+    assert not first.released
+    assert manager._capture_thread is blocked_thread
+
+    # Once grab() returns the thread exits, and the camera can be reopened
+    first.unblock.set()
+    blocked_thread.join(1.0)
+    assert manager.initialize_camera(0)
+    assert first.released
+    assert len(sources) == 2
+
+    sources[1].unblock.set()
+    manager.release()
+    assert sources[1].released
+    assert manager._capture_thread is None
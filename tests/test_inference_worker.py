@@ -0,0 +1,173 @@
+"""
+Tests for the inference worker's shared-memory transport (no camera or worker process needed)
+
+Covers the result block's seqlock (a read while the worker is mid-write, retries and the
+last good result fallback), frame ring slot reuse and torn or lapped frames, and that
+closing the owner frees the shared memory so a restart starts from fresh blocks.
+"""
+
+# Standard library imports
+from multiprocessing import shared_memory
+
+# Third-party imports
+import numpy as np
+import pytest
+
+# Local application imports
+from game.cv.finger_gun_detection import inference_worker
+from game.cv.finger_gun_detection.inference_worker import (
+    _RESULT_COUNTER,
+    _RESULT_READ_RETRIES,
+    SharedFrameRing,
+    SharedResultBlock,
+)
+
+FRAME_SHAPE = (4, 6, 3)
+
+
+def hand(value: float) -> np.ndarray:
+    """(21, 3) landmarks all set to value"""
+    return np.full((21, 3), value, dtype=np.float32)
+
+
+def write_result(block: SharedResultBlock, sequence: int, value: float) -> None:
+    block.write(sequence, sequence / 30.0, [hand(value)], 1.0, 2.0, 3.0, preprocess_tier="gamma", model_complexity=0)
+
+
+def frame(value: int) -> np.ndarray:
+    return np.full(FRAME_SHAPE, value, dtype=np.uint8)
+
+
+@pytest.fixture
+def block():
+    block = SharedResultBlock()
+    yield block
+    block.close()
+
+
+@pytest.fixture
+def ring():
+    ring = SharedFrameRing(FRAME_SHAPE, slots=4)
+    yield ring
+    ring.close()
+
+
+def test_result_round_trip(block):
+    write_result(block, 3, 0.25)
+    result = block.read()
+    assert result.frame_sequence == 3
+    assert result.capture_timestamp == pytest.approx(0.1)
+    assert result.landmarks.shape == (1, 21, 3)
+    np.testing.assert_array_equal(result.landmarks[0], hand(0.25))
+    assert result.preprocess_tier == "gamma"
+    assert result.model_complexity == 0
+    assert block.read(newer_than=3) is None
+
+
+def test_read_across_block_handles(block):
+    write_result(block, 5, 0.5)
+    reader = SharedResultBlock(name=block.name)
+    try:
+        assert reader.read().frame_sequence == 5
+    finally:
+        reader.close()
+
+
+def test_torn_read_waits_for_writer(block, monkeypatch):
+    write_result(block, 1, 0.1)
+    block.read()
+
+    # Writer is mid-update: counter odd, landmarks already half overwritten
+    block._meta[_RESULT_COUNTER] += 1
+    block._landmarks[0, :10] = 0.9
+    yields = []
+
+    def finish_write(_):
+        yields.append(True)
+        if len(yields) == 2:
+            block._landmarks[0] = hand(0.9)
+            block._meta[inference_worker._RESULT_FRAME_SEQUENCE] = 2
+            block._meta[_RESULT_COUNTER] += 1
+
+    monkeypatch.setattr(inference_worker.time, "sleep", finish_write)
+    result = block.read()
+    assert len(yields) == 2
+    assert result.frame_sequence == 2
+    np.testing.assert_array_equal(result.landmarks[0], hand(0.9))
+
+
+def test_torn_read_falls_back_to_last_good(block, monkeypatch):
+    write_result(block, 1, 0.1)
+    assert block.read().frame_sequence == 1
+
+    # Worker stuck (or killed) mid-write: every retry sees an odd counter
+    block._meta[_RESULT_COUNTER] += 1
+    block._landmarks[0] = hand(0.9)
+    yields = []
+    monkeypatch.setattr(inference_worker.time, "sleep", lambda _: yields.append(True))
+
+    result = block.read()
+    assert len(yields) == _RESULT_READ_RETRIES
+    assert result.frame_sequence == 1
+    np.testing.assert_array_equal(result.landmarks[0], hand(0.1))
+    # The fallback is only returned while it is newer than what the caller already has
+    assert block.read(newer_than=1) is None
+
+
+def test_torn_read_without_last_good(block, monkeypatch):
+    block._meta[_RESULT_COUNTER] += 1
+    monkeypatch.setattr(inference_worker.time, "sleep", lambda _: None)
+    assert block.read() is None
+
+
+def test_ring_wraps_around(ring):
+    out = np.empty(FRAME_SHAPE, dtype=np.uint8)
+    for sequence in range(1, 11):
+        assert ring.write(frame(sequence), sequence, sequence / 30.0)
+        assert ring.latest_sequence() == sequence
+        assert ring.read_latest(out, sequence - 1) == (sequence, sequence / 30.0)
+        np.testing.assert_array_equal(out, frame(sequence))
+
+    # Ten frames through four slots: only the last four are left, each in its own slot
+    assert sorted(int(sequence) for sequence in ring._meta[:, 0]) == [7, 8, 9, 10]
+    assert ring.read_latest(out, newer_than=10) is None
+
+
+def test_ring_rejects_wrong_shape(ring):
+    assert not ring.write(np.zeros((2, 2, 3), dtype=np.uint8), 1, 0.0)
+    assert ring.latest_sequence() == 0
+
+
+def test_ring_skips_slot_being_written(ring):
+    out = np.empty(FRAME_SHAPE, dtype=np.uint8)
+    for sequence in range(1, 5):
+        ring.write(frame(sequence), sequence, 0.0)
+
+    # Sequence 5 is being written into sequence 1's slot: the newest complete frame is 4
+    ring._meta[5 % ring.slots, 0] = -1
+    assert ring.read_latest(out)[0] == 4
+    np.testing.assert_array_equal(out, frame(4))
+
+
+def test_ring_detects_lapped_read(ring, monkeypatch):
+    out = np.empty(FRAME_SHAPE, dtype=np.uint8)
+    ring.write(frame(1), 1, 0.0)
+    copyto = np.copyto
+
+    def copy_then_lap(dst, src):
+        copyto(dst, src)
+        ring._meta[1 % ring.slots, 0] = -1  # The writer starts reusing the slot mid-copy
+
+    monkeypatch.setattr(inference_worker.np, "copyto", copy_then_lap)
+    assert ring.read_latest(out) is None
+
+
+def test_close_frees_shared_memory():
+    ring = SharedFrameRing(FRAME_SHAPE)
+    block = SharedResultBlock()
+    names = [ring.name, block.name]
+    ring.close()
+    block.close()
+    for name in names:
+        with pytest.raises(FileNotFoundError):
+            shared_memory.SharedMemory(name=name)
@@ -0,0 +1,103 @@
+"""
+Tests for BatchedLandmarkKalmanFilter against its reference, one LandmarkKalmanFilter per landmark
+"""
+
+# Third-party imports
+import numpy as np
+
+# Local application imports
+from game.cv.finger_gun_detection.kalman_tracker import (
+    MAX_DT,
+    MIN_DT,
+    BatchedLandmarkKalmanFilter,
+    LandmarkKalmanFilter,
+    landmark_confidences,
+)
+
+COUNT = 21
+# The reference runs cv2.KalmanFilter in float32
+ATOL = 2e-4
+
+
+def run_both(steps, count: int = COUNT):
+    """Feed steps ("update", measurements, confidences, timestamp), ("predict_only", timestamp) or
+    ("reset",) to both filters, checking they agree after every step"""
+    batched = BatchedLandmarkKalmanFilter(count)
+    reference = [LandmarkKalmanFilter() for _ in range(count)]
+
+    for step in steps:
+        if step[0] == "update":
+            _, measurements, confidences, timestamp = step
+            expected = np.array(
+                [f.update(measurements[i], confidences[i], timestamp) for i, f in enumerate(reference)], dtype=np.float64
+            )
+            actual = batched.update(measurements, confidences, timestamp)
+        elif step[0] == "predict_only":
+            expected = [f.predict_only(step[1]) for f in reference]
+            actual = batched.predict_only(step[1])
+            if actual is None:
+                assert all(position is None for position in expected)
+                continue
+            expected = np.array(expected, dtype=np.float64)
+        else:
+            for f in reference:
+                f.reset()
+            batched.reset()
+            continue
+
+        np.testing.assert_allclose(actual, expected, rtol=0, atol=ATOL)
+        reference_velocity = np.array([f.kalman.statePost[3:].ravel() for f in reference])
+        np.testing.assert_allclose(batched.velocity, reference_velocity, rtol=0, atol=ATOL * 10)
+
+    return batched, reference
+
+
+def hand_sequence(rng, length: int, timestamps):
+    """Update steps for a hand moving smoothly with measurement noise"""
+    start = rng.uniform(0.2, 0.8, (COUNT, 3))
+    velocity = rng.normal(0.0, 0.3, (COUNT, 3))
+    steps = []
+    for index in range(length):
+        timestamp = None if timestamps is None else timestamps[index]
+        elapsed = index * 0.033 if timestamp is None else timestamp - timestamps[0]
+        measurements = start + velocity * elapsed + rng.normal(0.0, 0.004, (COUNT, 3))
+        confidences = landmark_confidences(measurements, rng.uniform(0.3, 1.0))
+        steps.append(("update", measurements, confidences, timestamp))
+    return steps
+
+
+def test_matches_reference_with_fixed_time_step():
+    rng = np.random.default_rng(0)
+    run_both(hand_sequence(rng, 60, None))
+
+
+def test_matches_reference_with_variable_time_steps():
+    rng = np.random.default_rng(1)
+    gaps = rng.uniform(0.01, 0.1, 120)
+    gaps[[10, 50]] = MIN_DT / 5  # Duplicate-ish timestamps: clamped to MIN_DT
+    gaps[[30, 90]] = MAX_DT * 2  # Stalls: clamped to MAX_DT
+    timestamps = 100.0 + np.cumsum(gaps)
+    run_both(hand_sequence(rng, 120, timestamps))
+
+
+def test_matches_reference_through_lost_frames_and_reset():
+    rng = np.random.default_rng(2)
+    timestamps = 5.0 + np.cumsum(rng.uniform(0.02, 0.06, 100))
+    steps = hand_sequence(rng, 100, timestamps)
+
+    # Hand lost for one to three frames (within max_lost_frames): predicted from the velocity
+    for start, length in ((20, 1), (40, 3), (70, 2)):
+        for index in range(start, start + length):
+            steps[index] = ("predict_only", timestamps[index])
+    steps.insert(85, ("reset",))
+    batched, _ = run_both(steps)
+    assert batched.initialized
+
+
+def test_lost_too_long_stops_predicting():
+    rng = np.random.default_rng(3)
+    steps = hand_sequence(rng, 10, None)
+    steps += [("predict_only", None)] * 5
+    batched, reference = run_both(steps)
+    assert not batched.initialized
+    assert not any(f.initialized for f in reference)
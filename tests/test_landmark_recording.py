@@ -0,0 +1,119 @@
+"""
+Tests for landmark recording: delta/keyframe encoding round-trips through decode_landmarks
+"""
+
+# Third-party imports
+import numpy as np
+import pytest
+
+# Local application imports
+from game.cv.finger_gun_detection.landmark_recording import (
+    FLAG_KEYFRAME,
+    KEYFRAME_INTERVAL,
+    LANDMARK_SCALE,
+    LandmarkRecorder,
+    LandmarkRecording,
+)
+
+# Quantization rounds to the nearest step; allow for float32 on top of that
+TOLERANCE = 0.5 / LANDMARK_SCALE + 1e-6
+
+
+def record(path, frames, shots=()):
+    """Record frames ((21, 3) arrays or None) 1/30 s apart and open the recording"""
+    recorder = LandmarkRecorder(str(path), 640, 480)
+    for index, landmarks in enumerate(frames):
+        recorder.record(100.0 + index / 30.0, landmarks, "standard", shot=index in shots)
+    recorder.close()
+    return LandmarkRecording(str(path))
+
+
+def hand_track(frame_count: int, seed: int = 0) -> list:
+    """A hand drifting in small steps, like consecutive camera frames"""
+    rng = np.random.default_rng(seed)
+    start = rng.uniform(0.2, 0.8, (21, 3))
+    steps = rng.normal(0.0, 0.01, (frame_count, 21, 3))
+    return list(start + np.cumsum(steps, axis=0))
+
+
+def assert_round_trip(recording, frames):
+    decoded = recording.decode_landmarks()
+    assert decoded.shape == (len(frames), 21, 3)
+    assert decoded.dtype == np.float32
+    for index, landmarks in enumerate(frames):
+        if landmarks is None:
+            assert not recording.hand_present[index]
+            np.testing.assert_array_equal(decoded[index], 0.0)
+        else:
+            assert recording.hand_present[index]
+            np.testing.assert_allclose(decoded[index], landmarks, rtol=0, atol=TOLERANCE)
+
+
+def test_round_trip_across_keyframes(tmp_path):
+    frames = hand_track(3 * KEYFRAME_INTERVAL + 7)
+    recording = record(tmp_path / "track.lmk", frames)
+    assert_round_trip(recording, frames)
+
+    keyframes = np.flatnonzero(recording.records["flags"] & FLAG_KEYFRAME)
+    np.testing.assert_array_equal(keyframes, np.arange(0, len(frames), KEYFRAME_INTERVAL + 1))
+
+
+def test_round_trip_with_hand_loss(tmp_path):
+    frames = hand_track(80, seed=1)
+    for index in (0, 1, 20, 21, 22, 45, 79):
+        frames[index] = None
+    recording = record(tmp_path / "loss.lmk", frames)
+    assert_round_trip(recording, frames)
+
+    # The frame after a hand loss is a keyframe, so the deltas do not run on from stale values
+    flags = recording.records["flags"]
+    for index in (2, 23, 46):
+        assert flags[index] & FLAG_KEYFRAME
+
+
+def test_round_trip_with_large_jumps(tmp_path):
+    frames = hand_track(40, seed=2)
+    frames[5] = frames[5] + 0.6  # Across the frame: still fits an int16 delta
+    # More than 4 normalized units apart: too far for an int16 delta, in both directions
+    frames[10] = frames[10] - 3.0
+    frames[11] = frames[11] + 1.5
+    frames[25] = frames[25] + 3.0
+    frames[26] = frames[26] - 1.5
+    recording = record(tmp_path / "jumps.lmk", frames)
+    assert_round_trip(recording, frames)
+
+    keyframes = set(np.flatnonzero(recording.records["flags"] & FLAG_KEYFRAME).tolist())
+    assert keyframes == {0, 11, 26}
+
+
+def test_out_of_range_values_saturate(tmp_path):
+    frames = hand_track(3, seed=3)
+    frames[1] = np.full((21, 3), 5.0)
+    frames[2] = np.full((21, 3), -5.0)
+    decoded = record(tmp_path / "range.lmk", frames).decode_landmarks()
+    np.testing.assert_allclose(decoded[1], 32767 / LANDMARK_SCALE)
+    np.testing.assert_allclose(decoded[2], -32768 / LANDMARK_SCALE)
+
+
+def test_frame_metadata(tmp_path):
+    frames = hand_track(5)
+    frames[3] = None
+    recording = record(tmp_path / "meta.lmk", frames, shots={2})
+    assert len(recording) == 5
+    np.testing.assert_allclose(recording.timestamps, np.arange(5) / 30.0, atol=1e-9)
+    np.testing.assert_array_equal(recording.shots, [False, False, True, False, False])
+    assert recording.modes() == ["standard"] * 5
+    assert (recording.frame_width, recording.frame_height) == (640, 480)
+
+
+def test_empty_recording(tmp_path):
+    recording = record(tmp_path / "empty.lmk", [])
+    assert len(recording) == 0
+    assert recording.decode_landmarks().shape == (0, 21, 3)
+
+
+def test_rejects_other_files(tmp_path):
+    path = tmp_path / "other.lmk"
+    path.write_bytes(b'{"format": "something-else"}\n'.ljust(512, b" "))
+    with pytest.raises(ValueError):
+        LandmarkRecording(str(path))